@@ -0,0 +1,101 @@
+"""
+Banner cost benchmark for relm.banner.
+
+Measures, in process, rendering the logo to a truecolor terminal with the
+previous per-character gradient versus the run-merged gradient, and, end to
+end, the wall-clock of `relm list` on an empty directory with the banner
+forced on versus skipped (the default when output is not a terminal, with
+--quiet, or with RELM_NO_BANNER set). Skipping the banner off-TTY is where
+most of the saving comes from; the gradient is blended on every run, as the
+default palette is random.
+
+    python benchmarks/bench_banner.py --repeat 20
+"""
+
+import argparse
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+from rich.console import Console  # noqa: E402
+from rich.text import Text  # noqa: E402
+
+from relm import banner  # noqa: E402
+
+PALETTE = tuple(banner.FIXED_PALETTES[0])
+
+def legacy_render(console, palette):
+    """The previous loop: one blend() and one styled append per character."""
+    H = len(banner.LOGO_LINES)
+    for i, line in enumerate(banner.LOGO_LINES):
+        tline = Text()
+        W = len(line)
+        for j, ch in enumerate(line):
+            raw = (i * 0.72 + j * 0.44)
+            t = raw / (H * 0.72 + W * 0.44)
+            seg = t * (len(palette) - 1)
+            idx = int(seg)
+            t2 = seg - idx
+            c1 = palette[idx]
+            c2 = palette[min(idx + 1, len(palette) - 1)]
+            tline.append(ch, style=banner.blend(c1, c2, t2))
+        console.print(tline)
+
+def render(console, logo):
+    for runs in logo:
+        tline = Text()
+        for text, style in runs:
+            tline.append(text, style=style)
+        console.print(tline)
+
+def terminal():
+    return Console(file=io.StringIO(), force_terminal=True, color_system="truecolor", width=120)
+
+def best_of(repeat, func):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+FORCE_BANNER = (
+    "import sys; from relm import banner, main; "
+    "banner.should_print_logo = lambda quiet=False, stream=None: True; "
+    "sys.argv = ['relm', '--path', sys.argv[1], 'list']; main.main()"
+)
+DEFAULT = "import sys; from relm import main; sys.argv = ['relm', '--path', sys.argv[1], 'list']; main.main()"
+
+def cli(code, path):
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code, path], env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+def report(label, best, median):
+    print(f"{label:<34} best {best * 1000:8.2f} ms   median {median * 1000:8.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    report("render: legacy per-character", *best_of(args.repeat, lambda: legacy_render(terminal(), PALETTE)))
+    report("render: merged runs", *best_of(args.repeat, lambda: render(terminal(), banner.gradient_runs(PALETTE))))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        forced = [cli(FORCE_BANNER, tmp) for _ in range(args.repeat)]
+        skipped = [cli(DEFAULT, tmp) for _ in range(args.repeat)]
+    report("relm list: banner shown", min(forced), statistics.median(forced))
+    report("relm list: banner skipped", min(skipped), statistics.median(skipped))
+
+if __name__ == "__main__":
+    main()
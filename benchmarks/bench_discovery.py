@@ -0,0 +1,100 @@
+"""
+Discovery walker benchmark.
+
+Builds a synthetic workspace of about 50k directories (a few hundred of
+them projects with a pyproject.toml) and compares the os.walk loop that
+find_projects used before, which resolved and relativized every visited
+directory, against relm.discovery.walk_project_dirs (os.scandir, depth
+counted arithmetically, no Path objects until a project is found). Both
+walkers only locate project directories; parsing is not timed.
+
+    python benchmarks/bench_discovery.py --dirs 50000 --depth 6 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from relm.discovery import IGNORE_DIRS, walk_project_dirs  # noqa: E402
+
+def build_tree(root: Path, count: int, depth: int, project_ratio: float, seed: int) -> int:
+    """Creates count directories at most depth levels deep; returns the number of projects."""
+    rng = random.Random(seed)
+    levels = [[root]]
+    projects = 0
+    for i in range(count):
+        # Prefer shallow parents so every level is populated, like packages/*/src/...
+        level = min(int(rng.expovariate(0.8)), depth - 1, len(levels) - 1)
+        parent = rng.choice(levels[level])
+        child = parent / (rng.choice(["node_modules", ".cache", "build"]) if rng.random() < 0.02 else f"d{i}")
+        child.mkdir(exist_ok=True)
+        if level + 1 == len(levels):
+            levels.append([])
+        levels[level + 1].append(child)
+        if rng.random() < project_ratio:
+            (child / "pyproject.toml").write_text(f'[project]\nname = "p{i}"\nversion = "1.0"\n')
+            projects += 1
+        else:
+            (child / "module.py").write_text("")
+    return projects
+
+def legacy_walk(root_path: Path, max_depth: int):
+    """The os.walk loop from find_projects before the scandir walker (recursive mode)."""
+    found = []
+    for root, dirs, files in os.walk(root_path):
+        current_path = Path(root).resolve()
+        try:
+            current_depth = len(current_path.relative_to(root_path).parts)
+        except ValueError:
+            continue
+        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS and not d.startswith(".")]
+        if current_depth >= max_depth:
+            dirs[:] = []
+        if "pyproject.toml" in files:
+            found.append(current_path)
+    return found
+
+def scandir_walk(root_path: Path, max_depth: int):
+    return [Path(directory) for directory, _ in walk_project_dirs(str(root_path), max_depth)]
+
+def best_of(fn, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dirs", type=int, default=50000)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--project-ratio", type=float, default=0.01)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="relm_discovery_bench_")).resolve()
+    try:
+        start = time.perf_counter()
+        projects = build_tree(root, args.dirs, args.depth, args.project_ratio, args.seed)
+        print(f"{args.dirs} directories, {projects} projects, depth {args.depth} (built in {time.perf_counter() - start:.1f}s)")
+
+        legacy_time, legacy = best_of(lambda: legacy_walk(root, args.depth), args.repeat)
+        new_time, new = best_of(lambda: scandir_walk(root, args.depth), args.repeat)
+        assert sorted(legacy) == sorted(new), "walkers disagree"
+
+        print(f"os.walk + resolve  {legacy_time * 1000:8.1f} ms")
+        print(f"scandir walker     {new_time * 1000:8.1f} ms  ({legacy_time / new_time:.1f}x faster, {len(new)} projects)")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
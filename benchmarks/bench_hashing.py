@@ -0,0 +1,82 @@
+"""
+File-tree hashing benchmark for relm.hashing.FileTreeHasher.
+
+Builds a synthetic tree of N small files (100k by default) in a temporary
+directory and times:
+
+  * a cold hash (every file read),
+  * a warm hash with the stat memo loaded from disk (no file reads),
+  * a warm hash after editing a handful of files,
+  * optionally (--git) a hash of the same tree committed to git, where blob
+    ids come straight from `git ls-files -s`.
+
+    python benchmarks/bench_hashing.py --files 100000 --git
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from relm.hashing import FileTreeHasher  # noqa: E402
+
+def make_tree(root, count, per_dir):
+    old = time.time() - 3600
+    for i in range(count):
+        directory = root / "src" / f"d{i // per_dir:05d}"
+        if i % per_dir == 0:
+            directory.mkdir(parents=True)
+        path = directory / f"f{i:06d}.py"
+        path.write_text(f"value = {i}\n")
+        # Outside the racy window, so the memo can record every file
+        os.utime(path, (old, old))
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:8.3f}s  files={result.files:<7} hashed={result.hashed:<7} source={result.source}")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--per-dir", type=int, default=200)
+    parser.add_argument("--touch", type=int, default=100, help="Files edited before the incremental run")
+    parser.add_argument("--git", action="store_true", help="Also commit the tree and time the git index path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        start = time.perf_counter()
+        make_tree(root, args.files, args.per_dir)
+        print(f"created {args.files} files in {time.perf_counter() - start:.1f}s")
+
+        cold = FileTreeHasher(root)
+        timed("cold (no memo)", lambda: cold.hash_tree(root))
+        start = time.perf_counter()
+        cold.save()
+        print(f"{'save memo':<32} {time.perf_counter() - start:8.3f}s  size={cold.memo_path.stat().st_size} bytes")
+
+        timed("warm (memo loaded from disk)", lambda: FileTreeHasher(root).hash_tree(root))
+
+        step = max(1, args.files // max(1, args.touch))
+        for i in range(0, args.files, step)[:args.touch]:
+            (root / "src" / f"d{i // args.per_dir:05d}" / f"f{i:06d}.py").write_text(f"value = -{i}\n")
+        timed(f"incremental ({args.touch} edited)", lambda: FileTreeHasher(root).hash_tree(root))
+
+        if args.git:
+            git = ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com"]
+            (root / ".gitignore").write_text(".relm/\n")
+            subprocess.run(git + ["init", "-q"], cwd=root, check=True)
+            subprocess.run(git + ["add", "."], cwd=root, check=True)
+            subprocess.run(git + ["commit", "-q", "-m", "bench"], cwd=root, check=True)
+            timed("clean git tree (ls-files -s)", lambda: FileTreeHasher().hash_tree(root))
+
+if __name__ == "__main__":
+    main()
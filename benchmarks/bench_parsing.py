@@ -0,0 +1,67 @@
+"""
+Bulk pyproject.toml parsing benchmark.
+
+Writes N project directories whose pyproject.toml carries a large [tool.*]
+section (the part tomllib spends its time on) and times
+relm.core.load_projects on a cold cache, parsing in-process versus in a
+process pool, for a range of file counts. Use it to pick
+[discovery] parse_threshold for a machine.
+
+    python benchmarks/bench_parsing.py --counts 16,32,64,256,1024 --tool-lines 300
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from relm.core import load_projects  # noqa: E402
+
+def write_projects(root: Path, count: int, tool_lines: int):
+    tool = "\n".join(f'rule-{i} = {{ level = "error", paths = ["src/a{i}", "src/b{i}"], enabled = true }}' for i in range(tool_lines))
+    paths = []
+    for i in range(count):
+        path = root / f"p{i}"
+        path.mkdir()
+        (path / "pyproject.toml").write_text(
+            f'[project]\nname = "p{i}"\nversion = "1.0"\ndependencies = ["requests>=2", "p{max(i - 1, 0)}"]\n\n'
+            f"[tool.lint]\n{tool}\n"
+        )
+        paths.append(path)
+    return paths
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", default="16,64,256,1024")
+    parser.add_argument("--tool-lines", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.tool_lines} [tool] lines per file")
+    print(f"{'files':>6} {'serial':>10} {'pool':>10} {'speedup':>8}")
+    for count in (int(c) for c in args.counts.split(",")):
+        root = Path(tempfile.mkdtemp(prefix="relm_parse_bench_"))
+        try:
+            paths = write_projects(root, count, args.tool_lines)
+            serial = best_of(lambda: load_projects(paths, parse_threshold=sys.maxsize), args.repeat)
+            pooled = best_of(lambda: load_projects(paths, parse_threshold=0, jobs=args.jobs), args.repeat)
+            print(f"{count:>6} {serial * 1000:>8.1f}ms {pooled * 1000:>8.1f}ms {serial / pooled:>7.1f}x")
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Scheduler overhead benchmark for relm.runner.execute_in_parallel.
+
+Runs N no-op tasks over a random dependency DAG with the subprocess call
+stubbed out and the live table disabled, so the measured time is pure
+scheduling overhead. For comparison it also runs a copy of the previous
+polling scheduler (which rescanned every project per tick and slept up to
+200ms) on a smaller N, since its cost grows quadratically.
+
+    python benchmarks/bench_scheduler.py --tasks 5000 --legacy-tasks 2000
+"""
+
+import argparse
+import io
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rich.console import Console  # noqa: E402
+
+from relm import runner  # noqa: E402
+from relm.core import Project  # noqa: E402
+
+NOOP_RESULT = {"returncode": 0, "stdout": "", "stderr": ""}
+
+def make_projects(count, max_deps, seed):
+    rng = random.Random(seed)
+    projects = []
+    for i in range(count):
+        deps = [f"p{j}" for j in rng.sample(range(i), min(i, rng.randint(0, max_deps)))] if i else []
+        projects.append(Project(name=f"p{i}", version="1.0", path=Path(f"/p{i}"), dependencies=deps))
+    return projects
+
+def legacy_polling_schedule(projects, max_workers):
+    """The pre-indegree scheduler loop, minus the live display."""
+    project_map = {p.name: p for p in projects}
+    deps = {p.name: [d for d in p.dependencies if d in project_map] for p in projects}
+    submitted, completed, failed = set(), set(), set()
+    lock = threading.Lock()
+
+    def run_task(project):
+        with lock:
+            completed.add(project.name)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running_futures = {}
+        while len(completed | failed) < len(projects):
+            with lock:
+                ready = [
+                    p for p in projects
+                    if p.name not in submitted
+                    and all(d in (completed | failed) for d in deps[p.name])
+                ]
+                slots_available = max_workers - len(running_futures)
+                for p in ready[:slots_available]:
+                    submitted.add(p.name)
+                    running_futures[executor.submit(run_task, p)] = p
+            if running_futures:
+                done, _ = wait(running_futures.keys(), timeout=0.2, return_when=FIRST_COMPLETED)
+                for f in done:
+                    running_futures.pop(f)
+            else:
+                time.sleep(0.1)
+
+class NullLive:
+    """Stands in for rich.live.Live so table rendering is not counted as scheduling."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+def bench_current(projects, max_workers):
+    quiet = Console(file=io.StringIO())
+    with patch.object(runner, "console", quiet), \
+         patch.object(runner, "Live", NullLive), \
+         patch.object(runner, "run_project_command_tail", return_value=NOOP_RESULT):
+        start = time.perf_counter()
+        runner.execute_in_parallel(projects, lambda p: "true", max_workers=max_workers)
+        return time.perf_counter() - start
+
+def bench_legacy(projects, max_workers):
+    start = time.perf_counter()
+    legacy_polling_schedule(projects, max_workers)
+    return time.perf_counter() - start
+
+def report(label, count, elapsed):
+    print(f"{label:<28} {count:>6} tasks  {elapsed:8.3f}s  {elapsed / count * 1e6:10.1f} us/task")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--legacy-tasks", type=int, default=2000, help="0 skips the legacy run")
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--max-deps", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    projects = make_projects(args.tasks, args.max_deps, args.seed)
+    report("indegree scheduler", args.tasks, bench_current(projects, args.jobs))
+
+    if args.legacy_tasks:
+        legacy_projects = make_projects(args.legacy_tasks, args.max_deps, args.seed)
+        report("indegree scheduler", args.legacy_tasks, bench_current(legacy_projects, args.jobs))
+        report("legacy polling scheduler", args.legacy_tasks, bench_legacy(legacy_projects, args.jobs))
+
+if __name__ == "__main__":
+    main()
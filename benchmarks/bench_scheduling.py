@@ -0,0 +1,78 @@
+"""
+Scheduling benchmark for relm.runner.DependencyScheduler.
+
+Generates random dependency graphs with heavy-tailed task durations and
+compares the simulated makespan of starting ready projects in list order
+(the previous behaviour, and today's behaviour without history) against
+longest-critical-path-first ordering driven by known durations. Also reports
+the lower bound max(critical path, total work / workers).
+
+    python benchmarks/bench_scheduling.py --projects 200 --jobs 8 --graphs 50
+"""
+
+import argparse
+import heapq
+import random
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from relm.core import Project  # noqa: E402
+from relm.history import critical_paths  # noqa: E402
+from relm.runner import DependencyScheduler  # noqa: E402
+
+def random_workspace(rng, count, max_deps):
+    projects, durations = [], {}
+    for i in range(count):
+        deps = rng.sample(range(i), min(i, rng.randint(0, max_deps)))
+        projects.append(Project(name=f"p{i}", version="1.0", path=Path(f"/p{i}"), dependencies=[f"p{d}" for d in deps]))
+        # Most suites are short, a few dominate: lognormal seconds
+        durations[f"p{i}"] = rng.lognormvariate(1.0, 1.2)
+    # The input order is alphabetical-ish, as find_projects returns it
+    rng.shuffle(projects)
+    return projects, durations
+
+def simulate_with(durations, jobs, scheduler):
+    """Same loop as relm.runner.simulate_makespan, for any scheduler."""
+    clock, running = 0.0, []
+    while True:
+        while len(running) < jobs:
+            name = scheduler.pop_ready()
+            if name is None and not running:
+                name = scheduler.break_cycle()
+            if name is None:
+                break
+            heapq.heappush(running, (clock + durations[name], name))
+        if not running:
+            return clock
+        clock, name = heapq.heappop(running)
+        scheduler.complete(name)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--max-deps", type=int, default=3)
+    parser.add_argument("--graphs", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    ratios_list, ratios_cp = [], []
+    for _ in range(args.graphs):
+        projects, durations = random_workspace(rng, args.projects, args.max_deps)
+        bound = max(
+            max(critical_paths(DependencyScheduler(projects).dependents, durations).values()),
+            sum(durations.values()) / args.jobs,
+        )
+        ratios_list.append(simulate_with(durations, args.jobs, DependencyScheduler(projects)) / bound)
+        ratios_cp.append(simulate_with(durations, args.jobs, DependencyScheduler(projects, durations)) / bound)
+
+    print(f"{args.graphs} graphs, {args.projects} projects, {args.jobs} workers; makespan / lower bound")
+    for label, ratios in (("list order", ratios_list), ("critical path first", ratios_cp)):
+        print(f"{label:<22} mean {statistics.mean(ratios):.3f}   worst {max(ratios):.3f}")
+
+if __name__ == "__main__":
+    main()
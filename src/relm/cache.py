@@ -0,0 +1,198 @@
+# src/relm/cache.py
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .core import Project
+from .hashing import FileTreeHasher
+from .state import state_dir
+
+CACHE_DIR_NAME = "cache"
+DEFAULT_MAX_SIZE_MB = 256
+# Environment variables that commonly change what a task does.
+DEFAULT_ENV_VARS = ["PYTHONPATH", "VIRTUAL_ENV"]
+
+def cache_enabled(args, config: Dict[str, Any]) -> bool:
+    """True if --cache was passed or [cache] enabled = true is set in .relm.toml."""
+    cache_config = config.get("cache", {}) if isinstance(config, dict) else {}
+    return bool(getattr(args, "cache", False) or cache_config.get("enabled", False))
+
+class TaskCache:
+    """
+    Content-addressed store of task results under .relm/cache/.
+
+    A task key covers the project's input files, the input hashes of every
+    in-workspace dependency (transitively), the command, the working
+    directory and a selected set of environment variables. Entries are
+    evicted least-recently-used first once the cache exceeds max_bytes.
+    """
+
+    def __init__(
+        self,
+        root_path: Path,
+        projects: Iterable[Project] = (),
+        env_vars: Optional[Sequence[str]] = None,
+        max_bytes: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024
+    ):
+        self.root_path = root_path
+        self.directory = state_dir(root_path) / CACHE_DIR_NAME
+        self.project_map = {p.name.lower(): p for p in projects}
+        self.env_vars = list(DEFAULT_ENV_VARS if env_vars is None else env_vars)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._hasher: Optional[FileTreeHasher] = None
+        # Guards the counters, the hasher creation and the memoized hashes:
+        # keys are computed on worker threads of the thread backend
+        self._lock = threading.Lock()
+        self._input_hashes: Dict[str, str] = {}
+        self._tree_hashes: Dict[str, str] = {}
+
+    @classmethod
+    def from_config(cls, root_path: Path, config: Dict[str, Any], projects: Iterable[Project] = ()) -> "TaskCache":
+        """Builds a cache from the [cache] table of .relm.toml."""
+        cache_config = config.get("cache", {}) if isinstance(config, dict) else {}
+        return cls(
+            root_path,
+            projects=projects,
+            env_vars=cache_config.get("env"),
+            max_bytes=int(cache_config.get("max_size_mb", DEFAULT_MAX_SIZE_MB) * 1024 * 1024)
+        )
+
+    @property
+    def hasher(self) -> FileTreeHasher:
+        """The file hash memo, loaded on first use (stats and prune never need it)."""
+        with self._lock:
+            if self._hasher is None:
+                self._hasher = FileTreeHasher(self.root_path)
+            return self._hasher
+
+    def input_hash(self, project: Project) -> str:
+        key = project.name.lower()
+        with self._lock:
+            cached = self._input_hashes.get(key)
+        if cached is not None:
+            return cached
+        # Hashed outside the lock; two threads may both hash a project, with the same result
+        digest = self.hasher.hash_tree(project.path).digest
+        with self._lock:
+            return self._input_hashes.setdefault(key, digest)
+
+    def tree_hash(self, project: Project, _visiting: Optional[set] = None) -> str:
+        """
+        Returns a digest of the project's inputs combined with the tree hashes
+        of its in-workspace dependencies. Cycles are cut at the repeated node.
+        """
+        key = project.name.lower()
+        with self._lock:
+            cached = self._tree_hashes.get(key)
+        if cached is not None:
+            return cached
+
+        visiting = _visiting if _visiting is not None else set()
+        visiting.add(key)
+        h = hashlib.sha256(self.input_hash(project).encode())
+        for dep in sorted({d.lower() for d in project.dependencies}):
+            dep_project = self.project_map.get(dep)
+            if dep_project is None or dep in visiting:
+                continue
+            h.update(dep.encode())
+            h.update(self.tree_hash(dep_project, visiting).encode())
+        visiting.discard(key)
+
+        with self._lock:
+            return self._tree_hashes.setdefault(key, h.hexdigest())
+
+    def key_for(self, project: Project, command: Union[str, List[str]], cwd: Path) -> str:
+        payload = {
+            "project": project.name,
+            "inputs": self.tree_hash(project),
+            "command": command,
+            "cwd": str(cwd),
+            "python": sys.version,
+            "env": {name: os.environ.get(name) for name in self.env_vars},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the stored result for key, marking it as recently used."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, result: Dict[str, Any]):
+        entry = {
+            "returncode": result["returncode"],
+            "stdout": result.get("stdout", ""),
+            "stderr": result.get("stderr", ""),
+            "duration": result.get("duration"),
+            "created": time.time(),
+        }
+        try:
+            state_dir(self.root_path, create=True)
+            self.directory.mkdir(exist_ok=True)
+            tmp_path = self.directory / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError:
+            pass
+
+    def _entries(self) -> List[os.DirEntry]:
+        try:
+            return [e for e in os.scandir(self.directory) if e.name.endswith(".json")]
+        except OSError:
+            return []
+
+    def stats(self) -> Dict[str, int]:
+        entries = self._entries()
+        return {
+            "entries": len(entries),
+            "size_bytes": sum(e.stat().st_size for e in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Evicts least-recently-used entries until the cache fits in max_bytes
+        (defaults to the configured limit). Returns the number of removed entries.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries(), key=lambda e: e.stat().st_mtime)
+        total = sum(e.stat().st_size for e in entries)
+        removed = 0
+        for entry in entries:
+            if total <= limit:
+                break
+            try:
+                size = entry.stat().st_size
+                os.unlink(entry.path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def flush(self) -> int:
+        """Persists the file hash memo (if it was used) and prunes the cache to its size limit."""
+        if self._hasher is not None:
+            self._hasher.save()
+        return self.prune()
@@ -0,0 +1,39 @@
+# src/relm/changes.py
+
+import subprocess
+from typing import List
+
+from .core import Project
+from .git_ops import git_changed_files, group_by_repo
+from .trie import PathTrie
+
+def find_changed_projects(projects: List[Project], ref: str) -> List[Project]:
+    """
+    Returns the projects with changes between ref and HEAD, in input order.
+
+    Runs one `git diff --name-only` per repository instead of one per project
+    and attributes each changed file to every project whose directory contains
+    it. Projects outside git, or in a repository where the diff fails (e.g. an
+    unknown ref), are treated as changed.
+    """
+    changed_names = set()
+    repos, outside = group_by_repo(projects, lambda p: p.path)
+    changed_names.update(p.name for p in outside)
+
+    for repo_root, members in repos.items():
+        try:
+            changed_files = git_changed_files(repo_root, ref)
+        except (subprocess.CalledProcessError, OSError):
+            changed_names.update(p.name for p, _ in members)
+            continue
+
+        trie: PathTrie[str] = PathTrie()
+        for project, parts in members:
+            trie.insert(parts, project.name)
+
+        for changed_file in changed_files:
+            changed_names.update(trie.prefixes(changed_file.split("/")))
+            if len(changed_names) == len(projects):
+                break
+
+    return [p for p in projects if p.name in changed_names]
@@ -0,0 +1,34 @@
+# src/relm/commands/__init__.py
+
+import importlib
+from types import ModuleType
+from typing import Dict, NamedTuple
+
+class CommandSpec(NamedTuple):
+    module: str
+    help: str
+
+# Subcommand name -> module and the one-line help shown by `relm --help`.
+# Modules are only imported when their command is selected, so keep this
+# table in sync with each module's register().
+COMMANDS: Dict[str, CommandSpec] = {
+    "list": CommandSpec("list_command", "List all discovered projects"),
+    "release": CommandSpec("release_command", "Release a new version of a project"),
+    "install": CommandSpec("install_command", "Install projects into the current environment"),
+    "run": CommandSpec("run_command", "Run a shell command across projects"),
+    "status": CommandSpec("status_command", "Check git status of projects"),
+    "verify": CommandSpec("verify_command", "Verify if the local release is available on PyPI"),
+    "clean": CommandSpec("clean_command", "Recursively remove build artifacts (dist/, build/, __pycache__)"),
+    "create": CommandSpec("create_command", "Create a new Python project"),
+    "gc": CommandSpec("gc_command", "Run git gc on project(s)"),
+    "pytest": CommandSpec("pytest_command", "Run pytest across projects and summarize results"),
+    "pipeline": CommandSpec("pipeline_command", "Run a task from [tasks] in .relm.toml with its dependencies"),
+    "index": CommandSpec("index_command", "Manage the on-disk project index (.relm/index)"),
+    "cache": CommandSpec("cache_command", "Inspect or prune the local task result cache"),
+    "hash": CommandSpec("hash_command", "Fingerprint the input files of projects"),
+    "logs": CommandSpec("logs_command", "Show full task output from .relm/logs"),
+}
+
+def load_command(name: str) -> ModuleType:
+    """Imports and returns the module implementing a subcommand."""
+    return importlib.import_module(f".{COMMANDS[name].module}", __name__)
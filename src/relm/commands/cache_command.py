@@ -0,0 +1,29 @@
+import argparse
+from argparse import Namespace, _SubParsersAction
+from pathlib import Path
+from rich.console import Console
+from ..cache import TaskCache
+
+def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
+    """Register the cache command."""
+    cache_parser = subparsers.add_parser("cache", help="Inspect or prune the local task result cache", parents=[base_parser])
+    cache_parser.add_argument("action", choices=["stats", "prune"], help="'stats' shows cache usage, 'prune' evicts least-recently-used entries")
+    cache_parser.add_argument("--all", action="store_true", help="With 'prune', remove every cached result")
+    cache_parser.set_defaults(func=execute)
+
+def _format_size(num_bytes: int) -> str:
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+def execute(args: Namespace, console: Console):
+    """Execute the cache command."""
+    root_path = Path(args.path).resolve()
+    task_cache = TaskCache.from_config(root_path, getattr(args, "config", None) or {})
+
+    if args.action == "stats":
+        stats = task_cache.stats()
+        console.print(f"[bold]Task cache:[/bold] {task_cache.directory}")
+        console.print(f"Entries: [cyan]{stats['entries']}[/cyan]")
+        console.print(f"Size:    [cyan]{_format_size(stats['size_bytes'])}[/cyan] / {_format_size(stats['max_bytes'])}")
+    elif args.action == "prune":
+        removed = task_cache.prune(0 if getattr(args, "all", False) else None)
+        console.print(f"[green]Removed {removed} cached results.[/green]")
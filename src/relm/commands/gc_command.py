@@ -4,7 +4,9 @@ from argparse import Namespace, _SubParsersAction
 from pathlib import Path
 from rich.console import Console
 from ..core import find_projects
+from ..workspace import Workspace
 from ..gc import gc_project
+from ..pool import map_bounded, workers_for
 
 def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
     """Register the gc command."""
@@ -15,14 +17,14 @@ def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser
 def execute(args: Namespace, console: Console):
     """Execute the gc command."""
     root_path = Path(args.path).resolve()
-    all_projects = find_projects(root_path)
+    all_projects = find_projects(root_path, discovery=getattr(args, "discovery", "auto"), use_cache=not getattr(args, "no_index", False))
     target_projects = []
 
     if args.project_name == "all":
         target_projects = all_projects
         console.print(f"[bold]Running git gc for {len(target_projects)} projects...[/bold]")
     else:
-        target = next((p for p in all_projects if p.name == args.project_name), None)
+        target = Workspace.of(all_projects).by_name(args.project_name)
         if not target:
             console.print(f"[red]Project '{args.project_name}' not found in {root_path}[/red]")
             sys.exit(1)
@@ -31,9 +33,22 @@ def execute(args: Namespace, console: Console):
     success_count = 0
     failure_count = 0
 
-    for project in target_projects:
-        console.print(f"Running git gc in [bold]{project.path}[/bold]...")
-        if gc_project(project):
+    max_workers = workers_for(args)
+    if max_workers > 1:
+        # Repositories are independent; results are reported in project order.
+        with console.status(f"[bold green]Running git gc in {len(target_projects)} projects...[/bold green]"):
+            outcomes = map_bounded(gc_project, target_projects, max_workers=max_workers)
+    else:
+        outcomes = None
+
+    for i, project in enumerate(target_projects):
+        if outcomes is None:
+            console.print(f"Running git gc in [bold]{project.path}[/bold]...")
+            succeeded = gc_project(project)
+        else:
+            succeeded = outcomes[i]
+
+        if succeeded:
             console.print(f"[green]Successfully ran git gc for {project.name}[/green]")
             success_count += 1
         else:
@@ -0,0 +1,56 @@
+import argparse
+import sys
+from argparse import Namespace, _SubParsersAction
+from pathlib import Path
+from rich.console import Console
+from rich.table import Table
+from ..core import find_projects
+from ..workspace import Workspace
+from ..hashing import FileTreeHasher
+
+# Enough characters to tell digests apart while the table fits an 80 column terminal
+SHORT_DIGEST = 12
+
+def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
+    """Register the hash command."""
+    hash_parser = subparsers.add_parser("hash", help="Fingerprint the input files of projects", parents=[base_parser])
+    hash_parser.add_argument("project_name", help="Name of the project to hash or 'all'", nargs="?", default="all")
+    hash_parser.add_argument("--full", action="store_true", help=f"Print the full digest instead of the first {SHORT_DIGEST} characters")
+    hash_parser.set_defaults(func=execute)
+
+def execute(args: Namespace, console: Console):
+    """Execute the hash command."""
+    root_path = Path(args.path).resolve()
+    all_projects = find_projects(
+        root_path,
+        recursive=getattr(args, "recursive", False),
+        max_depth=getattr(args, "depth", 2),
+        discovery=getattr(args, "discovery", "auto"),
+        include_root=getattr(args, "include_root", None),
+        use_cache=not getattr(args, "no_index", False)
+    )
+
+    if args.project_name == "all":
+        target_projects = all_projects
+    else:
+        target = Workspace.of(all_projects).by_name(args.project_name)
+        if not target:
+            console.print(f"[red]Project '{args.project_name}' not found in {root_path}[/red]")
+            sys.exit(1)
+        target_projects = [target]
+
+    hasher = FileTreeHasher(root_path)
+    table = Table(title=f"Input Hashes for {len(target_projects)} Projects")
+    table.add_column("Project", style="cyan", no_wrap=True)
+    table.add_column("Digest", style="magenta", no_wrap=True)
+    table.add_column("Files", justify="right")
+    table.add_column("Hashed", justify="right")
+    table.add_column("Source", style="dim")
+
+    for project in target_projects:
+        result = hasher.hash_tree(project.path)
+        digest = result.digest if getattr(args, "full", False) else result.digest[:SHORT_DIGEST]
+        table.add_row(project.name, digest, str(result.files), str(result.hashed), result.source)
+
+    hasher.save()
+    console.print(table)
@@ -0,0 +1,31 @@
+import argparse
+from argparse import Namespace, _SubParsersAction
+from pathlib import Path
+from rich.console import Console
+from ..core import find_projects
+from ..index import ProjectIndex
+
+def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
+    """Register the index command."""
+    index_parser = subparsers.add_parser("index", help="Manage the on-disk project index (.relm/index)", parents=[base_parser])
+    index_parser.add_argument("action", choices=["rebuild"], help="'rebuild' drops the index and re-parses every pyproject.toml")
+    index_parser.set_defaults(func=execute)
+
+def execute(args: Namespace, console: Console):
+    """Execute the index command."""
+    root_path = Path(args.path).resolve()
+
+    if args.action == "rebuild":
+        index = ProjectIndex.load(root_path)
+        index.clear()
+        index.save()
+
+        projects = find_projects(
+            root_path,
+            recursive=getattr(args, "recursive", False),
+            max_depth=getattr(args, "depth", 2),
+            discovery=getattr(args, "discovery", "auto"),
+            include_root=getattr(args, "include_root", None),
+            use_cache=True
+        )
+        console.print(f"[green]Rebuilt project index with {len(projects)} projects at {index.file_path}[/green]")
@@ -6,31 +6,50 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from ..core import find_projects, sort_projects_by_dependency
+from ..workspace import Workspace
 from ..install import install_project
+from ..history import history_for
+from ..logs import logs_for
+from ..runner import add_usage_columns, child_usage, failure_label, resolve_timeout, usage_cells, USAGE_KEYS
+from ..selection import add_selector_arguments, apply_selectors
+from ..sharding import add_shard_arguments, apply_shard
+from ..trace import SEQUENTIAL_LANE, finish_trace, maybe_span, tracer_for
 
 def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
     """Register the install command."""
     install_parser = subparsers.add_parser("install", help="Install projects into the current environment", parents=[base_parser])
     install_parser.add_argument("project_name", help="Name of the project to install or 'all'")
     install_parser.add_argument("--no-editable", action="store_true", help="Install in standard mode instead of editable")
+    install_parser.add_argument("--timeout", type=float, default=None, metavar="SECONDS", help="Abort a project's pip install after this many seconds")
+    install_parser.add_argument("--resources", action="store_true", help="Show CPU time and peak memory per project in the summary")
+    install_parser.add_argument("--trace", metavar="FILE", help="Write a Chrome trace-event timeline of the install (open in Perfetto or chrome://tracing)")
+    add_selector_arguments(install_parser)
+    add_shard_arguments(install_parser)
     install_parser.set_defaults(func=execute)
 
 def execute(args: Namespace, console: Console):
     """Execute the install command."""
     root_path = Path(args.path).resolve()
-    all_projects = find_projects(
-        root_path,
-        recursive=getattr(args, "recursive", False),
-        max_depth=getattr(args, "depth", 2),
-        include_root=getattr(args, "include_root", None)
-    )
+    tracer = tracer_for(args)
+    with maybe_span(tracer, "discovery") as span:
+        all_projects = find_projects(
+            root_path,
+            recursive=getattr(args, "recursive", False),
+            max_depth=getattr(args, "depth", 2),
+            discovery=getattr(args, "discovery", "auto"),
+            include_root=getattr(args, "include_root", None),
+            use_cache=not getattr(args, "no_index", False)
+        )
+        span["projects"] = len(all_projects)
+    workspace = Workspace.of(all_projects)
     target_projects = []
 
     if args.project_name == "all":
         try:
-            target_projects = sort_projects_by_dependency(all_projects)
+            with maybe_span(tracer, "sort"):
+                target_projects = sort_projects_by_dependency(all_projects)
             if getattr(args, "from_root", False):
-                target_projects = [p for p in target_projects if p.path.resolve() != root_path.resolve()]
+                target_projects = workspace.without(target_projects, root_path)
         except ValueError as e:
             console.print(f"[red]Dependency sorting failed: {e}[/red]")
             sys.exit(1)
@@ -44,13 +63,11 @@ def execute(args: Namespace, console: Console):
 
         if target_dir.exists() and target_dir.is_dir():
             # Filter all projects that are under this directory or IS this directory
-            target_projects = [
-                p for p in all_projects 
-                if p.path.resolve() == target_dir or target_dir in p.path.resolve().parents
-            ]
+            target_projects = workspace.under(target_dir)
             if target_projects:
                 try:
-                    target_projects = sort_projects_by_dependency(target_projects)
+                    with maybe_span(tracer, "sort"):
+                        target_projects = sort_projects_by_dependency(target_projects)
                 except ValueError as e:
                     console.print(f"[red]Dependency sorting failed: {e}[/red]")
                     sys.exit(1)
@@ -60,17 +77,29 @@ def execute(args: Namespace, console: Console):
         
         # 2. If no projects found via path, try exact name match
         if not target_projects:
-            target = next((p for p in all_projects if p.name == args.project_name), None)
+            target = workspace.by_name(args.project_name)
             if not target:
                 console.print(f"[red]Project or folder '{args.project_name}' not found in {root_path}[/red]")
                 sys.exit(1)
             target_projects = [target]
 
-    results = {"installed": [], "failed": []}
     editable_mode = not args.no_editable
+    config = getattr(args, "config", None) or {}
+    history = history_for(root_path, config, f"install:{'editable' if editable_mode else 'standard'}")
+    with maybe_span(tracer, "select") as span:
+        target_projects = apply_selectors(args, target_projects, all_projects, console)
+        target_projects = apply_shard(args, target_projects, history, console)
+        span["projects"] = len(target_projects)
+    if not target_projects:
+        console.print("[yellow]No projects selected.[/yellow]")
+        return
+
+    results = {"installed": [], "failed": []}
+    timeout = resolve_timeout(args, config, "install")
 
     if getattr(args, "parallel", False):
         from ..runner import execute_in_parallel
+        run_logs = logs_for(root_path, config)
         
         def cmd_provider(p):
             # We need to construct the pip install command manually for parallel runner
@@ -83,28 +112,39 @@ def execute(args: Namespace, console: Console):
             command_provider=cmd_provider,
             max_workers=args.jobs,
             fail_fast=True, # Always fail-fast for installation dependencies
-            cwd=None # CRITICAL: Always run pip install inside the project directory
+            cwd=None, # CRITICAL: Always run pip install inside the project directory
+            backend=getattr(args, "backend", "thread"),
+            timeout=timeout,
+            tracer=tracer,
+            history=history,
+            run_logs=run_logs
         )
         
         for res in results_data:
+            usage = {k: res.get(k) for k in USAGE_KEYS}
             if res["success"]:
-                results["installed"].append({"name": res["name"], "duration": res.get("duration", 0)})
+                results["installed"].append({"name": res["name"], "duration": res.get("duration", 0), **usage})
             else:
-                results["failed"].append({"name": res["name"], "duration": res.get("duration", 0)})
+                results["failed"].append({"name": res["name"], "duration": res.get("duration", 0), "status": failure_label(res, "Failed"), **usage})
                 console.rule(f"[red]Output for FAILED project: {res['name']}[/red]")
                 from rich.markup import escape
                 if res["stdout"]: console.print(escape(res["stdout"]))
                 if res["stderr"]: console.print(escape(res["stderr"]), style="red")
+                if res.get("log_path"): console.print(f"[dim]Full log: relm logs {res['name']} --run {run_logs.run_id}[/dim]")
     else:
         start_time_all = time.time()
         for project in target_projects:
             task_start = time.time()
-            success = install_project(project, editable=editable_mode)
+            with child_usage() as usage, maybe_span(tracer, project.name, tid=SEQUENTIAL_LANE, cat="task"):
+                result = install_project(project, editable=editable_mode, timeout=timeout)
             task_duration = time.time() - task_start
-            if success:
-                results["installed"].append({"name": project.name, "duration": task_duration})
+            if result.success:
+                if history is not None:
+                    history.record(project.name, task_duration)
+                results["installed"].append({"name": project.name, "duration": task_duration, **usage})
             else:
-                results["failed"].append({"name": project.name, "duration": task_duration})
+                status = "TIMEOUT" if result.timed_out else "Failed"
+                results["failed"].append({"name": project.name, "duration": task_duration, "status": status, **usage})
         total_duration = time.time() - start_time_all
 
     if args.project_name == "all":
@@ -114,11 +154,14 @@ def execute(args: Namespace, console: Console):
         table.add_column("Project", style="cyan")
         table.add_column("Status", justify="center")
         table.add_column("Duration", justify="right")
+        show_usage = getattr(args, "resources", False)
+        if show_usage:
+            add_usage_columns(table)
 
         for item in results["installed"]:
-            table.add_row(item["name"], "[green]Installed[/green]", f"{item['duration']:.2f}s")
+            table.add_row(item["name"], "[green]Installed[/green]", f"{item['duration']:.2f}s", *(usage_cells(item) if show_usage else []))
         for item in results["failed"]:
-            table.add_row(item["name"], "[red]Failed[/red]", f"{item['duration']:.2f}s")
+            table.add_row(item["name"], f"[red]{item.get('status', 'Failed')}[/red]", f"{item['duration']:.2f}s", *(usage_cells(item) if show_usage else []))
         
         console.print(table)
         
@@ -129,3 +172,7 @@ def execute(args: Namespace, console: Console):
         console.print(f"[green]Installed: {len(results['installed'])}[/green]")
         if results["failed"]:
             console.print(f"[red]Failed:    {len(results['failed'])}[/red]")
+
+    if history is not None:
+        history.save()
+    finish_trace(tracer, args, console)
@@ -4,12 +4,13 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from ..core import find_projects
-from ..git_ops import git_has_changes_since
+from ..changes import find_changed_projects
+from ..selection import add_selector_arguments, select_affected
 
 def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
     """Register the list command."""
     list_parser = subparsers.add_parser("list", help="List all discovered projects", parents=[base_parser])
-    list_parser.add_argument("--since", help="List only projects changed since the given git ref")
+    add_selector_arguments(list_parser)
     list_parser.set_defaults(func=execute)
 
 def execute(args: Namespace, console: Console):
@@ -19,11 +20,16 @@ def execute(args: Namespace, console: Console):
         root_path, 
         recursive=getattr(args, "recursive", False), 
         max_depth=getattr(args, "depth", 2),
-        include_root=getattr(args, "include_root", None)
+        discovery=getattr(args, "discovery", "auto"),
+        include_root=getattr(args, "include_root", None),
+        use_cache=not getattr(args, "no_index", False)
     )
 
     if args.since:
-        projects = [p for p in projects if git_has_changes_since(p.path, args.since)]
+        projects = find_changed_projects(projects, args.since)
+
+    if getattr(args, "affected", None):
+        projects = select_affected(projects, projects, args.affected)
 
     if not projects:
         console.print("[yellow]No projects found in this directory.[/yellow]")
@@ -0,0 +1,90 @@
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from argparse import Namespace, _SubParsersAction
+from itertools import islice
+from pathlib import Path
+from rich.console import Console
+from rich.table import Table
+from ..logs import find_log, iter_lines, list_runs, logs_root, tail_lines
+
+def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
+    """Register the logs command."""
+    logs_parser = subparsers.add_parser("logs", help="Show full task output from .relm/logs", parents=[base_parser])
+    logs_parser.add_argument("project_name", nargs="?", help="Project (or pipeline task such as lib:build) whose log to show; omit to list logs")
+    logs_parser.add_argument("--run", metavar="ID", help="Run id to read from (default: the newest run with a log for the project)")
+    logs_parser.add_argument("--tail", type=int, metavar="N", help="Only print the last N lines")
+    logs_parser.add_argument("--start", type=int, default=1, metavar="LINE", help="First line to print (1-based, default: 1)")
+    logs_parser.add_argument("--lines", type=int, metavar="N", help="Print at most N lines from --start")
+    logs_parser.add_argument("--no-pager", action="store_true", help="Write to stdout even when it is a terminal")
+    logs_parser.set_defaults(func=execute)
+
+def _list(root_path: Path, run_id, console: Console):
+    runs = list_runs(root_path)
+    if not runs:
+        console.print("[yellow]No logs recorded yet. Logs are written by run, pytest, install and pipeline.[/yellow]")
+        return
+    if run_id is None:
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Run", style="cyan")
+        table.add_column("Logs", justify="right")
+        table.add_column("Size", justify="right")
+        for run in reversed(runs):
+            files = [entry for entry in os.scandir(logs_root(root_path) / run) if entry.is_file() and entry.name.endswith(".log")]
+            size = sum(entry.stat().st_size for entry in files)
+            table.add_row(run, str(len(files)), f"{size / (1024 * 1024):.1f} MB")
+        console.print(table)
+        return
+    if run_id not in runs:
+        console.print(f"[red]Run '{run_id}' not found. Known runs: {', '.join(runs)}[/red]")
+        sys.exit(1)
+    for entry in sorted(os.scandir(logs_root(root_path) / run_id), key=lambda e: e.name):
+        if not entry.name.endswith(".log"):
+            continue
+        console.print(f"{entry.name[:-len('.log')]}  [dim]{entry.stat().st_size} bytes[/dim]")
+
+def _open_output(no_pager: bool):
+    """Returns (binary stream, pager process or None); pages through $PAGER (or less) on a terminal."""
+    if not no_pager and sys.stdout.isatty():
+        pager = os.environ.get("PAGER") or ("less -R" if shutil.which("less") else None)
+        if pager:
+            process = subprocess.Popen(pager, shell=True, stdin=subprocess.PIPE)
+            return process.stdin, process
+    return sys.stdout.buffer, None
+
+def execute(args: Namespace, console: Console):
+    """Execute the logs command."""
+    root_path = Path(args.path).resolve()
+    if not args.project_name:
+        _list(root_path, args.run, console)
+        return
+
+    path = find_log(root_path, args.project_name, args.run)
+    if path is None:
+        where = f"run '{args.run}'" if args.run else "any recorded run"
+        console.print(f"[red]No log for '{args.project_name}' in {where}.[/red]")
+        sys.exit(1)
+
+    if args.tail is not None:
+        lines = iter(tail_lines(path, args.tail))
+    else:
+        lines = iter_lines(path, start=max(args.start, 1) - 1)
+        if args.lines is not None:
+            lines = islice(lines, args.lines)
+
+    out, pager = _open_output(args.no_pager)
+    try:
+        for line in lines:
+            out.write(line + b"\n")
+        out.flush()
+    except BrokenPipeError:
+        pass  # pager quit early
+    finally:
+        if pager is not None:
+            try:
+                out.close()
+            except BrokenPipeError:
+                pass
+            pager.wait()
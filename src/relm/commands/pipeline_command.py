@@ -0,0 +1,151 @@
+import argparse
+import sys
+from argparse import Namespace, _SubParsersAction
+from pathlib import Path
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+from ..core import find_projects, sort_projects_by_dependency
+from ..workspace import Workspace
+from ..history import history_for
+from ..logs import logs_for
+from ..pipeline import expand_pipeline, load_tasks
+from ..runner import add_usage_columns, execute_in_parallel, failure_label, resolve_timeout, usage_cells
+from ..selection import add_selector_arguments, apply_selectors
+from ..sharding import add_shard_arguments, apply_shard
+from ..trace import finish_trace, maybe_span, tracer_for
+
+def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
+    """Register the pipeline command."""
+    pipeline_parser = subparsers.add_parser("pipeline", help="Run a task from [tasks] in .relm.toml with its dependencies", parents=[base_parser])
+    pipeline_parser.add_argument("task", help="Name of the task to run, as defined under [tasks.<name>]")
+    pipeline_parser.add_argument("project_name", nargs="?", default="all", help="Name of the project to run on or 'all'")
+    pipeline_parser.add_argument("--fail-fast", action="store_true", help="Stop scheduling and terminate running tasks after the first failure")
+    add_selector_arguments(pipeline_parser)
+    add_shard_arguments(pipeline_parser)
+    pipeline_parser.add_argument("--timeout", type=float, default=None, metavar="SECONDS", help="Kill a task (and its child processes) after this many seconds")
+    pipeline_parser.add_argument("--resources", action="store_true", help="Show CPU time and peak memory per task in the summary")
+    pipeline_parser.add_argument("--trace", metavar="FILE", help="Write a Chrome trace-event timeline of the pipeline (open in Perfetto or chrome://tracing)")
+    pipeline_parser.set_defaults(func=execute)
+
+def execute(args: Namespace, console: Console):
+    """Execute the pipeline command."""
+    root_path = Path(args.path).resolve()
+    config = getattr(args, "config", None) or {}
+    try:
+        tasks = load_tasks(config)
+    except ValueError as e:
+        console.print(f"[red]Invalid \\[tasks] configuration: {escape(str(e))}[/red]")
+        sys.exit(1)
+    if args.task not in tasks:
+        defined = ", ".join(sorted(tasks)) or "none"
+        console.print(f"[red]Unknown task '{args.task}'. Defined tasks: {defined}[/red]")
+        sys.exit(1)
+
+    tracer = tracer_for(args)
+    with maybe_span(tracer, "discovery") as span:
+        all_projects = find_projects(
+            root_path,
+            recursive=getattr(args, "recursive", False),
+            max_depth=getattr(args, "depth", 2),
+            discovery=getattr(args, "discovery", "auto"),
+            include_root=getattr(args, "include_root", None),
+            use_cache=not getattr(args, "no_index", False)
+        )
+        span["projects"] = len(all_projects)
+    workspace = Workspace.of(all_projects)
+    target_projects = []
+
+    if args.project_name == "all":
+        target_projects = list(all_projects)
+        if getattr(args, "from_root", False):
+            target_projects = workspace.without(target_projects, root_path)
+    else:
+        # 1. Try path-based matching (e.g. relm pipeline test packages/my-lib)
+        input_path = Path(args.project_name)
+        target_dir = input_path.resolve() if input_path.is_absolute() else (root_path / input_path).resolve()
+        if target_dir.is_dir():
+            target_projects = workspace.under(target_dir)
+        # 2. Try exact name match
+        if not target_projects:
+            target = workspace.by_name(args.project_name)
+            if not target:
+                console.print(f"[red]Project or folder '{args.project_name}' not found in {root_path}[/red]")
+                sys.exit(1)
+            target_projects = [target]
+
+    try:
+        with maybe_span(tracer, "sort"):
+            target_projects = sort_projects_by_dependency(target_projects)
+    except ValueError as e:
+        console.print(f"[red]Dependency sorting failed: {e}[/red]")
+        sys.exit(1)
+
+    history = history_for(root_path, config, f"pipeline:{args.task}")
+    with maybe_span(tracer, "select") as span:
+        target_projects = apply_selectors(args, target_projects, all_projects, console)
+        # Recorded durations are per "<project>:<task>" node, so shards are balanced by file count.
+        target_projects = apply_shard(args, target_projects, None, console)
+        nodes, owners = expand_pipeline(args.task, target_projects, all_projects, tasks)
+        span["projects"] = len(target_projects)
+        span["tasks"] = len(nodes)
+    if not nodes:
+        console.print("[yellow]No projects selected.[/yellow]")
+        return
+
+    console.print(f"[bold]Running task '{args.task}': {len(nodes)} tasks across {len({p.name for p, _ in owners.values()})} projects...[/bold]")
+
+    def cmd_provider(node):
+        return owners[node.name][1].command
+
+    run_logs = logs_for(root_path, config)
+    results = execute_in_parallel(
+        nodes,
+        command_provider=cmd_provider,
+        max_workers=args.jobs if getattr(args, "parallel", False) else 1,
+        fail_fast=args.fail_fast,
+        cwd=root_path if getattr(args, "from_root", False) else None,
+        backend=getattr(args, "backend", "thread"),
+        timeout=resolve_timeout(args, config, "pipeline"),
+        tracer=tracer,
+        history=history,
+        skip_failed_dependencies=True,
+        run_logs=run_logs
+    )
+
+    for res in results:
+        if not res["success"] and not res.get("skipped"):
+            console.rule(f"[red]Output for FAILED task: {res['name']}[/red]")
+            if res["stdout"]: console.print(escape(res["stdout"]))
+            if res["stderr"]: console.print(escape(res["stderr"]), style="red")
+            if res.get("log_path"): console.print(f"[dim]Full log: relm logs {res['name']} --run {run_logs.run_id}[/dim]")
+
+    console.rule("Pipeline Summary")
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Task", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Duration", justify="right")
+    show_usage = getattr(args, "resources", False)
+    if show_usage:
+        add_usage_columns(table)
+
+    order = {node.name: i for i, node in enumerate(nodes)}
+    for res in sorted(results, key=lambda r: order[r["name"]]):
+        status = "[green]Success[/green]" if res["success"] else f"[red]{failure_label(res, 'Failed')}[/red]"
+        table.add_row(res["name"], status, f"{res.get('duration', 0):.2f}s", *(usage_cells(res) if show_usage else []))
+    console.print(table)
+
+    failed = [res for res in results if not res["success"]]
+    not_run = len(nodes) - len(results)
+    summary = f"[bold]Total execution time: {results[0].get('total_duration', 0) if results else 0:.2f}s[/bold] "
+    summary += f"[green]{len(results) - len(failed)} succeeded[/green], [red]{len(failed)} failed[/red]."
+    if not_run:
+        summary += f" [yellow]({not_run} not started due to fail-fast)[/yellow]"
+    console.print(summary)
+
+    if history is not None:
+        history.save()
+    finish_trace(tracer, args, console)
+
+    if failed or not_run:
+        sys.exit(1)
@@ -7,7 +7,14 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from ..core import find_projects, sort_projects_by_dependency
-from ..runner import execute_in_parallel
+from ..workspace import Workspace
+from ..runner import add_usage_columns, execute_in_parallel, failure_label, resolve_timeout, usage_cells, USAGE_KEYS
+from ..cache import TaskCache, cache_enabled
+from ..history import history_for
+from ..logs import logs_for
+from ..selection import add_selector_arguments, apply_selectors
+from ..sharding import add_shard_arguments, apply_shard
+from ..trace import SEQUENTIAL_LANE, finish_trace, maybe_span, tracer_for
 
 def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
     """Register the pytest command."""
@@ -23,6 +30,30 @@ def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser
         action="store_true", 
         help="Stop execution if a project's tests fail"
     )
+    add_selector_arguments(pytest_parser)
+    add_shard_arguments(pytest_parser)
+    pytest_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Replay stored results for projects whose inputs are unchanged"
+    )
+    pytest_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Kill a project's test run (and its child processes) after this many seconds"
+    )
+    pytest_parser.add_argument(
+        "--resources",
+        action="store_true",
+        help="Show CPU time and peak memory per project in the summary"
+    )
+    pytest_parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write a Chrome trace-event timeline of the run (open in Perfetto or chrome://tracing)"
+    )
     pytest_parser.set_defaults(func=execute)
 
 def execute(args: Namespace, console: Console):
@@ -34,21 +65,28 @@ def execute(args: Namespace, console: Console):
         pytest_args = sys.argv[idx + 1:]
 
     root_path = Path(args.path).resolve()
-    all_projects = find_projects(
-        root_path,
-        recursive=getattr(args, "recursive", False),
-        max_depth=getattr(args, "depth", 2),
-        include_root=getattr(args, "include_root", None)
-    )
+    tracer = tracer_for(args)
+    with maybe_span(tracer, "discovery") as span:
+        all_projects = find_projects(
+            root_path,
+            recursive=getattr(args, "recursive", False),
+            max_depth=getattr(args, "depth", 2),
+            discovery=getattr(args, "discovery", "auto"),
+            include_root=getattr(args, "include_root", None),
+            use_cache=not getattr(args, "no_index", False)
+        )
+        span["projects"] = len(all_projects)
+    workspace = Workspace.of(all_projects)
     target_projects = []
 
     if args.project_name == "all":
         try:
-            target_projects = sort_projects_by_dependency(all_projects)
+            with maybe_span(tracer, "sort"):
+                target_projects = sort_projects_by_dependency(all_projects)
             # If running from root and we have multiple projects, skip the project that IS the root 
             # to avoid double execution (since running pytest from root usually finds sub-tests anyway)
             if getattr(args, "from_root", False) and len(target_projects) > 1:
-                target_projects = [p for p in target_projects if p.path.resolve() != root_path.resolve()]
+                target_projects = workspace.without(target_projects, root_path)
         except ValueError as e:
             console.print(f"[red]Dependency sorting failed: {e}[/red]")
             sys.exit(1)
@@ -62,13 +100,11 @@ def execute(args: Namespace, console: Console):
 
         if target_dir.exists() and target_dir.is_dir():
             # Filter all projects that are under this directory or IS this directory
-            target_projects = [
-                p for p in all_projects 
-                if p.path.resolve() == target_dir or target_dir in p.path.resolve().parents
-            ]
+            target_projects = workspace.under(target_dir)
             if target_projects:
                 try:
-                    target_projects = sort_projects_by_dependency(target_projects)
+                    with maybe_span(tracer, "sort"):
+                        target_projects = sort_projects_by_dependency(target_projects)
                 except ValueError as e:
                     console.print(f"[red]Dependency sorting failed: {e}[/red]")
                     sys.exit(1)
@@ -79,12 +115,22 @@ def execute(args: Namespace, console: Console):
         
         # 2. If no projects found via path, try exact name match
         if not target_projects:
-            target = next((p for p in all_projects if p.name == args.project_name), None)
+            target = workspace.by_name(args.project_name)
             if not target:
                 console.print(f"[red]Project or folder '{args.project_name}' not found in {root_path}[/red]")
                 sys.exit(1)
             target_projects = [target]
 
+    config = getattr(args, "config", None) or {}
+    history = history_for(root_path, config, f"pytest:{' '.join(pytest_args)}")
+    with maybe_span(tracer, "select") as span:
+        target_projects = apply_selectors(args, target_projects, all_projects, console)
+        target_projects = apply_shard(args, target_projects, history, console)
+        span["projects"] = len(target_projects)
+    if not target_projects:
+        console.print("[yellow]No projects selected.[/yellow]")
+        return
+
     console.print(f"[bold]Running pytest on {len(target_projects)} projects...[/bold]")
     if pytest_args:
         console.print(f"[dim]Pytest arguments: {' '.join(pytest_args)}[/dim]")
@@ -95,6 +141,10 @@ def execute(args: Namespace, console: Console):
         use_from_root = True
     cwd = root_path if use_from_root else None
 
+    task_cache = TaskCache.from_config(root_path, config, all_projects) if cache_enabled(args, config) else None
+    timeout = resolve_timeout(args, config, "pytest")
+    run_logs = logs_for(root_path, config)
+
     if getattr(args, "parallel", False):
         # Create a hidden directory for all coverage data
         relm_cov_base = root_path / ".relm_cov"
@@ -135,7 +185,13 @@ def execute(args: Namespace, console: Console):
                 command_provider=cmd_provider,
                 max_workers=args.jobs,
                 fail_fast=args.fail_fast,
-                cwd=cwd
+                cwd=cwd,
+                task_cache=task_cache,
+                backend=getattr(args, "backend", "thread"),
+                timeout=timeout,
+                tracer=tracer,
+                history=history,
+                run_logs=run_logs
             )
             # Map back to simple results format for summary
             results = results_data
@@ -176,6 +232,8 @@ def execute(args: Namespace, console: Console):
                 if res["stderr"]:
                     from rich.markup import escape
                     console.print(escape(res["stderr"]), style="red")
+                if res.get("log_path"):
+                    console.print(f"[dim]Full log: relm logs {res['name']} --run {run_logs.run_id}[/dim]")
     else:
         results = []
         start_time_all = time.time()
@@ -193,11 +251,15 @@ def execute(args: Namespace, console: Console):
                 cmd = base_cmd + pytest_args
             
             try:
-                from ..runner import run_project_command_tail
+                from ..runner import run_with_cache
                 task_start = time.time()
-                res_data = run_project_command_tail(cwd or project.path, cmd, tail_lines=50)
+                with maybe_span(tracer, project.name, tid=SEQUENTIAL_LANE, cat="task"):
+                    log_path = run_logs.path_for(project.name) if run_logs is not None else None
+                    res_data = run_with_cache(task_cache, project, cmd, cwd or project.path, timeout=timeout, log_path=log_path)
                 task_duration = time.time() - task_start
                 success = (res_data["returncode"] == 0)
+                if history is not None and success and not res_data.get("cached"):
+                    history.record(project.name, task_duration)
                 
                 if not success:
                     from rich.panel import Panel
@@ -208,6 +270,8 @@ def execute(args: Namespace, console: Console):
                         subtitle="Last 50 lines of output",
                         border_style="red"
                     ))
+                    if log_path is not None and log_path.exists():
+                        console.print(f"[dim]Full log: relm logs {project.name} --run {run_logs.run_id}[/dim]")
             except Exception as e:
                 console.print(f"[red]Error executing pytest in {project.name}: {e}[/red]")
                 success = False
@@ -219,7 +283,11 @@ def execute(args: Namespace, console: Console):
                 "success": success,
                 "path": project.path,
                 "stdout": res_data["stdout"],
-                "duration": task_duration
+                "duration": task_duration,
+                "cached": res_data.get("cached", False),
+                "timed_out": res_data.get("timed_out", False),
+                "cancelled": res_data.get("cancelled", False),
+                **{k: res_data.get(k) for k in USAGE_KEYS}
             })
 
             if not success and args.fail_fast:
@@ -247,16 +315,21 @@ def execute(args: Namespace, console: Console):
     table.add_column("Status", justify="center")
     table.add_column("Duration", justify="right")
     table.add_column("Path", style="dim")
+    show_usage = getattr(args, "resources", False)
+    if show_usage:
+        add_usage_columns(table)
 
     passed_count = 0
     total_time = 0
     for res in results:
-        status = "[green]PASSED[/green]" if res["success"] else "[red]FAILED[/red]"
+        status = "[green]PASSED[/green]" if res["success"] else f"[red]{failure_label(res, 'FAILED')}[/red]"
+        if res.get("cached"):
+            status += " [dim](cached)[/dim]"
         if res["success"]:
             passed_count += 1
         
         duration = res.get("duration", 0)
-        table.add_row(res["name"], status, f"{duration:.2f}s", str(res["path"]))
+        table.add_row(res["name"], status, f"{duration:.2f}s", str(res["path"]), *(usage_cells(res) if show_usage else []))
         total_time = res.get("total_duration", 0)
 
     console.print(table)
@@ -273,5 +346,12 @@ def execute(args: Namespace, console: Console):
     
     console.print(summary_msg)
 
+    if task_cache is not None:
+        task_cache.flush()
+        console.print(f"[dim]Task cache: {task_cache.hits} hits, {task_cache.misses} misses[/dim]")
+    if history is not None:
+        history.save()
+    finish_trace(tracer, args, console)
+
     if failed_count > 0:
         sys.exit(1)
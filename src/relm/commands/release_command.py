@@ -4,7 +4,9 @@ from argparse import Namespace, _SubParsersAction
 from pathlib import Path
 from rich.console import Console
 from ..core import find_projects, sort_projects_by_dependency
+from ..workspace import Workspace
 from ..release import perform_release
+from ..selection import add_selector_arguments, apply_selectors
 
 def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
     """Register the release command."""
@@ -13,6 +15,7 @@ def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser
     release_parser.add_argument("type", choices=["major", "minor", "patch", "alpha", "beta", "rc", "release"], default="patch", nargs="?", help="Type of version bump")
     release_parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation prompts (assume yes)")
     release_parser.add_argument("-m", "--message", default="release: bump version to {version}", help="Custom commit message template (e.g., 'chore: release {version}')")
+    add_selector_arguments(release_parser)
     release_parser.set_defaults(func=execute)
 
 def execute(args: Namespace, console: Console):
@@ -22,7 +25,9 @@ def execute(args: Namespace, console: Console):
         root_path,
         recursive=getattr(args, "recursive", False),
         max_depth=getattr(args, "depth", 2),
-        include_root=getattr(args, "include_root", None)
+        discovery=getattr(args, "discovery", "auto"),
+        include_root=getattr(args, "include_root", None),
+        use_cache=not getattr(args, "no_index", False)
     )
 
     target_projects = []
@@ -39,12 +44,17 @@ def execute(args: Namespace, console: Console):
         console.print(f"[bold]Running Bulk Release on {len(target_projects)} projects...[/bold]")
     else:
         # Find single project
-        target = next((p for p in all_projects if p.name == args.project_name), None)
+        target = Workspace.of(all_projects).by_name(args.project_name)
         if not target:
             console.print(f"[red]Project '{args.project_name}' not found in {root_path}[/red]")
             sys.exit(1)
         target_projects = [target]
 
+    target_projects = apply_selectors(args, target_projects, all_projects, console)
+    if not target_projects:
+        console.print("[yellow]No projects selected.[/yellow]")
+        return
+
     # Execute releases
     results = {"released": [], "skipped": [], "failed": []}
 
@@ -6,7 +6,14 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from ..core import find_projects, sort_projects_by_dependency
-from ..runner import run_project_command
+from ..workspace import Workspace
+from ..runner import add_usage_columns, failure_label, resolve_timeout, run_with_cache, usage_cells, USAGE_KEYS
+from ..cache import TaskCache, cache_enabled
+from ..history import history_for
+from ..logs import logs_for
+from ..selection import add_selector_arguments, apply_selectors
+from ..sharding import add_shard_arguments, apply_shard
+from ..trace import SEQUENTIAL_LANE, finish_trace, maybe_span, tracer_for
 
 def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
     """Register the run command."""
@@ -14,24 +21,37 @@ def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser
     run_parser.add_argument("command_string", help="The shell command to execute")
     run_parser.add_argument("project_name", nargs="?", default="all", help="Name of the project to run on or 'all'")
     run_parser.add_argument("--fail-fast", action="store_true", help="Stop execution if a command fails")
+    add_selector_arguments(run_parser)
+    add_shard_arguments(run_parser)
+    run_parser.add_argument("--cache", action="store_true", help="Replay stored results for projects whose inputs are unchanged")
+    run_parser.add_argument("--timeout", type=float, default=None, metavar="SECONDS", help="Kill a project's command (and its child processes) after this many seconds")
+    run_parser.add_argument("--resources", action="store_true", help="Show CPU time and peak memory per project in the summary")
+    run_parser.add_argument("--trace", metavar="FILE", help="Write a Chrome trace-event timeline of the run (open in Perfetto or chrome://tracing)")
     run_parser.set_defaults(func=execute)
 
 def execute(args: Namespace, console: Console):
     """Execute the run command."""
     root_path = Path(args.path).resolve()
-    all_projects = find_projects(
-        root_path,
-        recursive=getattr(args, "recursive", False),
-        max_depth=getattr(args, "depth", 2),
-        include_root=getattr(args, "include_root", None)
-    )
+    tracer = tracer_for(args)
+    with maybe_span(tracer, "discovery") as span:
+        all_projects = find_projects(
+            root_path,
+            recursive=getattr(args, "recursive", False),
+            max_depth=getattr(args, "depth", 2),
+            discovery=getattr(args, "discovery", "auto"),
+            include_root=getattr(args, "include_root", None),
+            use_cache=not getattr(args, "no_index", False)
+        )
+        span["projects"] = len(all_projects)
+    workspace = Workspace.of(all_projects)
     target_projects = []
 
     if args.project_name == "all":
         try:
-            target_projects = sort_projects_by_dependency(all_projects)
+            with maybe_span(tracer, "sort"):
+                target_projects = sort_projects_by_dependency(all_projects)
             if getattr(args, "from_root", False):
-                target_projects = [p for p in target_projects if p.path.resolve() != root_path.resolve()]
+                target_projects = workspace.without(target_projects, root_path)
         except ValueError as e:
             console.print(f"[red]Dependency sorting failed: {e}[/red]")
             sys.exit(1)
@@ -44,13 +64,11 @@ def execute(args: Namespace, console: Console):
             target_dir = input_path.resolve()
 
         if target_dir.exists() and target_dir.is_dir():
-            target_projects = [
-                p for p in all_projects 
-                if p.path.resolve() == target_dir or target_dir in p.path.resolve().parents
-            ]
+            target_projects = workspace.under(target_dir)
             if target_projects:
                 try:
-                    target_projects = sort_projects_by_dependency(target_projects)
+                    with maybe_span(tracer, "sort"):
+                        target_projects = sort_projects_by_dependency(target_projects)
                 except ValueError as e:
                     console.print(f"[red]Dependency sorting failed: {e}[/red]")
                     sys.exit(1)
@@ -60,17 +78,31 @@ def execute(args: Namespace, console: Console):
 
         # 2. Try exact name match
         if not target_projects:
-            target = next((p for p in all_projects if p.name == args.project_name), None)
+            target = workspace.by_name(args.project_name)
             if not target:
                 console.print(f"[red]Project or folder '{args.project_name}' not found in {root_path}[/red]")
                 sys.exit(1)
             target_projects = [target]
 
+    config = getattr(args, "config", None) or {}
+    history = history_for(root_path, config, f"run:{args.command_string}")
+    with maybe_span(tracer, "select") as span:
+        target_projects = apply_selectors(args, target_projects, all_projects, console)
+        target_projects = apply_shard(args, target_projects, history, console)
+        span["projects"] = len(target_projects)
+    if not target_projects:
+        console.print("[yellow]No projects selected.[/yellow]")
+        return
+
     results = {"success": [], "failed": []}
     use_from_root = getattr(args, "from_root", False)
     cwd = root_path if use_from_root else None
     total_duration = 0
 
+    task_cache = TaskCache.from_config(root_path, config, all_projects) if cache_enabled(args, config) else None
+    timeout = resolve_timeout(args, config, "run")
+    run_logs = logs_for(root_path, config)
+
     if getattr(args, "parallel", False):
         from ..runner import execute_in_parallel
         
@@ -82,11 +114,18 @@ def execute(args: Namespace, console: Console):
             command_provider=cmd_provider,
             max_workers=args.jobs,
             fail_fast=args.fail_fast,
-            cwd=cwd
+            cwd=cwd,
+            task_cache=task_cache,
+            backend=getattr(args, "backend", "thread"),
+            timeout=timeout,
+            tracer=tracer,
+            history=history,
+            run_logs=run_logs
         )
         
         for res in results_data:
-            item = {"name": res["name"], "duration": res.get("duration", 0)}
+            item = {"name": res["name"], "duration": res.get("duration", 0), "cached": res.get("cached", False),
+                    "status": failure_label(res, "Failed"), **{k: res.get(k) for k in USAGE_KEYS}}
             if res["success"]:
                 results["success"].append(item)
             else:
@@ -95,6 +134,7 @@ def execute(args: Namespace, console: Console):
                 from rich.markup import escape
                 if res["stdout"]: console.print(escape(res["stdout"]))
                 if res["stderr"]: console.print(escape(res["stderr"]), style="red")
+                if res.get("log_path"): console.print(f"[dim]Full log: relm logs {res['name']} --run {run_logs.run_id}[/dim]")
         
         if results_data:
             total_duration = results_data[0].get("total_duration", 0)
@@ -103,9 +143,24 @@ def execute(args: Namespace, console: Console):
         for project in target_projects:
             console.rule(f"Running on {project.name}")
             task_start = time.time()
-            success = run_project_command(cwd or project.path, args.command_string)
+            with maybe_span(tracer, project.name, tid=SEQUENTIAL_LANE, cat="task"):
+                res_data = run_with_cache(
+                    task_cache, project, args.command_string, cwd or project.path, timeout=timeout,
+                    log_path=run_logs.path_for(project.name) if run_logs is not None else None
+                )
+            success = (res_data["returncode"] == 0)
+            cached = res_data["cached"]
+            if cached:
+                from rich.markup import escape
+                console.print("[dim]Inputs unchanged, replaying cached output[/dim]")
+                if res_data["stdout"]: console.print(escape(res_data["stdout"]))
+            elif res_data.get("timed_out"):
+                console.print(f"[red]Timed out after {timeout:g}s; process group terminated.[/red]")
             task_duration = time.time() - task_start
-            item = {"name": project.name, "duration": task_duration}
+            if history is not None and success and not cached:
+                history.record(project.name, task_duration)
+            item = {"name": project.name, "duration": task_duration, "cached": cached,
+                    "status": failure_label(res_data, "Failed"), **{k: res_data.get(k) for k in USAGE_KEYS}}
             if success:
                 results["success"].append(item)
             else:
@@ -121,14 +176,27 @@ def execute(args: Namespace, console: Console):
     table.add_column("Project", style="cyan")
     table.add_column("Status", justify="center")
     table.add_column("Duration", justify="right")
+    show_usage = getattr(args, "resources", False)
+    if show_usage:
+        add_usage_columns(table)
 
+    cached_tag = " [dim](cached)[/dim]"
     for item in results["success"]:
-        table.add_row(item["name"], "[green]Success[/green]", f"{item['duration']:.2f}s")
+        extra = usage_cells(item) if show_usage else []
+        table.add_row(item["name"], "[green]Success[/green]" + (cached_tag if item.get("cached") else ""), f"{item['duration']:.2f}s", *extra)
     for item in results["failed"]:
-        table.add_row(item["name"], "[red]Failed[/red]", f"{item['duration']:.2f}s")
+        extra = usage_cells(item) if show_usage else []
+        table.add_row(item["name"], f"[red]{item.get('status', 'Failed')}[/red]" + (cached_tag if item.get("cached") else ""), f"{item['duration']:.2f}s", *extra)
     
     console.print(table)
     console.print(f"[bold]Total execution time: {total_duration:.2f}s[/bold]")
 
+    if task_cache is not None:
+        task_cache.flush()
+        console.print(f"[dim]Task cache: {task_cache.hits} hits, {task_cache.misses} misses[/dim]")
+    if history is not None:
+        history.save()
+    finish_trace(tracer, args, console)
+
     if results["failed"]:
         sys.exit(1)
@@ -5,7 +5,9 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from ..core import find_projects
-from ..git_ops import is_git_clean, get_current_branch
+from ..workspace import Workspace
+from ..git_ops import batch_git_status
+from ..pool import workers_for
 
 def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
     """Register the status command."""
@@ -20,8 +22,11 @@ def execute(args: Namespace, console: Console):
         root_path,
         recursive=getattr(args, "recursive", False),
         max_depth=getattr(args, "depth", 2),
-        include_root=getattr(args, "include_root", None)
+        discovery=getattr(args, "discovery", "auto"),
+        include_root=getattr(args, "include_root", None),
+        use_cache=not getattr(args, "no_index", False)
     )
+    workspace = Workspace.of(all_projects)
     target_projects = []
 
     if args.project_name == "all":
@@ -36,17 +41,14 @@ def execute(args: Namespace, console: Console):
 
         if target_dir.exists() and target_dir.is_dir():
             # Filter all projects that are under this directory or IS this directory
-            target_projects = [
-                p for p in all_projects 
-                if p.path.resolve() == target_dir or target_dir in p.path.resolve().parents
-            ]
+            target_projects = workspace.under(target_dir)
             if target_projects:
                 if len(target_projects) > 1:
                     console.print(f"[bold]Targeting {len(target_projects)} projects in: [cyan]{args.project_name}[/cyan][/bold]")
 
         # 2. Try exact name match
         if not target_projects:
-            target = next((p for p in all_projects if p.name == args.project_name), None)
+            target = workspace.by_name(args.project_name)
             if not target:
                 console.print(f"[red]Project or folder '{args.project_name}' not found in {root_path}[/red]")
                 sys.exit(1)
@@ -58,9 +60,9 @@ def execute(args: Namespace, console: Console):
     table.add_column("Branch", style="blue")
     table.add_column("Status", style="bold")
 
+    statuses = batch_git_status([p.path for p in target_projects], max_workers=workers_for(args))
     for project in target_projects:
-        branch = get_current_branch(project.path)
-        is_clean = is_git_clean(project.path)
+        branch, is_clean = statuses[project.path]
 
         status_str = "[green]Clean[/green]" if is_clean else "[red]Dirty[/red]"
         # Check for potential conflict markers if dirty (simple heuristic) or just leave as Dirty
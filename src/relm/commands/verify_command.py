@@ -5,7 +5,9 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from ..core import find_projects
+from ..workspace import Workspace
 from ..verify import verify_project_release
+from ..pool import map_bounded, workers_for
 
 def register(subparsers: _SubParsersAction, base_parser: argparse.ArgumentParser):
     """Register the verify command."""
@@ -19,29 +21,29 @@ def execute(args: Namespace, console: Console):
     all_projects = find_projects(
         root_path,
         recursive=getattr(args, "recursive", False),
-        max_depth=getattr(args, "depth", 2)
+        max_depth=getattr(args, "depth", 2),
+        discovery=getattr(args, "discovery", "auto"),
+        use_cache=not getattr(args, "no_index", False)
     )
+    workspace = Workspace.of(all_projects)
     target_projects = []
 
     if args.project_name == "all":
         target_projects = all_projects
         if getattr(args, "from_root", False):
-            target_projects = [p for p in target_projects if p.path.resolve() != root_path.resolve()]
+            target_projects = workspace.without(target_projects, root_path)
         console.print(f"[bold]Verifying PyPI availability for {len(target_projects)} projects...[/bold]")
     else:
         # 1. Try path-based matching
         target_dir = (root_path / args.project_name).resolve()
         if target_dir.exists() and target_dir.is_dir():
-            target_projects = [
-                p for p in all_projects 
-                if p.path.resolve() == target_dir or target_dir in p.path.resolve().parents
-            ]
+            target_projects = workspace.under(target_dir)
             if target_projects:
                 console.print(f"[bold]Targeting {len(target_projects)} projects in folder: [cyan]{args.project_name}[/cyan][/bold]")
 
         # 2. Try exact name match
         if not target_projects:
-            target = next((p for p in all_projects if p.name == args.project_name), None)
+            target = workspace.by_name(args.project_name)
             if not target:
                 console.print(f"[red]Project or folder '{args.project_name}' not found in {root_path}[/red]")
                 sys.exit(1)
@@ -56,8 +58,8 @@ def execute(args: Namespace, console: Console):
     table.add_column("Details")
 
     with console.status(f"[bold green]Verifying {len(target_projects)} projects...[/bold green]"):
-        for project in target_projects:
-            success, message = verify_project_release(project)
+        outcomes = map_bounded(verify_project_release, target_projects, max_workers=workers_for(args))
+        for project, (success, message) in zip(target_projects, outcomes):
             if success:
                 results["verified"].append(project.name)
                 status_str = "[green]Verified[/green]"
@@ -1,11 +1,23 @@
 # src/relm/core.py
 
-import os
 import tomllib
 import re
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Set, Dict
+from typing import List, Optional, Sequence, Set, Dict, Any, Tuple
+
+from .config import load_config
+from .discovery import IGNORE_DIRS, discover_project_dirs, member_project_dirs, workspace_globs  # IGNORE_DIRS re-exported for existing imports
+from .index import ProjectIndex, MISS
+
+# Number of pyproject.toml files that must need parsing before they are
+# handed to a process pool; below it, pool startup costs more than it saves.
+# Overridable with [discovery] parse_threshold in .relm.toml.
+PARALLEL_PARSE_THRESHOLD = 64
 
 @dataclass
 class Project:
@@ -22,6 +34,10 @@ class Project:
     def __str__(self) -> str:
         return f"{self.name} (v{self.version}) - {self.path}"
 
+def normalize_name(name: str) -> str:
+    """PEP 503 normalized form of a project name: "My_Lib.Core" -> "my-lib-core"."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
 def _parse_package_name(dep_string: str) -> str:
     """
     Extracts the package name from a dependency string.
@@ -36,53 +52,166 @@ def _parse_package_name(dep_string: str) -> str:
         return match.group(1).lower()
     return dep_string.lower()
 
-def load_project(path: Path) -> Optional[Project]:
+def _parse_project_fields(pyproject_file: Path) -> Optional[Dict[str, Any]]:
     """
-    Loads a project from a directory if it contains a valid pyproject.toml.
+    Reads pyproject.toml and returns the fields relm needs, or None if the
+    file does not describe a valid project. Unreadable or malformed files
+    raise (OSError, tomllib.TOMLDecodeError, ...).
     """
-    pyproject_file = path / "pyproject.toml"
-    if not pyproject_file.exists():
-        return None
+    with open(pyproject_file, "rb") as f:
+        data = tomllib.load(f)
 
-    try:
-        with open(pyproject_file, "rb") as f:
-            data = tomllib.load(f)
-        
-        project_data = data.get("project", {})
-        name = project_data.get("name")
-        version = project_data.get("version")
-        description = project_data.get("description")
-        dependencies = project_data.get("dependencies", [])
-
-        # Also check optional-dependencies (extras) if we want deep dependency awareness?
-        # The prompt only mentioned building lib-a before app-b, which usually implies
-        # direct dependencies. Let's stick to core dependencies for now to keep it simple.
-
-        if name and version:
+    project_data = data.get("project", {})
+    name = project_data.get("name")
+    version = project_data.get("version")
+    description = project_data.get("description")
+    dependencies = project_data.get("dependencies", [])
+
+    # Also check optional-dependencies (extras) if we want deep dependency awareness?
+    # The prompt only mentioned building lib-a before app-b, which usually implies
+    # direct dependencies. Let's stick to core dependencies for now to keep it simple.
+
+    if name and version:
+        return {
+            "name": name,
+            "version": version,
+            "description": description,
             # Normalize dependencies to simple names
-            parsed_deps = [_parse_package_name(d) for d in dependencies]
-
-            return Project(
-                name=name,
-                version=version,
-                path=path,
-                description=description,
-                dependencies=parsed_deps
-            )
-    except Exception as e:
-        # We might want to log this error in a real app
-        pass
-    
+            "dependencies": [_parse_package_name(d) for d in dependencies],
+        }
     return None
 
-def find_projects(root_path: Path, recursive: bool = False, max_depth: int = 1, include_root: Optional[bool] = None) -> List[Project]:
+def _parse_or_error(pyproject_file: Path) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """(fields, None) or (None, error message). Module-level so process pools can pickle it."""
+    try:
+        return _parse_project_fields(pyproject_file), None
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+@dataclass
+class LoadError:
+    """A pyproject.toml that exists but could not be parsed."""
+    path: Path
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+def load_project(path: Path, index: Optional[ProjectIndex] = None) -> Optional[Project]:
+    """
+    Loads a project from a directory if it contains a valid pyproject.toml.
+    If an index is given, unchanged files are served from it without parsing.
+    """
+    projects, _ = load_projects([path], index=index)
+    return projects[0] if projects else None
+
+def load_projects(
+    paths: Sequence[Path],
+    index: Optional[ProjectIndex] = None,
+    parse_threshold: int = PARALLEL_PARSE_THRESHOLD,
+    jobs: Optional[int] = None
+) -> Tuple[List[Project], List[LoadError]]:
+    """
+    Loads the projects in the given directories, in the order of paths.
+    Files served by the index are not parsed; when at least parse_threshold
+    files remain, they are parsed in a process pool of jobs workers (tomllib
+    is pure Python, so threads would serialize on the GIL). With a single
+    CPU, or jobs=1, everything is parsed in-process.
+
+    Directories without a pyproject.toml, or whose file has no [project]
+    name and version, are skipped silently. Files that fail to parse are
+    returned as LoadErrors and are not stored in the index, so they are
+    reported again until fixed.
+    """
+    fields_by_path: Dict[Path, Any] = {}
+    pending = []
+    for path in paths:
+        pyproject_file = path / "pyproject.toml"
+        try:
+            st = pyproject_file.stat()
+        except OSError:
+            continue
+        fields = index.lookup(pyproject_file, st) if index is not None else MISS
+        if fields is MISS:
+            pending.append((path, pyproject_file, st))
+        else:
+            fields_by_path[path] = fields
+
+    files = [pyproject_file for _, pyproject_file, _ in pending]
+    results = None
+    workers = min(jobs or os.cpu_count() or 1, len(files))
+    if workers > 1 and len(files) >= parse_threshold:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_parse_or_error, files, chunksize=max(1, len(files) // (workers * 4))))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No working multiprocessing here (e.g. no sem_open) or a worker
+            # died (e.g. OOM-killed); parse in-process
+            results = None
+    if results is None:
+        results = [_parse_or_error(pyproject_file) for pyproject_file in files]
+
+    errors = []
+    for (path, pyproject_file, st), (fields, error) in zip(pending, results):
+        if error is not None:
+            errors.append(LoadError(pyproject_file, error))
+            continue
+        fields_by_path[path] = fields
+        if index is not None:
+            index.store(pyproject_file, st, fields)
+
+    projects = []
+    for path in paths:
+        fields = fields_by_path.get(path)
+        if fields is not None:
+            projects.append(Project(path=path, **fields))
+    return projects, errors
+
+def _warn_load_errors(errors: List[LoadError]):
+    from rich.console import Console
+    from rich.markup import escape
+    console = Console(stderr=True)
+    for error in errors:
+        console.print(f"[yellow]⚠️  Warning: Skipping invalid {escape(str(error))}[/yellow]")
+
+def _exit_config_error(config_path: Path, error: Exception):
+    from rich.console import Console
+    from rich.markup import escape
+    Console(stderr=True).print(f"[red]Invalid configuration in {escape(str(config_path))}: {escape(str(error))}[/red]")
+    sys.exit(1)
+
+def find_projects(
+    root_path: Path,
+    recursive: bool = False,
+    max_depth: int = 1,
+    include_root: Optional[bool] = None,
+    use_cache: bool = False,
+    discovery: str = "auto"
+) -> List[Project]:
     """
-    Scans root_path for valid projects. 
+    Scans root_path for valid projects and returns them sorted by name, as a
+    Workspace (a list with name and path lookups, see workspace.py).
     If recursive is False, only scans root and immediate subdirectories (depth 1).
     If recursive is True, scans up to max_depth.
     
     If include_root is None, it defaults to False if recursive is True, 
     otherwise True.
+
+    If use_cache is True, parsed pyproject.toml files are memoized in the
+    on-disk index under <root>/.relm/ and reused while they are unchanged;
+    entries for pyproject.toml files this discovery no longer finds are dropped.
+
+    discovery selects how candidate directories are found: "walk" scans the
+    filesystem, "git" asks `git ls-files` (respecting .gitignore) and "auto"
+    uses git when root_path contains a .git. See discovery.py.
+
+    If root_path/.relm.toml declares `[workspace] members` (and discovery is
+    "auto"), those globs are expanded instead and nothing else is scanned;
+    recursive, max_depth and include_root are ignored. A malformed
+    [workspace] table is reported on stderr and exits with status 1.
+
+    pyproject.toml files that fail to parse are skipped with a warning on
+    stderr; see load_projects.
     """
     projects = []
     if not root_path.exists() or not root_path.is_dir():
@@ -91,60 +220,57 @@ def find_projects(root_path: Path, recursive: bool = False, max_depth: int = 1,
     if include_root is None:
         include_root = not recursive
 
-    IGNORE_DIRS = {
-        "node_modules", "venv", ".venv", "env", ".env", "dist", "build", ".git",
-        "__pycache__", ".pytest_cache", ".ruff_cache", ".mypy_cache", "site-packages"
-    }
-
     root_path = root_path.resolve()
+    index = ProjectIndex.load(root_path) if use_cache else None
+    config = load_config(root_path)
+    discovery_config = config.get("discovery", {})
+    parse_threshold = int(discovery_config.get("parse_threshold", PARALLEL_PARSE_THRESHOLD))
 
-    for root, dirs, files in os.walk(root_path):
-        current_path = Path(root).resolve()
-        
-        try:
-            rel_path = current_path.relative_to(root_path)
-            current_depth = len(rel_path.parts)
-        except ValueError:
-            continue
-
-        # Filter directories in-place to prevent recursion into ignored folders
-        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS and not d.startswith(".")]
-
-        # Stop recursion if we exceed max_depth
-        if not recursive and current_depth >= 1:
-            dirs[:] = []
-            if current_depth > 1:
-                continue
-        
-        if recursive and current_depth >= max_depth:
-            dirs[:] = []
-        
-        if "pyproject.toml" in files:
+    try:
+        globs = workspace_globs(config) if discovery == "auto" else None
+    except ValueError as e:
+        _exit_config_error(root_path / ".relm.toml", e)
+    if globs is not None:
+        members, exclude = globs
+        candidates = member_project_dirs(str(root_path), members, exclude)
+    else:
+        # Without recursion, only root and its immediate subdirectories are scanned
+        candidates = [
+            (directory, depth)
+            for directory, depth in discover_project_dirs(str(root_path), max_depth if recursive else 1, discovery)
             # Skip root project if requested
-            if current_path == root_path and not include_root:
-                continue
+            if depth or include_root
+        ]
 
-            project = load_project(current_path)
-            if project:
-                projects.append(project)
+    projects, errors = load_projects([Path(directory) for directory, _ in candidates], index=index, parse_threshold=parse_threshold)
+    if errors:
+        _warn_load_errors(errors)
 
-    return sorted(projects, key=lambda p: p.name)
+    if index is not None:
+        if globs is not None:
+            index.prune_unseen(root_path)
+        else:
+            index.prune_unseen(root_path, max_depth if recursive else 1, min_depth=0 if include_root else 1)
+        index.save()
+
+    from .workspace import Workspace
+    return Workspace(sorted(projects, key=lambda p: p.name))
 
 def sort_projects_by_dependency(projects: List[Project]) -> List[Project]:
     """
     Sorts projects topologically based on their dependencies.
     Projects with no dependencies (or only external ones) come first.
     """
-    project_map: Dict[str, Project] = {p.name.lower(): p for p in projects}
+    project_map: Dict[str, Project] = {normalize_name(p.name): p for p in projects}
 
     # Build graph: node -> list of dependencies (that are in the workspace)
     graph: Dict[str, Set[str]] = {}
 
     for p in projects:
-        p_name = p.name.lower()
+        p_name = normalize_name(p.name)
         graph[p_name] = set()
         for dep in p.dependencies:
-            dep_name = dep.lower()
+            dep_name = normalize_name(dep)
             if dep_name in project_map:
                 graph[p_name].add(dep_name)
 
@@ -196,3 +322,37 @@ def sort_projects_by_dependency(projects: List[Project]) -> List[Project]:
 
     # Convert back to Project objects
     return [project_map[name] for name in sorted_list]
+
+def build_reverse_dependency_index(projects: List[Project]) -> Dict[str, List[str]]:
+    """
+    Maps each project name (PEP 503 normalized) to the normalized names of the
+    workspace projects that depend on it directly.
+    """
+    names = {normalize_name(p.name) for p in projects}
+    reverse: Dict[str, List[str]] = {name: [] for name in names}
+    for p in projects:
+        p_name = normalize_name(p.name)
+        for dep in p.dependencies:
+            dep_name = normalize_name(dep)
+            if dep_name in names and dep_name != p_name:
+                reverse[dep_name].append(p_name)
+    return reverse
+
+def find_affected_projects(projects: List[Project], changed: List[Project]) -> List[Project]:
+    """
+    Returns the changed projects plus everything that transitively depends on
+    them, in topological order.
+    """
+    project_map = {normalize_name(p.name): p for p in projects}
+    reverse = build_reverse_dependency_index(projects)
+
+    affected: Set[str] = set()
+    stack = [name for name in (normalize_name(p.name) for p in changed) if name in project_map]
+    while stack:
+        name = stack.pop()
+        if name in affected:
+            continue
+        affected.add(name)
+        stack.extend(reverse[name])
+
+    return sort_projects_by_dependency([project_map[name] for name in affected])
@@ -0,0 +1,162 @@
+# src/relm/discovery.py
+
+import fnmatch
+import glob
+import os
+import subprocess
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+PYPROJECT_FILE = "pyproject.toml"
+
+# Directory names never descended into while scanning a workspace.
+# Names starting with "." are skipped as well.
+IGNORE_DIRS = frozenset({
+    "node_modules", "venv", ".venv", "env", ".env", "dist", "build", ".git",
+    "__pycache__", ".pytest_cache", ".ruff_cache", ".mypy_cache", "site-packages"
+})
+
+def walk_project_dirs(root: str, max_depth: int) -> Iterator[Tuple[str, int]]:
+    """
+    Yields (directory, depth) for every directory at most max_depth levels
+    below root that contains a pyproject.toml; root itself has depth 0.
+
+    Built on os.scandir: depth is counted while descending instead of being
+    derived from resolved paths, entry types come from the directory listing
+    (no extra stat on most filesystems), and no Path objects are created.
+    root should already be resolved; symlinked directories are not followed,
+    so every yielded path is resolved too. Unreadable directories are skipped.
+    """
+    stack = [(root, 0)]
+    while stack:
+        directory, depth = stack.pop()
+        descend = depth < max_depth
+        found = False
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if name == PYPROJECT_FILE:
+                        found = not entry.is_dir()
+                    elif descend and name[0] != "." and name not in IGNORE_DIRS and entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, depth + 1))
+        except OSError:
+            continue
+        if found:
+            yield directory, depth
+
+DISCOVERY_MODES = ("auto", "walk", "git")
+
+def _is_scanned(name: str) -> bool:
+    return name[:1] != "." and name not in IGNORE_DIRS
+
+def _git_ls_files(directory: str) -> Optional[List[str]]:
+    """
+    Paths below directory of every tracked or untracked-but-not-ignored
+    pyproject.toml, plus nested repositories as "path/" entries, in one
+    `git ls-files` call. None if directory is not in a git work tree.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", "*" + PYPROJECT_FILE, "*/"],
+            cwd=directory, capture_output=True
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return [os.fsdecode(path) for path in result.stdout.split(b"\0") if path]
+
+def _submodule_paths(directory: str) -> List[str]:
+    """Submodule paths from directory/.gitmodules; ls-files lists them without a trailing slash."""
+    if not os.path.isfile(os.path.join(directory, ".gitmodules")):
+        return []
+    try:
+        result = subprocess.run(
+            ["git", "config", "-z", "--file", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"],
+            cwd=directory, capture_output=True
+        )
+    except OSError:
+        return []
+    return [os.fsdecode(item.split(b"\n", 1)[1]) + "/" for item in result.stdout.split(b"\0") if b"\n" in item]
+
+def git_project_dirs(root: str, max_depth: int) -> Optional[List[Tuple[str, int]]]:
+    """
+    Same results as walk_project_dirs, read from the git index instead of the
+    filesystem: one `git ls-files` per repository (nested repositories and
+    submodules are queried separately), so files ignored by .gitignore are
+    skipped as well. Directories in IGNORE_DIRS or starting with "." are
+    still excluded. Returns None if root is not inside a git work tree.
+    """
+    entries = _git_ls_files(root)
+    if entries is None:
+        return None
+
+    found: Set[Tuple[str, int]] = set()
+    for rel in entries + _submodule_paths(root):
+        parts = rel.rstrip("/").split("/")
+        if rel.endswith("/"):
+            depth = len(parts)
+            sub = os.path.join(root, *parts)
+            if depth > max_depth or not all(_is_scanned(p) for p in parts) or not os.path.isdir(sub):
+                continue
+            nested = git_project_dirs(sub, max_depth - depth)
+            if nested is None:
+                nested = walk_project_dirs(sub, max_depth - depth)
+            found.update((directory, depth + nested_depth) for directory, nested_depth in nested)
+        elif parts[-1] == PYPROJECT_FILE:
+            dirs = parts[:-1]
+            if len(dirs) <= max_depth and all(_is_scanned(p) for p in dirs):
+                found.add((os.path.join(root, *dirs) if dirs else root, len(dirs)))
+    return sorted(found)
+
+def discover_project_dirs(root: str, max_depth: int, mode: str = "auto") -> Iterable[Tuple[str, int]]:
+    """
+    (directory, depth) of every project directory up to max_depth below root.
+    mode "walk" scans the filesystem, "git" reads the git index (falling back
+    to the walk outside a work tree), and "auto" uses git when root has a .git.
+    """
+    if mode not in DISCOVERY_MODES:
+        raise ValueError(f"Unknown discovery mode '{mode}', expected one of: {', '.join(DISCOVERY_MODES)}")
+    if mode == "git" or (mode == "auto" and os.path.exists(os.path.join(root, ".git"))):
+        found = git_project_dirs(root, max_depth)
+        if found is not None:
+            return found
+    return walk_project_dirs(root, max_depth)
+
+def _glob_list(workspace: Dict[str, Any], key: str) -> List[str]:
+    value = workspace.get(key, [])
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"[workspace] {key} must be a list of glob patterns")
+    return value
+
+def workspace_globs(config: Dict[str, Any]) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    (members, exclude) from the [workspace] table of a loaded .relm.toml, or
+    None if the workspace does not declare its members.
+    """
+    workspace = config.get("workspace")
+    if not isinstance(workspace, dict) or "members" not in workspace:
+        return None
+    return _glob_list(workspace, "members"), _glob_list(workspace, "exclude")
+
+def member_project_dirs(root: str, members: List[str], exclude: List[str] = ()) -> List[Tuple[str, int]]:
+    """
+    (directory, depth) of every project matched by the member globs, relative
+    to root ("packages/*", "apps/**"). Only the directories a pattern names
+    are listed and each match costs one stat of its pyproject.toml, so nothing
+    else in the tree is visited. Matches of an exclude pattern and directories
+    without a pyproject.toml are dropped; hidden directories only match
+    patterns that spell out the leading ".".
+    """
+    found: Set[Tuple[str, int]] = set()
+    for pattern in members:
+        for rel in glob.glob(pattern, root_dir=root, recursive=True):
+            rel = os.path.normpath(rel).replace(os.sep, "/")
+            if any(fnmatch.fnmatchcase(rel, ex.rstrip("/")) for ex in exclude):
+                continue
+            directory = os.path.normpath(os.path.join(root, rel))
+            if os.path.isfile(os.path.join(directory, PYPROJECT_FILE)):
+                found.add((directory, 0 if rel == "." else rel.count("/") + 1))
+    return sorted(found)
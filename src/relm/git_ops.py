@@ -2,7 +2,11 @@
 
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+
+from .pool import map_bounded
+
+T = TypeVar("T")
 
 def run_git_command(args: List[str], cwd: Path) -> str:
     """
@@ -33,6 +37,15 @@ def is_git_clean(path: Path) -> bool:
     except subprocess.CalledProcessError:
         return False
 
+def _session(path: Path):
+    # Imported lazily: git_session depends on this module.
+    from .git_session import session_for
+    return session_for(path)
+
+def _invalidate_refs(path: Path):
+    from .git_session import invalidate_session
+    invalidate_session(path)
+
 def git_add(path: Path, files: List[str]):
     run_git_command(["add"] + files, cwd=path)
 
@@ -44,6 +57,7 @@ def git_tag(path: Path, tag_name: str, message: str = None):
     if message:
         args.extend(["-m", message])
     run_git_command(args, cwd=path)
+    _invalidate_refs(path)
 
 def git_push(path: Path):
     run_git_command(["push"], cwd=path)
@@ -54,11 +68,18 @@ def git_fetch_tags(path: Path):
     Fetches tags from the remote to ensure local knowledge is up to date.
     """
     run_git_command(["fetch", "--tags"], cwd=path)
+    _invalidate_refs(path)
 
 def git_tag_exists(path: Path, tag_name: str) -> bool:
     """
     Checks if a specific tag exists locally.
     """
+    session = _session(path)
+    if session is not None:
+        try:
+            return session.tag_exists(tag_name)
+        except (subprocess.CalledProcessError, OSError):
+            pass
     try:
         # git rev-parse -q --verify "refs/tags/v1.0.0"
         run_git_command(["rev-parse", "-q", "--verify", f"refs/tags/{tag_name}"], cwd=path)
@@ -90,6 +111,12 @@ def get_current_branch(path: Path) -> str:
     """
     Returns the name of the current git branch.
     """
+    session = _session(path)
+    if session is not None:
+        try:
+            return session.current_branch()
+        except (subprocess.CalledProcessError, OSError):
+            pass
     try:
         return run_git_command(["rev-parse", "--abbrev-ref", "HEAD"], cwd=path)
     except subprocess.CalledProcessError:
@@ -129,6 +156,115 @@ def git_has_changes_since(path: Path, ref: str) -> bool:
     except subprocess.CalledProcessError:
         return True
 
+def find_repo_root(path: Path) -> Optional[Path]:
+    """
+    Returns the root of the git work tree containing path, or None.
+    Only inspects the filesystem (a .git directory or gitfile), so it does
+    not spawn a git process.
+    """
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+def git_changed_files(repo_root: Path, ref: str) -> List[str]:
+    """
+    Returns the paths (relative to repo_root) that differ between ref and HEAD.
+    Raises subprocess.CalledProcessError if the diff cannot be computed.
+    """
+    output = run_git_command(["diff", "--name-only", "-z", ref, "HEAD"], cwd=repo_root)
+    return [name for name in output.split("\0") if name]
+
+class RepoStatus(NamedTuple):
+    branch: str
+    changed: List[str]
+
+class PathStatus(NamedTuple):
+    branch: str
+    clean: bool
+
+UNKNOWN_STATUS = PathStatus("unknown", False)
+
+def git_repo_status(repo_root: Path) -> RepoStatus:
+    """
+    Returns the current branch and the tracked paths (relative to repo_root)
+    with staged or unstaged changes, from a single `git status` call.
+    Untracked files are ignored, matching is_git_clean.
+    Raises subprocess.CalledProcessError if git fails.
+    """
+    output = run_git_command(
+        ["status", "--porcelain=v2", "--branch", "-z", "--untracked-files=no"],
+        cwd=repo_root
+    )
+    branch = "unknown"
+    changed: List[str] = []
+    records = iter(output.split("\0"))
+    for record in records:
+        if record.startswith("# branch.head "):
+            head = record[len("# branch.head "):]
+            # rev-parse --abbrev-ref reports a detached HEAD as "HEAD"
+            branch = "HEAD" if head == "(detached)" else head
+        elif record.startswith("1 "):
+            changed.append(record.split(" ", 8)[8])
+        elif record.startswith("2 "):
+            changed.append(record.split(" ", 9)[9])
+            changed.append(next(records, ""))  # original path of a rename or copy
+        elif record.startswith("u "):
+            changed.append(record.split(" ", 10)[10])
+    return RepoStatus(branch, [c for c in changed if c])
+
+def group_by_repo(items: Iterable[T], path_of: Callable[[T], Path] = lambda path: path) -> Tuple[Dict[Path, List[Tuple[T, Tuple[str, ...]]]], List[T]]:
+    """
+    Groups items (paths, or e.g. projects with path_of=lambda p: p.path) by
+    the git work tree their path lives in, looking up each root once.
+    Returns ({repo_root: [(item, path parts relative to repo_root)]}, items outside git).
+    """
+    repos: Dict[Path, List[Tuple[T, Tuple[str, ...]]]] = {}
+    outside: List[T] = []
+    for item in items:
+        resolved = path_of(item).resolve()
+        repo_root = find_repo_root(resolved)
+        if repo_root is None:
+            outside.append(item)
+            continue
+        repos.setdefault(repo_root, []).append((item, resolved.relative_to(repo_root).parts))
+    return repos, outside
+
+def batch_git_status(paths: Iterable[Path], max_workers: int = 1) -> Dict[Path, PathStatus]:
+    """
+    Returns the branch and cleanliness of every path, running one
+    `git status` per repository instead of several git calls per path.
+    With max_workers > 1 the repositories are queried concurrently.
+    A path is dirty if a changed file lies below it. Paths outside git, or in
+    a repository where status fails, are reported as ("unknown", dirty).
+    """
+    statuses: Dict[Path, PathStatus] = {}
+    repos, outside = group_by_repo(paths)
+    for path in outside:
+        statuses[path] = UNKNOWN_STATUS
+
+    def query(repo_root: Path) -> Optional[RepoStatus]:
+        try:
+            return git_repo_status(repo_root)
+        except (subprocess.CalledProcessError, OSError):
+            return None
+
+    repo_statuses = map_bounded(query, repos, max_workers=max_workers)
+    for (repo_root, members), repo_status in zip(repos.items(), repo_statuses):
+        if repo_status is None:
+            for path, _ in members:
+                statuses[path] = UNKNOWN_STATUS
+            continue
+
+        dirty_dirs = set()
+        for changed_file in repo_status.changed:
+            parts = tuple(changed_file.split("/"))
+            dirty_dirs.update(parts[:i] for i in range(len(parts)))
+
+        for path, parts in members:
+            statuses[path] = PathStatus(repo_status.branch, parts not in dirty_dirs)
+    return statuses
+
 def run_git_gc(path: Path):
     """
     Runs git gc in the specified directory.
@@ -0,0 +1,142 @@
+# src/relm/git_session.py
+
+import atexit
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .git_ops import find_repo_root
+
+class GitSession:
+    """
+    Long-lived query session for one repository.
+
+    Branch and tag refs are loaded with a single `git for-each-ref` and kept
+    in memory, and arbitrary revisions are resolved through one persistent
+    `git cat-file --batch-check` process, so repeated ref queries (e.g. in a
+    bulk release) do not fork git each time. Call invalidate() after changing
+    refs; relm does so itself when it creates or fetches tags.
+    """
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+        self._lock = threading.Lock()
+        self._refs: Optional[Dict[str, str]] = None
+        self._head_ref: Optional[str] = None
+        self._batch: Optional[subprocess.Popen] = None
+
+    def _load_refs(self) -> Dict[str, str]:
+        if self._refs is None:
+            result = subprocess.run(
+                ["git", "for-each-ref", "--format=%(HEAD) %(objectname) %(refname)", "refs/tags", "refs/heads"],
+                cwd=self.repo_root,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            refs, head_ref = {}, None
+            for line in result.stdout.splitlines():
+                marker, objectname, refname = line[0], *line[2:].split(" ", 1)
+                refs[refname] = objectname
+                if marker == "*":
+                    head_ref = refname
+            self._refs, self._head_ref = refs, head_ref
+        return self._refs
+
+    def refs(self) -> Dict[str, str]:
+        """Returns {refname: object id} for all local branches and tags."""
+        with self._lock:
+            return dict(self._load_refs())
+
+    def tag_exists(self, tag_name: str) -> bool:
+        with self._lock:
+            return f"refs/tags/{tag_name}" in self._load_refs()
+
+    def current_branch(self) -> str:
+        """
+        Returns the checked-out branch like `git rev-parse --abbrev-ref HEAD`:
+        "HEAD" when detached and "unknown" when HEAD has no commit yet.
+        """
+        with self._lock:
+            self._load_refs()
+            if self._head_ref is not None:
+                return self._head_ref[len("refs/heads/"):]
+        return "HEAD" if self.resolve("HEAD") else "unknown"
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Returns the object id rev points to, or None if it does not exist."""
+        if "\n" in rev:
+            return None
+        with self._lock:
+            if self._batch is None or self._batch.poll() is not None:
+                self._batch = subprocess.Popen(
+                    ["git", "cat-file", "--batch-check"],
+                    cwd=self.repo_root,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1
+                )
+            try:
+                self._batch.stdin.write(rev + "\n")
+                self._batch.stdin.flush()
+                line = self._batch.stdout.readline()
+            except OSError:
+                self._close_batch()
+                raise
+        if not line:
+            raise OSError(f"git cat-file exited in {self.repo_root}")
+        fields = line.split()
+        # "<oid> <type> <size>", or "<rev> missing" / "<rev> ambiguous"
+        return fields[0] if len(fields) == 3 else None
+
+    def invalidate(self):
+        """Drops the cached refs; the next query reloads them."""
+        with self._lock:
+            self._refs = None
+            self._head_ref = None
+
+    def _close_batch(self):
+        if self._batch is not None:
+            try:
+                self._batch.stdin.close()
+                self._batch.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._batch.kill()
+            self._batch = None
+
+    def close(self):
+        with self._lock:
+            self._close_batch()
+
+_sessions: Dict[Path, GitSession] = {}
+_sessions_lock = threading.Lock()
+
+def session_for(path: Path) -> Optional[GitSession]:
+    """Returns the shared session for the repository containing path, or None outside git."""
+    repo_root = find_repo_root(path.resolve())
+    if repo_root is None:
+        return None
+    with _sessions_lock:
+        session = _sessions.get(repo_root)
+        if session is None:
+            session = _sessions[repo_root] = GitSession(repo_root)
+        return session
+
+def invalidate_session(path: Path):
+    """Invalidates the cached refs of the repository containing path, if any."""
+    repo_root = find_repo_root(path.resolve())
+    with _sessions_lock:
+        session = _sessions.get(repo_root)
+    if session is not None:
+        session.invalidate()
+
+@atexit.register
+def close_sessions():
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
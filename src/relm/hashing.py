@@ -0,0 +1,240 @@
+# src/relm/hashing.py
+
+import hashlib
+import json
+import os
+import stat
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .discovery import IGNORE_DIRS
+from .git_ops import find_repo_root
+from .state import state_dir
+
+MEMO_FILE_NAME = "hashes"
+MEMO_FORMAT_VERSION = 1
+# Files modified this recently are hashed but not memoized: a second write
+# within the filesystem's timestamp granularity would leave the stat unchanged.
+RACY_WINDOW_NS = 2_000_000_000
+
+class TreeDigest(NamedTuple):
+    digest: str
+    files: int
+    hashed: int
+    source: str
+
+def git_blob_digest(path: Union[str, Path], st: Optional[os.stat_result] = None) -> str:
+    """
+    Returns the git blob id (SHA-1 of "blob <size>\\0" + content) of a file,
+    or of the link target for a symlink, so digests computed from the working
+    tree match the ones `git ls-files -s` reports for clean files.
+    """
+    st = st or os.lstat(path)
+    h = hashlib.sha1()
+    if stat.S_ISLNK(st.st_mode):
+        target = os.fsencode(os.readlink(path))
+        h.update(b"blob %d\0" % len(target))
+        h.update(target)
+        return h.hexdigest()
+
+    h.update(b"blob %d\0" % st.st_size)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _combine(digests: Dict[str, str]) -> str:
+    h = hashlib.sha256()
+    for rel in sorted(digests):
+        h.update(rel.encode("utf-8", "surrogateescape"))
+        h.update(b"\0")
+        h.update(digests[rel].encode())
+        h.update(b"\n")
+    return h.hexdigest()
+
+def _git_z(args: List[str], cwd: Path) -> List[str]:
+    result = subprocess.run(["git"] + args, cwd=cwd, capture_output=True, check=True)
+    return [item for item in result.stdout.decode("utf-8", "surrogateescape").split("\0") if item]
+
+def walk_files(directory: Path) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yields (relative posix path, DirEntry) for every file below directory,
+    skipping the same directories as project discovery.
+    """
+    stack = [("", str(directory))]
+    while stack:
+        prefix, current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            rel = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in IGNORE_DIRS and not entry.name.startswith("."):
+                    stack.append((rel + "/", entry.path))
+            else:
+                yield rel, entry
+
+class FileTreeHasher:
+    """
+    Fingerprints project directories.
+
+    Per-file digests are memoized by (mtime_ns, size, inode) in a table under
+    <root>/.relm/, so only files whose stat changed are read again. Inside a
+    git checkout with no pending changes, blob ids are taken straight from
+    `git ls-files -s` without touching the files at all.
+
+    Memo entries below a walked tree that the walk did not visit (deleted or
+    renamed files) are dropped when the table is saved.
+
+    One hasher may be shared by worker threads: the memo and its bookkeeping
+    are only touched under a lock, which save() also holds while writing.
+    """
+
+    def __init__(self, root_path: Optional[Path] = None):
+        self.root_path = root_path
+        self.memo: Dict[str, List] = {}
+        self.dirty = False
+        # Memo keys looked up, and the key prefixes of the trees fully walked
+        self._visited: Set[str] = set()
+        self._walked: Set[str] = set()
+        self._lock = threading.Lock()
+        if root_path is not None:
+            self._load()
+
+    @property
+    def memo_path(self) -> Optional[Path]:
+        if self.root_path is None:
+            return None
+        return state_dir(self.root_path) / MEMO_FILE_NAME
+
+    def _load(self):
+        try:
+            with open(self.memo_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == MEMO_FORMAT_VERSION:
+            self.memo = data.get("files", {})
+
+    def _prune_unvisited(self):
+        stale = []
+        for key in self.memo:
+            if key in self._visited:
+                continue
+            end = len(key)
+            while end > 0:
+                end = key.rfind("/", 0, end)
+                if key[:end + 1] in self._walked:
+                    stale.append(key)
+                    break
+        for key in stale:
+            del self.memo[key]
+        if stale:
+            self.dirty = True
+
+    def save(self):
+        """Writes the memo table if it changed. Failures are ignored."""
+        if self.root_path is None:
+            return
+        with self._lock:
+            if self._walked:
+                self._prune_unvisited()
+            if not self.dirty:
+                return
+            try:
+                directory = state_dir(self.root_path, create=True)
+                tmp_path = directory / f"{MEMO_FILE_NAME}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"version": MEMO_FORMAT_VERSION, "files": self.memo}, f, separators=(",", ":"))
+                os.replace(tmp_path, self.memo_path)
+                self.dirty = False
+            except OSError:
+                pass
+
+    def _memo_prefix(self, directory: Path) -> str:
+        """Memo keys are posix paths relative to the root when possible."""
+        if self.root_path is not None:
+            try:
+                rel = directory.relative_to(self.root_path.resolve()).as_posix()
+                return "" if rel == "." else rel + "/"
+            except ValueError:
+                pass
+        return directory.as_posix() + "/"
+
+    def file_digest(self, key: str, path: str, st: os.stat_result, now_ns: int) -> Tuple[str, bool]:
+        """Returns (digest, whether the file had to be read)."""
+        signature = [st.st_mtime_ns, st.st_size, st.st_ino]
+        with self._lock:
+            self._visited.add(key)
+            cached = self.memo.get(key)
+        if cached is not None and cached[:3] == signature:
+            return cached[3], False
+
+        digest = git_blob_digest(path, st)
+        if now_ns - st.st_mtime_ns > RACY_WINDOW_NS:
+            with self._lock:
+                self.memo[key] = signature + [digest]
+                self.dirty = True
+        return digest, True
+
+    def _hash_from_git_index(self, directory: Path) -> Optional[Dict[str, str]]:
+        """
+        Returns {relative path: blob id} from the index if the subtree has no
+        staged, unstaged or untracked changes, otherwise None.
+        """
+        if _git_z(["status", "--porcelain", "-z", "--untracked-files=all", "--", "."], cwd=directory):
+            return None
+        digests = {}
+        for line in _git_z(["ls-files", "-s", "-z", "--", "."], cwd=directory):
+            meta, rel = line.split("\t", 1)
+            mode, blob, _stage = meta.split(" ")
+            if mode != "160000":  # submodule commits are not file content
+                digests[rel] = blob
+        return digests
+
+    def hash_tree(self, directory: Path) -> TreeDigest:
+        directory = directory.resolve()
+        now_ns = time.time_ns()
+        prefix = self._memo_prefix(directory)
+        base = str(directory) + os.sep
+        digests: Dict[str, str] = {}
+        hashed = 0
+
+        if find_repo_root(directory) is not None:
+            try:
+                from_index = self._hash_from_git_index(directory)
+                if from_index is not None:
+                    return TreeDigest(_combine(from_index), len(from_index), 0, "git-index")
+
+                for rel in _git_z(["ls-files", "-z", "--cached", "--others", "--exclude-standard"], cwd=directory):
+                    path = base + rel
+                    try:
+                        st = os.lstat(path)
+                    except OSError:
+                        continue  # deleted in the working tree
+                    if not (stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode)):
+                        continue
+                    digests[rel], was_read = self.file_digest(prefix + rel, path, st, now_ns)
+                    hashed += was_read
+                with self._lock:
+                    self._walked.add(prefix)
+                return TreeDigest(_combine(digests), len(digests), hashed, "git-worktree")
+            except (subprocess.CalledProcessError, OSError):
+                digests, hashed = {}, 0
+
+        for rel, entry in walk_files(directory):
+            try:
+                st = entry.stat(follow_symlinks=False)
+                digests[rel], was_read = self.file_digest(prefix + rel, entry.path, st, now_ns)
+            except OSError:
+                continue
+            hashed += was_read
+        with self._lock:
+            self._walked.add(prefix)
+        return TreeDigest(_combine(digests), len(digests), hashed, "walk")
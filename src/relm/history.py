@@ -0,0 +1,143 @@
+# src/relm/history.py
+
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .state import state_dir
+
+HISTORY_FILE_NAME = "history.db"
+# Weight of the newest run in the stored moving average
+SMOOTHING = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS durations (
+    project TEXT NOT NULL,
+    command TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    runs INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (project, command)
+)
+"""
+
+class DurationHistory:
+    """
+    Per-project durations of one command, kept in .relm/history.db (SQLite)
+    or in file_path if given (e.g. a database shared between CI runners).
+
+    command is a label chosen by the caller (e.g. the shell command of
+    `relm run`, or "pytest" plus its arguments) rather than the exact argv,
+    which may contain per-run temporary paths. Each stored duration is an
+    exponential moving average over successful, non-cached runs.
+
+    record() may be called from worker threads; results are buffered and
+    written in one transaction by save(). Storage errors are ignored since
+    the history is only used for estimates.
+    """
+
+    def __init__(self, root_path: Path, command: str, file_path: Optional[Path] = None):
+        self.root_path = root_path
+        self.command = command
+        self._file_path = file_path
+        self._pending: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path or state_dir(self.root_path) / HISTORY_FILE_NAME
+
+    def _connect(self, create: bool = False) -> Optional[sqlite3.Connection]:
+        if not create and not self.file_path.exists():
+            return None
+        if self._file_path is None:
+            state_dir(self.root_path, create=True)
+        conn = sqlite3.connect(self.file_path, timeout=5)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def estimates(self, projects: Iterable[str]) -> Dict[str, float]:
+        """Known durations in seconds for the given project names."""
+        names = list(projects)
+        if not names:
+            return {}
+        try:
+            conn = self._connect()
+            if conn is None:
+                return {}
+            with closing(conn):
+                rows = conn.execute(
+                    "SELECT project, seconds FROM durations WHERE command = ?", (self.command,)
+                ).fetchall()
+        except (OSError, sqlite3.Error):
+            return {}
+        wanted = set(names)
+        return {project: seconds for project, seconds in rows if project in wanted}
+
+    def record(self, project: str, seconds: float):
+        with self._lock:
+            self._pending.append((project, seconds))
+
+    def save(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        now = time.time()
+        try:
+            with closing(self._connect(create=True)) as conn, conn:
+                for project, seconds in pending:
+                    conn.execute(
+                        "INSERT INTO durations (project, command, seconds, runs, updated) VALUES (?, ?, ?, 1, ?) "
+                        "ON CONFLICT (project, command) DO UPDATE SET "
+                        "seconds = seconds * ? + excluded.seconds * ?, runs = runs + 1, updated = excluded.updated",
+                        (project, self.command, seconds, now, 1 - SMOOTHING, SMOOTHING)
+                    )
+        except (OSError, sqlite3.Error):
+            pass
+
+def history_for(root_path: Path, config: Dict[str, Any], command: str) -> Optional[DurationHistory]:
+    """The duration history for command, or None if [history] enabled = false in .relm.toml."""
+    history_config = config.get("history", {}) if isinstance(config, dict) else {}
+    if not history_config.get("enabled", True):
+        return None
+    return DurationHistory(root_path, command)
+
+def fill_unknown(durations: Dict[str, float], names: Iterable[str]) -> Dict[str, float]:
+    """
+    Durations for every name: projects without history are assumed to take
+    the mean of the known ones (1 second when nothing is known).
+    """
+    default = sum(durations.values()) / len(durations) if durations else 1.0
+    return {name: durations.get(name, default) for name in names}
+
+def critical_paths(dependents: Dict[str, List[str]], durations: Dict[str, float]) -> Dict[str, float]:
+    """
+    For every project, its own duration plus the longest chain of dependents
+    below it: the least time the run needs once the project starts. Edges
+    that close a cycle are ignored.
+    """
+    lengths: Dict[str, float] = {}
+    visiting = set()
+
+    # Iterative post-order walk; long dependency chains would overflow recursion.
+    for root in dependents:
+        if root in lengths:
+            continue
+        visiting.add(root)
+        stack = [(root, iter(dependents.get(root, ())))]
+        while stack:
+            name, children = stack[-1]
+            child = next((c for c in children if c not in lengths and c not in visiting), None)
+            if child is not None:
+                visiting.add(child)
+                stack.append((child, iter(dependents.get(child, ()))))
+                continue
+            stack.pop()
+            visiting.discard(name)
+            downstream = max((lengths[d] for d in dependents.get(name, ()) if d in lengths), default=0.0)
+            lengths[name] = durations.get(name, 0.0) + downstream
+    return lengths
@@ -0,0 +1,117 @@
+# src/relm/index.py
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .state import state_dir
+
+INDEX_FILE_NAME = "index"
+INDEX_FORMAT_VERSION = 1
+
+# Sentinel returned by lookup() when the index has no usable entry.
+MISS = object()
+
+def _signature(st: os.stat_result) -> List[int]:
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+class ProjectIndex:
+    """
+    On-disk cache of parsed pyproject.toml metadata.
+
+    Entries are keyed by the absolute path of each pyproject.toml and are only
+    reused while its (mtime, size, inode) signature is unchanged, so edited
+    files are transparently re-parsed. Entries for files that a discovery no
+    longer finds (deleted or moved projects) are dropped by prune_unseen.
+    """
+
+    def __init__(self, root_path: Path, entries: Optional[Dict[str, Any]] = None):
+        self.root_path = root_path
+        self.entries: Dict[str, Any] = entries or {}
+        self.dirty = False
+        # Keys looked up or stored since the index was loaded
+        self.seen: Set[str] = set()
+
+    @property
+    def file_path(self) -> Path:
+        return state_dir(self.root_path) / INDEX_FILE_NAME
+
+    @classmethod
+    def load(cls, root_path: Path) -> "ProjectIndex":
+        """
+        Loads the index for root_path. A missing, unreadable or outdated
+        index yields an empty one rather than an error.
+        """
+        index = cls(root_path)
+        try:
+            with open(index.file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return index
+
+        if isinstance(data, dict) and data.get("version") == INDEX_FORMAT_VERSION:
+            index.entries = data.get("entries", {})
+        return index
+
+    def lookup(self, pyproject_file: Path, st: os.stat_result) -> Any:
+        """
+        Returns the cached project fields (or None for a file that did not
+        describe a valid project), or MISS if the file must be parsed again.
+        """
+        key = str(pyproject_file)
+        self.seen.add(key)
+        entry = self.entries.get(key)
+        if entry is None or entry.get("sig") != _signature(st):
+            return MISS
+        return entry.get("project")
+
+    def store(self, pyproject_file: Path, st: os.stat_result, project: Optional[Dict[str, Any]]):
+        key = str(pyproject_file)
+        self.seen.add(key)
+        self.entries[key] = {"sig": _signature(st), "project": project}
+        self.dirty = True
+
+    def prune_unseen(self, root_path: Path, max_depth: Optional[int] = None, min_depth: int = 0):
+        """
+        Drops the entries a discovery of root_path covering directories
+        min_depth..max_depth levels down (None: any depth) should have seen
+        but did not. Entries outside that range belong to other discovery
+        settings and are kept.
+        """
+        stale = []
+        for key in self.entries:
+            if key in self.seen:
+                continue
+            try:
+                depth = len(Path(key).parent.relative_to(root_path).parts)
+            except ValueError:
+                stale.append(key)
+                continue
+            if depth >= min_depth and (max_depth is None or depth <= max_depth):
+                stale.append(key)
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+
+    def clear(self):
+        self.entries = {}
+        self.dirty = True
+
+    def save(self):
+        """
+        Atomically writes the index if it changed. Failures are ignored since
+        the index is only an optimization.
+        """
+        if not self.dirty:
+            return
+        try:
+            directory = state_dir(self.root_path, create=True)
+            tmp_path = directory / f"{INDEX_FILE_NAME}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_FORMAT_VERSION, "entries": self.entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.file_path)
+            self.dirty = False
+        except OSError:
+            pass
@@ -2,15 +2,30 @@
 
 import sys
 import subprocess
+from typing import NamedTuple, Optional
 from rich.console import Console
 from .core import Project
+from .process import process_group_kwargs, terminate_process_group
 
 console = Console()
 
-def install_project(project: Project, editable: bool = True) -> bool:
+class InstallResult(NamedTuple):
+    success: bool
+    timed_out: bool = False
+
+    def __bool__(self) -> bool:
+        return self.success
+
+def install_project(project: Project, editable: bool = True, timeout: Optional[float] = None) -> InstallResult:
     """
     Installs the project using pip in the current environment.
-    Returns True if successful, False otherwise.
+
+    Without a timeout pip runs attached to the terminal, so it can prompt
+    (e.g. for keyring credentials). With one, it runs in its own process
+    group: after timeout seconds the whole group (including build backends
+    pip started) gets SIGTERM, then SIGKILL, and the result is marked
+    timed_out. The new session detaches pip from the terminal, so prompts
+    cannot be answered in that case.
     """
     mode_str = "editable" if editable else "standard"
     console.print(f"[blue]Installing {project.name} in {mode_str} mode...[/blue]")
@@ -20,15 +35,28 @@ def install_project(project: Project, editable: bool = True) -> bool:
         cmd.append("-e")
     cmd.append(".")
 
+    # We allow stdout/stderr to flow to the console so the user sees pip's progress
     try:
-        # We allow stdout/stderr to flow to the console so the user sees pip's progress
-        subprocess.run(
-            cmd,
-            cwd=project.path,
-            check=True
-        )
-        console.print(f"[green]Successfully installed {project.name}[/green]")
-        return True
-    except subprocess.CalledProcessError:
+        process = subprocess.Popen(cmd, cwd=project.path, **(process_group_kwargs() if timeout is not None else {}))
+    except OSError as e:
+        console.print(f"[red]Failed to install {project.name}: {e}[/red]")
+        return InstallResult(False)
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        terminate_process_group(process.pid)
+        process.wait()
+        console.print(f"[red]Timed out installing {project.name} after {timeout:g}s, process group terminated[/red]")
+        return InstallResult(False, timed_out=True)
+    except BaseException:
+        # The new session does not receive the terminal's Ctrl-C
+        if timeout is not None:
+            terminate_process_group(process.pid)
+        process.wait()
+        raise
+
+    if returncode != 0:
         console.print(f"[red]Failed to install {project.name}[/red]")
-        return False
+        return InstallResult(False)
+    console.print(f"[green]Successfully installed {project.name}[/green]")
+    return InstallResult(True)
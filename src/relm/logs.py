@@ -0,0 +1,175 @@
+# src/relm/logs.py
+
+import mmap
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from .state import state_dir
+
+LOGS_DIR_NAME = "logs"
+# Number of runs whose logs are kept; older run directories are pruned
+DEFAULT_KEEP_RUNS = 10
+# Log files are written through a buffer this large, so a task producing
+# gigabytes of output costs few write() calls.
+WRITE_BUFFER_BYTES = 1 << 20
+# Holds the pid of the process writing a run; its run is not pruned while it lives
+OWNER_FILE_NAME = "owner.pid"
+# Runs whose directory changed this recently are never pruned (e.g. another
+# process created it but has not written its owner file yet)
+RUN_GRACE_SECONDS = 300
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+def logs_root(root_path: Path) -> Path:
+    return state_dir(root_path) / LOGS_DIR_NAME
+
+def new_run_id() -> str:
+    """A run id that sorts by start time, e.g. 20240131-142501-4242."""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+def log_file_name(name: str) -> str:
+    """File name of a task's log; pipeline nodes such as "lib:build" become "lib_build.log"."""
+    return _UNSAFE_CHARS.sub("_", name) + ".log"
+
+def open_log(path: Path) -> BinaryIO:
+    return open(path, "wb", buffering=WRITE_BUFFER_BYTES)
+
+class RunLogs:
+    """
+    Full output of one run, one file per task under .relm/logs/<run-id>/.
+
+    Nothing touches the disk until the first log path is requested; at that
+    point the run directory is created with an owner file holding this pid,
+    and runs beyond the newest keep are removed (see prune_runs).
+    path_for() may be called from worker threads.
+    """
+
+    def __init__(self, root_path: Path, run_id: Optional[str] = None, keep: int = DEFAULT_KEEP_RUNS):
+        self.root_path = root_path
+        self.run_id = run_id or new_run_id()
+        self.keep = keep
+        self._created = False
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        return logs_root(self.root_path) / self.run_id
+
+    def path_for(self, name: str) -> Path:
+        with self._lock:
+            if not self._created:
+                state_dir(self.root_path, create=True)
+                self.directory.mkdir(parents=True, exist_ok=True)
+                try:
+                    (self.directory / OWNER_FILE_NAME).write_text(str(os.getpid()))
+                except OSError:
+                    pass
+                prune_runs(self.root_path, self.keep, current=self.run_id)
+                self._created = True
+        return self.directory / log_file_name(name)
+
+def logs_for(root_path: Path, config: Dict[str, Any]) -> Optional[RunLogs]:
+    """Logs for a new run, or None if [logs] enabled = false in .relm.toml."""
+    logs_config = config.get("logs", {}) if isinstance(config, dict) else {}
+    if not logs_config.get("enabled", True):
+        return None
+    return RunLogs(root_path, keep=int(logs_config.get("keep", DEFAULT_KEEP_RUNS)))
+
+def list_runs(root_path: Path) -> List[str]:
+    """Run ids with logs, oldest first."""
+    directory = logs_root(root_path)
+    if not directory.is_dir():
+        return []
+    return sorted(entry.name for entry in os.scandir(directory) if entry.is_dir())
+
+def _pid_alive(pid: int) -> bool:
+    if os.name != "posix":
+        # No harmless probe (os.kill terminates on Windows); rely on the grace period
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def run_in_use(directory: Path, now: Optional[float] = None) -> bool:
+    """True if the run's directory changed within the grace period or its owner process is alive."""
+    now = time.time() if now is None else now
+    try:
+        if now - directory.stat().st_mtime < RUN_GRACE_SECONDS:
+            return True
+        owner = int((directory / OWNER_FILE_NAME).read_text())
+    except (OSError, ValueError):
+        return False
+    return _pid_alive(owner)
+
+def prune_runs(root_path: Path, keep: int, current: Optional[str] = None) -> int:
+    """
+    Removes all but the newest keep runs. current and runs that another
+    relm process may still be writing (see run_in_use) are never removed.
+    Returns the number removed.
+    """
+    runs = [run for run in list_runs(root_path) if run != current]
+    keep_others = max(0, keep - (1 if current else 0))
+    stale = runs[:max(0, len(runs) - keep_others)]
+    now = time.time()
+    removed = 0
+    for run in stale:
+        directory = logs_root(root_path) / run
+        if run_in_use(directory, now):
+            continue
+        shutil.rmtree(directory, ignore_errors=True)
+        removed += 1
+    return removed
+
+def find_log(root_path: Path, name: str, run_id: Optional[str] = None) -> Optional[Path]:
+    """The log of name in run_id, or in the newest run that has one."""
+    runs = [run_id] if run_id else reversed(list_runs(root_path))
+    for run in runs:
+        path = logs_root(root_path) / run / log_file_name(name)
+        if path.is_file():
+            return path
+    return None
+
+def iter_lines(path: Path, start: int = 0) -> Iterator[bytes]:
+    """
+    Yields the lines of a log from line start on, without their newline.
+    The file is memory-mapped, so only the pages being read are loaded.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos, line, size = 0, 0, len(mm)
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    end = size
+                if line >= start:
+                    yield mm[pos:end]
+                pos, line = end + 1, line + 1
+
+def tail_lines(path: Path, count: int) -> List[bytes]:
+    """The last count lines of a log, found by scanning backwards through a memory map."""
+    with open(path, "rb") as f:
+        if count <= 0 or os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            if mm[end - 1:end] == b"\n":
+                end -= 1
+            lines: List[bytes] = []
+            while len(lines) < count:
+                start = mm.rfind(b"\n", 0, end)
+                lines.append(mm[start + 1:end])
+                if start == -1:
+                    break
+                end = start
+            return lines[::-1]
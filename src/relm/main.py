@@ -3,41 +3,19 @@
 import argparse
 import sys
 from pathlib import Path
-from rich.console import Console
+from typing import List, Optional
 
 from . import __version__
-from .banner import print_logo
-from .config import load_config
-from .commands import (
-    list_command,
-    release_command,
-    install_command,
-    run_command,
-    status_command,
-    verify_command,
-    clean_command,
-    create_command,
-    gc_command,
-    pytest_command,
-)
-
-# Export list_projects for backward compatibility if any tests rely on it,
-# though we should update tests to use the new structure.
-# But looking at tests/test_main.py, it imports list_projects directly.
-# So I will keep a wrapper or move the logic back?
-# No, "The Golden Rule: Functionality MUST remain identical."
-# If I remove `list_projects` from here, tests might break.
-# I should probably update the tests to point to the new location, or re-export it.
-# Re-exporting is safer for now.
-
-from .commands.list_command import execute as _list_execute
-# Adapting old signature to new logic if needed, but wait.
-# The tests import `list_projects` and call it with `path`.
-# The new `execute` takes `args` and `console`.
-# So I cannot simply re-export.
-# I will define a compatibility wrapper.
-
-console = Console()
+from .commands import COMMANDS, load_command
+
+# rich and the command modules are imported lazily: `relm --version` never
+# loads rich, and other invocations only import the selected subcommand.
+
+VERSION_FLAGS = ("--version", "-v")
+
+def _console():
+    from rich.console import Console
+    return Console()
 
 def list_projects(path: Path):
     """
@@ -46,20 +24,48 @@ def list_projects(path: Path):
     """
     # Create a dummy args object
     args = argparse.Namespace(path=str(path), since=None)
-    list_command.execute(args, console)
-
-
-def main():
-    print_logo()
+    load_command("list").execute(args, _console())
 
-    # Load config early
-    # We don't have args yet, so we assume current dir for config search
-    # or we can do a partial parse?
-    # For now, let's load from CWD
-    cwd = Path.cwd()
-    config = load_config(cwd)
-
-    # Base parser for shared arguments
+def _wants_version(argv: List[str], base_parser: argparse.ArgumentParser) -> bool:
+    """
+    True if --version/-v is given before the subcommand. Options are matched
+    the way argparse does (including unique --prefixes) so that values such
+    as the one of `--path x` are skipped rather than taken for the command.
+    """
+    takes_value = {}
+    for action in base_parser._actions:
+        for option in action.option_strings:
+            takes_value[option] = action.nargs != 0
+    for option in VERSION_FLAGS:
+        takes_value[option] = False
+
+    skip = False
+    for token in argv:
+        if skip:
+            skip = False
+            continue
+        if token == "--" or not token.startswith("-") or token == "-":
+            return False
+        option = token.split("=", 1)[0]
+        if option not in takes_value and option.startswith("--"):
+            matches = [name for name in takes_value if name.startswith(option)]
+            option = matches[0] if len(matches) == 1 else option
+        if option in VERSION_FLAGS:
+            return True
+        skip = takes_value.get(option, False) and "=" not in token
+    return False
+
+def _wants_quiet(argv: List[str]) -> bool:
+    """True if --quiet is given before a `--` separator (the banner prints before parsing)."""
+    for token in argv:
+        if token == "--":
+            return False
+        if token == "--quiet":
+            return True
+    return False
+
+def _build_base_parser() -> argparse.ArgumentParser:
+    """Shared arguments, accepted both before and after the subcommand."""
     base_parser = argparse.ArgumentParser(add_help=False)
     base_parser.add_argument(
         "--path",
@@ -86,7 +92,19 @@ def main():
         "--jobs", "-j",
         type=int,
         default=None,
-        help="Number of parallel jobs (default: number of CPUs)."
+        help="Number of parallel jobs with --parallel (default: the number of CPUs for run, pytest, install and pipeline; 4 x CPUs, at most 32, for the I/O bound status, verify and gc)."
+    )
+    base_parser.add_argument(
+        "--backend",
+        choices=["thread", "asyncio", "select"],
+        default="thread",
+        help="Parallel execution backend: a thread per running task, one asyncio event loop, or one selector loop over all output pipes (default: thread)."
+    )
+    base_parser.add_argument(
+        "--discovery",
+        choices=["auto", "walk", "git"],
+        default="auto",
+        help="How to find projects: scan the filesystem, list files with git (respects .gitignore), or git when the root has a .git (default: auto)."
     )
     base_parser.add_argument(
         "--from-root",
@@ -106,42 +124,78 @@ def main():
         default=None,
         help="Include the project at the root path in the operation (even in recursive mode)."
     )
+    base_parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Ignore the on-disk project index and re-parse every pyproject.toml."
+    )
+    base_parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print the banner (also skipped when output is not a terminal or RELM_NO_BANNER is set)."
+    )
+
+    return base_parser
 
+def _build_parser(base_parser: argparse.ArgumentParser, selected: Optional[str]) -> argparse.ArgumentParser:
+    """
+    Builds the CLI parser. Only the selected subcommand's module is imported
+    and registered; every other command gets a placeholder so it still shows
+    up in `relm --help`.
+    """
     parser = argparse.ArgumentParser(
         description="Manage releases and versioning for local Python projects.",
         parents=[base_parser]
     )
     parser.add_argument(
-        "--version", "-v",
+        *VERSION_FLAGS,
         action="version",
         version=f"relm {__version__}"
     )
-    
+
+    # To allow the shared flags AFTER the command, each subparser inherits base_parser.
     subparsers = parser.add_subparsers(dest="command")
-    
-    # We pass the base_parser to commands if they need to inherit it
-    # or just use it in the registration process.
-    # However, to allow the flags AFTER the command, the subparser itself needs them.
-    # So we define a function to register with inheritance.
-
-    def add_cmd(name, help_text):
-        return subparsers.add_parser(name, help=help_text, parents=[base_parser])
-
-    # Each register function now needs to be aware or we just update the register calls.
-    # Let's see how register is defined in commands.
-    # e.g. list_command.register(subparsers)
-    
-    # Register commands
-    list_command.register(subparsers, base_parser)
-    release_command.register(subparsers, base_parser)
-    install_command.register(subparsers, base_parser)
-    run_command.register(subparsers, base_parser)
-    status_command.register(subparsers, base_parser)
-    verify_command.register(subparsers, base_parser)
-    clean_command.register(subparsers, base_parser)
-    create_command.register(subparsers, base_parser)
-    gc_command.register(subparsers, base_parser)
-    pytest_command.register(subparsers, base_parser)
+    for name, spec in COMMANDS.items():
+        if name == selected:
+            load_command(name).register(subparsers, base_parser)
+        else:
+            subparsers.add_parser(name, help=spec.help, parents=[base_parser])
+    return parser
+
+def _selected_command(base_parser: argparse.ArgumentParser) -> Optional[str]:
+    """Finds the subcommand name with a help-less pre-parse of the command line."""
+    pre_parser = argparse.ArgumentParser(add_help=False, parents=[base_parser])
+    subparsers = pre_parser.add_subparsers(dest="command")
+    for name in COMMANDS:
+        subparsers.add_parser(name, add_help=False)
+    try:
+        pre_args, _ = pre_parser.parse_known_args()
+    except SystemExit:
+        # Let the real parser report the error
+        return None
+    command = getattr(pre_args, "command", None)
+    return command if isinstance(command, str) and command in COMMANDS else None
+
+def main():
+    base_parser = _build_base_parser()
+    if _wants_version(sys.argv[1:], base_parser):
+        sys.stdout.write(f"relm {__version__}\n")
+        sys.exit(0)
+
+    from .banner import print_logo, should_print_logo
+    from .config import load_config
+
+    if should_print_logo(quiet=_wants_quiet(sys.argv[1:])):
+        print_logo()
+
+    # Load config early
+    # We don't have args yet, so we assume current dir for config search
+    # or we can do a partial parse?
+    # For now, let's load from CWD
+    cwd = Path.cwd()
+    config = load_config(cwd)
+
+    parser = _build_parser(base_parser, _selected_command(base_parser))
 
     args, unknown = parser.parse_known_args()
 
@@ -156,6 +210,7 @@ def main():
     root_path = Path(args.path).resolve()
 
     # Safety check for root directory
+    console = _console()
     if root_path == Path(root_path.anchor):
         console.print(f"[bold red]⚠️  Safety Warning: You are running relm in the system root ({root_path}).[/bold red]")
         console.print("[red]This is highly discouraged and may cause performance issues or unintended side effects.[/red]")
@@ -0,0 +1,133 @@
+# src/relm/pipeline.py
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple, Union
+
+from .core import Project
+
+# Prefix of a task dependency that refers to the same task of the project's
+# dependencies rather than of the project itself, e.g. "^build".
+UPSTREAM = "^"
+# Separator between project and task in the name of a pipeline node.
+NODE_SEPARATOR = ":"
+
+@dataclass
+class TaskSpec:
+    name: str
+    command: Union[str, List[str]]
+    depends: List[str] = field(default_factory=list)
+
+def load_tasks(config: Dict[str, Any]) -> Dict[str, TaskSpec]:
+    """
+    Reads the [tasks.<name>] tables of .relm.toml:
+
+        [tasks.build]
+        command = "pip install -e ."
+        [tasks.test]
+        command = ["python", "-m", "pytest"]
+        depends = ["^build", "lint"]
+
+    "lint" runs the project's own lint task first; "^build" runs the build
+    task of every workspace project it depends on first.
+    Raises ValueError for malformed tables or unknown/cyclic dependencies.
+    """
+    raw = config.get("tasks", {}) if isinstance(config, dict) else {}
+    if not isinstance(raw, dict):
+        raise ValueError("[tasks] must be a table of task tables")
+
+    tasks: Dict[str, TaskSpec] = {}
+    for name, table in raw.items():
+        if NODE_SEPARATOR in name or name.startswith(UPSTREAM):
+            raise ValueError(f"Invalid task name '{name}'")
+        if not isinstance(table, dict):
+            raise ValueError(f"[tasks.{name}] must be a table")
+        command = table.get("command")
+        if not command or not isinstance(command, (str, list)):
+            raise ValueError(f"[tasks.{name}] needs a command (string or list)")
+        depends = table.get("depends", [])
+        if not isinstance(depends, list) or not all(isinstance(d, str) for d in depends):
+            raise ValueError(f"[tasks.{name}] depends must be a list of task names")
+        tasks[name] = TaskSpec(name, command, list(depends))
+
+    for spec in tasks.values():
+        for dep in spec.depends:
+            # Exactly one "^"; task names cannot start with one, so "^^build" is unknown
+            target = dep[len(UPSTREAM):] if dep.startswith(UPSTREAM) else dep
+            if target.startswith(UPSTREAM) or target not in tasks:
+                raise ValueError(f"Task '{spec.name}' depends on unknown task '{dep}'")
+    _check_local_cycles(tasks)
+    return tasks
+
+def _check_local_cycles(tasks: Dict[str, TaskSpec]):
+    """Same-project dependencies ("lint", not "^build") must not form a cycle."""
+    state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+    def visit(name: str, chain: List[str]):
+        if state.get(name) == 2:
+            return
+        if state.get(name) == 1:
+            raise ValueError(f"Task dependency cycle: {' -> '.join(chain + [name])}")
+        state[name] = 1
+        for dep in tasks[name].depends:
+            if not dep.startswith(UPSTREAM):
+                visit(dep, chain + [name])
+        state[name] = 2
+
+    for name in tasks:
+        visit(name, [])
+
+def node_name(project_name: str, task: str) -> str:
+    return f"{project_name}{NODE_SEPARATOR}{task}"
+
+def expand_pipeline(
+    task: str,
+    targets: List[Project],
+    all_projects: List[Project],
+    tasks: Dict[str, TaskSpec]
+) -> Tuple[List[Project], Dict[str, Tuple[Project, TaskSpec]]]:
+    """
+    Expands task on the target projects into a project x task DAG.
+
+    Each node is a Project named "<project>:<task>" whose dependencies are the
+    nodes it waits for, so the runner can schedule it like any project.
+    Upstream ("^") dependencies pull in tasks of workspace dependencies even
+    if those projects were not targeted. Returns the nodes in a stable order
+    (targets first, then pulled-in nodes in discovery order) and a map from
+    node name to its project and task.
+    """
+    if task not in tasks:
+        raise ValueError(f"Unknown task '{task}'. Defined tasks: {', '.join(sorted(tasks)) or 'none'}")
+
+    by_key = {p.name.lower(): p for p in all_projects}
+    nodes: Dict[str, Project] = {}
+    owners: Dict[str, Tuple[Project, TaskSpec]] = {}
+    stack = [(p, task) for p in reversed(targets)]
+    while stack:
+        project, task_name = stack.pop()
+        name = node_name(project.name, task_name)
+        if name in nodes:
+            continue
+        spec = tasks[task_name]
+        deps: List[str] = []
+        pending: List[Tuple[Project, str]] = []
+        for dep in spec.depends:
+            if dep.startswith(UPSTREAM):
+                upstream_task = dep[len(UPSTREAM):]
+                for dep_name in project.dependencies:
+                    upstream = by_key.get(dep_name.lower())
+                    if upstream is not None and upstream.name != project.name:
+                        pending.append((upstream, upstream_task))
+            else:
+                pending.append((project, dep))
+        for dep_project, dep_task in pending:
+            deps.append(node_name(dep_project.name, dep_task))
+        nodes[name] = Project(
+            name=name,
+            version=project.version,
+            path=project.path,
+            description=f"{task_name} of {project.name}",
+            dependencies=deps
+        )
+        owners[name] = (project, spec)
+        stack.extend(reversed(pending))
+    return list(nodes.values()), owners
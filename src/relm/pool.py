@@ -0,0 +1,30 @@
+# src/relm/pool.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+def map_bounded(func: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None) -> List[R]:
+    """
+    Applies func to every item on a bounded thread pool and returns the
+    results in input order. With max_workers=1 (or fewer than two items) the
+    calls run inline, so serial callers get the exact previous behavior.
+    Exceptions raised by func propagate to the caller.
+    """
+    items = list(items)
+    if max_workers == 1 or len(items) < 2:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+def workers_for(args) -> int:
+    """
+    Returns the pool size for an I/O bound command: --jobs (or a multiple of
+    the CPU count) with --parallel, otherwise 1.
+    """
+    if not getattr(args, "parallel", False):
+        return 1
+    return getattr(args, "jobs", None) or min(32, (os.cpu_count() or 1) * 4)
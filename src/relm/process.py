@@ -0,0 +1,40 @@
+# src/relm/process.py
+
+import os
+import signal
+import subprocess
+import threading
+from typing import Any, Dict
+
+# Seconds between SIGTERM and SIGKILL when a task's process group is terminated
+KILL_GRACE_SECONDS = 5.0
+
+def _signal_group(pid: int, sig: int):
+    try:
+        os.killpg(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+def terminate_process_group(pid: int, grace: float = KILL_GRACE_SECONDS):
+    """
+    Sends SIGTERM to the process group led by pid and, if anything in the
+    group is still alive after grace seconds, SIGKILL. Does not block.
+    """
+    if os.name != "posix":
+        # Children are started with CREATE_NEW_PROCESS_GROUP; /T kills the tree.
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)], capture_output=True, check=False)
+        return
+    _signal_group(pid, signal.SIGTERM)
+    killer = threading.Timer(grace, _signal_group, (pid, signal.SIGKILL))
+    killer.daemon = True
+    killer.start()
+
+def process_group_kwargs() -> Dict[str, Any]:
+    """
+    Popen arguments that put the child (and its children) in a new process
+    group. On POSIX this is a new session, which also detaches the child
+    from the controlling terminal: it cannot prompt and does not get Ctrl-C.
+    """
+    if os.name == "posix":
+        return {"start_new_session": True}
+    return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
@@ -1,25 +1,213 @@
+import asyncio
 import subprocess
 import os
+import heapq
+import queue
+import selectors
 import threading
 import sys
 import time
 from pathlib import Path
 from collections import deque
-from typing import List, Dict, Any, Callable, Optional, Set
-from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TaskID
 from rich.table import Table
 from rich.live import Live
 from .core import Project
+from .cache import TaskCache
+from .trace import Tracer, maybe_span
+from .history import DurationHistory, critical_paths, fill_unknown
+from .logs import RunLogs, open_log
+from .process import KILL_GRACE_SECONDS, process_group_kwargs, terminate_process_group
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 console = Console()
 
-def run_project_command_tail(project_path: Path, command: str, tail_lines: int = 50, timeout: int = 600, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+BACKENDS = ("thread", "asyncio", "select")
+
+class CancelToken:
+    """
+    Shared cancellation switch for a batch of tasks. Running tasks register a
+    kill callback; cancel() invokes every callback (which kills the task's
+    process group), and tasks that register afterwards are killed at once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+        self.cancelled = False
+
+    def register(self, callback: Callable[[], None]) -> int:
+        with self._lock:
+            handle = self._next_id
+            self._next_id += 1
+            if not self.cancelled:
+                self._callbacks[handle] = callback
+                return handle
+        callback()
+        return handle
+
+    def unregister(self, handle: int):
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+    def cancel(self):
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+        for callback in callbacks:
+            callback()
+
+class _Termination:
+    """Records why a task's process group was killed (first reason wins)."""
+
+    def __init__(self, grace: float):
+        self.grace = grace
+        self.reason: Optional[str] = None
+        self.pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def kill(self, reason: str):
+        with self._lock:
+            if self.reason is not None or self.pid is None:
+                return
+            self.reason = reason
+        terminate_process_group(self.pid, self.grace)
+
+    def annotate(self, result: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        result["timed_out"] = self.reason == "timeout"
+        result["cancelled"] = self.reason == "cancelled"
+        if self.reason == "timeout":
+            note = f"relm: timed out after {timeout:g}s, process group terminated"
+        elif self.reason == "cancelled":
+            note = "relm: cancelled (fail-fast), process group terminated"
+        else:
+            return result
+        result["stdout"] = f"{result['stdout']}\n{note}" if result["stdout"] else note
+        return result
+
+USAGE_KEYS = ("cpu_user", "cpu_sys", "max_rss")
+
+def _usage_from_rusage(ru) -> Dict[str, Any]:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = ru.ru_maxrss if sys.platform == "darwin" else ru.ru_maxrss * 1024
+    return {"cpu_user": ru.ru_utime, "cpu_sys": ru.ru_stime, "max_rss": max_rss}
+
+def wait_with_usage(process: subprocess.Popen) -> Tuple[int, Dict[str, Any]]:
+    """
+    Waits for process and returns (exit code, usage). Usage holds user and
+    system CPU seconds and peak RSS in bytes of the child and every
+    descendant it waited for, collected with os.wait4. The values are None
+    where wait4 is unavailable.
+    """
+    if hasattr(os, "wait4") and process.returncode is None:
+        try:
+            _, status, ru = os.wait4(process.pid, 0)
+        except ChildProcessError:
+            pass  # Reaped elsewhere; fall back to Popen's bookkeeping
+        else:
+            process.returncode = os.waitstatus_to_exitcode(status)
+            return process.returncode, _usage_from_rusage(ru)
+    return process.wait(), dict.fromkeys(USAGE_KEYS)
+
+@contextmanager
+def child_usage():
+    """
+    Measures children reaped inside the block via RUSAGE_CHILDREN, for
+    commands run with subprocess.run one at a time. Yields a dict that is
+    filled in on exit. Peak RSS is only known if it exceeds every earlier
+    child's, and is None otherwise.
+    """
+    usage: Dict[str, Any] = dict.fromkeys(USAGE_KEYS)
+    if resource is None:
+        yield usage
+        return
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    try:
+        yield usage
+    finally:
+        after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        usage["cpu_user"] = after.ru_utime - before.ru_utime
+        usage["cpu_sys"] = after.ru_stime - before.ru_stime
+        if after.ru_maxrss > before.ru_maxrss:
+            usage["max_rss"] = _usage_from_rusage(after)["max_rss"]
+
+def add_usage_columns(table: Table):
+    """Adds the CPU and peak memory columns filled by usage_cells()."""
+    table.add_column("CPU user", justify="right")
+    table.add_column("CPU sys", justify="right")
+    table.add_column("Max RSS", justify="right")
+
+def usage_cells(result: Dict[str, Any]) -> List[str]:
+    """Formats a result's resource usage; '-' where it is unknown (e.g. cache hits)."""
+    cells = []
+    for key in ("cpu_user", "cpu_sys"):
+        value = result.get(key)
+        cells.append("-" if value is None else f"{value:.2f}s")
+    max_rss = result.get("max_rss")
+    cells.append("-" if max_rss is None else f"{max_rss / (1024 * 1024):.1f} MB")
+    return cells
+
+def resolve_timeout(args, config: Dict[str, Any], command_name: str) -> Optional[float]:
+    """
+    Per-task timeout in seconds for a command: --timeout wins, then
+    [timeouts] <command_name>, then [timeouts] default in .relm.toml.
+    None (or 0) means no limit.
+    """
+    value = getattr(args, "timeout", None)
+    if value is None:
+        timeouts = config.get("timeouts", {}) if isinstance(config, dict) else {}
+        value = timeouts.get(command_name, timeouts.get("default"))
+    if not value:
+        return None
+    return float(value)
+
+def failure_label(result: Dict[str, Any], default: str) -> str:
+    """Summary status for a failed task: TIMEOUT, CANCELLED, SKIPPED or default."""
+    if result.get("timed_out"):
+        return "TIMEOUT"
+    if result.get("cancelled"):
+        return "CANCELLED"
+    if result.get("skipped"):
+        return "SKIPPED"
+    return default
+
+def run_project_command_tail(
+    project_path: Path,
+    command: str,
+    tail_lines: int = 50,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+    cancel_token: Optional[CancelToken] = None,
+    grace: float = KILL_GRACE_SECONDS,
+    log_path: Optional[Path] = None
+) -> Dict[str, Any]:
     """
     Runs a command and only keeps the last N lines of output to prevent memory/buffer overflow.
+    With log_path, the full output is also written to that file.
+
+    The command runs in its own process group. If it is still running after
+    timeout seconds, or cancel_token is cancelled, the whole group receives
+    SIGTERM and then SIGKILL after grace seconds; the result then has
+    "timed_out" or "cancelled" set.
+
+    The result also reports the command's CPU time and peak RSS (see
+    wait_with_usage).
     """
     output_tail = deque(maxlen=tail_lines)
+    termination = _Termination(grace)
+    log = None
     
     # Merge with current environment if env is provided
     run_env = os.environ.copy()
@@ -27,6 +215,7 @@ def run_project_command_tail(project_path: Path, command: str, tail_lines: int =
         run_env.update(env)
     
     try:
+        log = open_log(log_path) if log_path is not None else None
         process = subprocess.Popen(
             command,
             cwd=project_path,
@@ -35,22 +224,44 @@ def run_project_command_tail(project_path: Path, command: str, tail_lines: int =
             stderr=subprocess.STDOUT,
             text=True,
             bufsize=1,
-            env=run_env
+            env=run_env,
+            **process_group_kwargs()
         )
-        
-        while True:
-            line = process.stdout.readline()
-            if not line and process.poll() is not None:
-                break
-            if line:
+        termination.pid = process.pid
+
+        watchdog = None
+        if timeout is not None:
+            watchdog = threading.Timer(timeout, termination.kill, ("timeout",))
+            watchdog.daemon = True
+            watchdog.start()
+        handle = cancel_token.register(lambda: termination.kill("cancelled")) if cancel_token else None
+
+        try:
+            while True:
+                line = process.stdout.readline()
+                if not line:
+                    break
+                if log is not None:
+                    log.write(line.encode("utf-8", "replace"))
                 output_tail.append(line.strip())
-        
-        returncode = process.poll()
-        return {
+            returncode, usage = wait_with_usage(process)
+        except BaseException:
+            # The child is in its own session, so Ctrl-C never reaches it directly.
+            termination.kill("cancelled")
+            raise
+        finally:
+            process.stdout.close()
+            if watchdog is not None:
+                watchdog.cancel()
+            if handle is not None:
+                cancel_token.unregister(handle)
+
+        return termination.annotate({
             "returncode": returncode,
             "stdout": "\n".join(output_tail),
-            "stderr": ""
-        }
+            "stderr": "",
+            **usage
+        }, timeout)
         
     except Exception as e:
         return {
@@ -58,36 +269,591 @@ def run_project_command_tail(project_path: Path, command: str, tail_lines: int =
             "stdout": f"Error: {str(e)}",
             "stderr": ""
         }
+    finally:
+        if log is not None:
+            log.close()
 
-def run_project_command(project_path: Path, command: str, capture_output: bool = False) -> bool:
+def run_project_command(project_path: Path, command: str, capture_output: bool = False, timeout: Optional[float] = None) -> bool:
     """
     Backward compatibility wrapper.
     """
-    res = run_project_command_tail(project_path, command, tail_lines=50 if capture_output else 1000)
+    res = run_project_command_tail(project_path, command, tail_lines=50 if capture_output else 1000, timeout=timeout)
     return res["returncode"] == 0
 
+class DependencyScheduler:
+    """
+    Indegree-counting ready queue over the in-workspace dependency graph.
+
+    A project becomes ready once every dependency it has inside the given
+    project list has completed (successfully or not). Ready projects are
+    handed out in the order of the input list or, when expected durations
+    are given, longest critical path first (the project's duration plus its
+    longest chain of dependents), so long chains start as early as possible.
+    """
+
+    def __init__(self, projects: List[Project], durations: Optional[Dict[str, float]] = None):
+        self.order = {p.name: i for i, p in enumerate(projects)}
+        names_by_key = {p.name.lower(): p.name for p in projects}
+
+        self.dependents: Dict[str, List[str]] = {p.name: [] for p in projects}
+        self.indegree: Dict[str, int] = {}
+        for p in projects:
+            deps = {names_by_key[d.lower()] for d in p.dependencies if d.lower() in names_by_key}
+            deps.discard(p.name)
+            self.indegree[p.name] = len(deps)
+            for dep in deps:
+                self.dependents[dep].append(p.name)
+
+        self.priority: Dict[str, float] = critical_paths(self.dependents, durations) if durations else {}
+        self.unreleased: Set[str] = set(self.order)
+        self._ready: List[Tuple[float, int, str]] = []
+        for p in projects:
+            if self.indegree[p.name] == 0:
+                self._push(p.name)
+
+    def _push(self, name: str):
+        heapq.heappush(self._ready, (-self.priority.get(name, 0.0), self.order[name], name))
+
+    def pop_ready(self) -> Optional[str]:
+        """Returns the next ready project name, or None if nothing is ready."""
+        while self._ready:
+            _, _, name = heapq.heappop(self._ready)
+            if name in self.unreleased:
+                self.unreleased.discard(name)
+                return name
+        return None
+
+    def complete(self, name: str) -> List[str]:
+        """Marks a project as finished and returns the dependents that became ready."""
+        released = []
+        for dependent in self.dependents[name]:
+            self.indegree[dependent] -= 1
+            if self.indegree[dependent] == 0 and dependent in self.unreleased:
+                self._push(dependent)
+                released.append(dependent)
+        return released
+
+    def break_cycle(self) -> Optional[str]:
+        """
+        Force-releases the first blocked project. Only called when nothing is
+        ready or running, which means the remaining projects form a cycle.
+        """
+        if not self.unreleased:
+            return None
+        name = min(self.unreleased, key=self.order.__getitem__)
+        self.unreleased.discard(name)
+        return name
+
+    def has_unreleased(self) -> bool:
+        return bool(self.unreleased)
+
+def simulate_makespan(projects: List[Project], durations: Dict[str, float], max_workers: int) -> float:
+    """
+    Wall-clock a run would take if every project took exactly its expected
+    duration, scheduled the way execute_in_parallel does.
+    """
+    scheduler = DependencyScheduler(projects, durations)
+    clock = 0.0
+    running: List[Tuple[float, str]] = []
+    while True:
+        while len(running) < max_workers:
+            name = scheduler.pop_ready()
+            if name is None and not running:
+                name = scheduler.break_cycle()
+            if name is None:
+                break
+            heapq.heappush(running, (clock + durations.get(name, 0.0), name))
+        if not running:
+            return clock
+        clock, name = heapq.heappop(running)
+        scheduler.complete(name)
+
+class TailBuffer:
+    """
+    Keeps the last max_lines lines of a byte stream fed in arbitrary chunks.
+    Each chunk is split from the right, so only the lines that can end up in
+    the tail are materialized no matter how large the chunk is.
+    """
+
+    def __init__(self, max_lines: int, max_partial_bytes: int = 1 << 20):
+        self.max_lines = max_lines
+        self.max_partial_bytes = max_partial_bytes
+        self.lines: deque = deque(maxlen=max_lines)
+        self.partial = b""
+
+    def feed(self, data: bytes):
+        if not data:
+            return
+        data = self.partial + data
+        parts = data.rsplit(b"\n", self.max_lines)
+        self.partial = parts.pop()[-self.max_partial_bytes:]
+        if len(parts) == self.max_lines and b"\n" in parts[0]:
+            # The split limit was reached: the head holds older lines too
+            parts[0] = parts[0].rsplit(b"\n", 1)[1]
+        self.lines.extend(parts)
+
+    def text(self) -> str:
+        """Returns the tail as stripped lines, like run_project_command_tail."""
+        lines = list(self.lines)
+        if self.partial:
+            lines.append(self.partial)
+        return "\n".join(line.decode("utf-8", "replace").strip() for line in lines[-self.max_lines:])
+
+class _MultiplexedTask:
+    def __init__(self, key, process: subprocess.Popen, tail: TailBuffer, termination: "_Termination", timeout: Optional[float]):
+        self.key = key
+        self.process = process
+        self.tail = tail
+        self.termination = termination
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.cancel_handle: Optional[int] = None
+        self.log: Optional[BinaryIO] = None
+        self.next_reap = 0.0
+        self.reap_delay = 0.001
+
+class OutputMultiplexer:
+    """
+    Runs many commands from a single thread. Every child's stdout pipe is
+    registered with one selector (epoll/kqueue) and read in chunk_size blocks
+    into that task's TailBuffer, so nothing is decoded or split per line
+    until the task ends and only its last tail_lines lines are turned into
+    text. POSIX only: Windows pipes cannot be selected.
+
+    Timeouts and cancel_token behave as in run_project_command_tail. A child
+    is reaped with wait4 once its pipe closes; if it outlives its stdout it
+    is polled with a short backoff instead of blocking the loop. Other
+    threads can interrupt a waiting poll() with wake().
+    """
+
+    def __init__(
+        self,
+        tail_lines: int = 50,
+        chunk_size: int = 1 << 16,
+        cancel_token: Optional[CancelToken] = None,
+        grace: float = KILL_GRACE_SECONDS
+    ):
+        self.tail_lines = tail_lines
+        self.chunk_size = chunk_size
+        self.cancel_token = cancel_token
+        self.grace = grace
+        self.selector = selectors.DefaultSelector()
+        self.tasks: Dict[Any, _MultiplexedTask] = {}
+        self._reaping: List[_MultiplexedTask] = []
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        os.set_blocking(self._wake_write, False)
+        self.selector.register(self._wake_read, selectors.EVENT_READ, None)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def start(
+        self,
+        key,
+        command,
+        cwd: Path,
+        env: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        log_path: Optional[Path] = None
+    ):
+        """
+        Spawns command; its result is later returned by poll() under key.
+        With log_path, the full output is also written to that file.
+        Raises OSError if it cannot start.
+        """
+        run_env = os.environ.copy()
+        if env:
+            run_env.update(env)
+        log = open_log(log_path) if log_path is not None else None
+        try:
+            process = subprocess.Popen(
+                command, cwd=cwd, shell=isinstance(command, str),
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=run_env, **process_group_kwargs()
+            )
+        except BaseException:
+            if log is not None:
+                log.close()
+            raise
+        termination = _Termination(self.grace)
+        termination.pid = process.pid
+        task = _MultiplexedTask(key, process, TailBuffer(self.tail_lines), termination, timeout)
+        task.log = log
+        self.tasks[key] = task
+        self.selector.register(process.stdout.fileno(), selectors.EVENT_READ, task)
+        if self.cancel_token is not None:
+            task.cancel_handle = self.cancel_token.register(lambda: termination.kill("cancelled"))
+
+    def _wait_time(self) -> Optional[float]:
+        now = time.monotonic()
+        times = [t.deadline for t in self.tasks.values() if t.deadline is not None]
+        times.extend(t.next_reap for t in self._reaping)
+        return max(0.0, min(times) - now) if times else None
+
+    def _reap(self, task: _MultiplexedTask) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Exit code and usage if the child has exited, without blocking."""
+        if hasattr(os, "wait4") and task.process.returncode is None:
+            try:
+                pid, status, ru = os.wait4(task.process.pid, os.WNOHANG)
+            except ChildProcessError:
+                return task.process.wait(), dict.fromkeys(USAGE_KEYS)
+            if pid == 0:
+                return None
+            task.process.returncode = os.waitstatus_to_exitcode(status)
+            return task.process.returncode, _usage_from_rusage(ru)
+        returncode = task.process.poll()
+        return None if returncode is None else (returncode, dict.fromkeys(USAGE_KEYS))
+
+    def _finish(self, task: _MultiplexedTask, returncode: int, usage: Dict[str, Any]) -> Dict[str, Any]:
+        del self.tasks[task.key]
+        if task.cancel_handle is not None:
+            self.cancel_token.unregister(task.cancel_handle)
+        return task.termination.annotate({
+            "returncode": returncode,
+            "stdout": task.tail.text(),
+            "stderr": "",
+            **usage
+        }, task.timeout)
+
+    def wake(self):
+        """Makes a waiting poll() return; safe to call from any thread."""
+        try:
+            os.write(self._wake_write, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # a wake-up is already pending, or the multiplexer is closed
+
+    def poll(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        """
+        Waits until at least one task has finished or wake() was called and
+        returns the finished (key, result) pairs, possibly none.
+        """
+        finished: List[Tuple[Any, Dict[str, Any]]] = []
+        woken = False
+        while self.tasks and not finished and not woken:
+            events = self.selector.select(self._wait_time())
+
+            for selector_key, _ in events:
+                task = selector_key.data
+                if task is None:
+                    try:
+                        while os.read(self._wake_read, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    woken = True
+                    continue
+                data = os.read(selector_key.fd, self.chunk_size)
+                if data:
+                    task.tail.feed(data)
+                    if task.log is not None:
+                        task.log.write(data)
+                    continue
+                self.selector.unregister(selector_key.fd)
+                task.process.stdout.close()
+                if task.log is not None:
+                    task.log.close()
+                self._reaping.append(task)
+
+            now = time.monotonic()
+            for task in self.tasks.values():
+                if task.deadline is not None and now >= task.deadline:
+                    task.deadline = None
+                    task.termination.kill("timeout")
+
+            still_reaping = []
+            for task in self._reaping:
+                reaped = self._reap(task) if now >= task.next_reap else None
+                if reaped is None:
+                    if now >= task.next_reap:
+                        task.next_reap = now + task.reap_delay
+                        task.reap_delay = min(task.reap_delay * 2, 0.05)
+                    still_reaping.append(task)
+                else:
+                    finished.append((task.key, self._finish(task, *reaped)))
+            self._reaping = still_reaping
+        return finished
+
+    def kill_all(self, reason: str = "cancelled"):
+        for task in list(self.tasks.values()):
+            task.termination.kill(reason)
+
+    def close(self):
+        """Releases pipes and the selector; running children are killed and reaped."""
+        self.kill_all()
+        for task in list(self.tasks.values()):
+            if not task.process.stdout.closed:
+                task.process.stdout.close()
+            if task.log is not None:
+                task.log.close()
+            task.process.wait()
+        self.tasks.clear()
+        self._reaping = []
+        self.selector.close()
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+def _cache_lookup(
+    task_cache: Optional[TaskCache],
+    project: Project,
+    command,
+    cwd: Path
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Returns (cache key or None, replayed result on a hit)."""
+    if task_cache is None:
+        return None, None
+    key = task_cache.key_for(project, command, cwd)
+    entry = task_cache.get(key)
+    if entry is None:
+        return key, None
+    return key, {
+        "returncode": entry["returncode"],
+        "stdout": entry.get("stdout", ""),
+        "stderr": entry.get("stderr", ""),
+        "cached": True
+    }
+
+def _log_replay(log_path: Optional[Path], hit: Dict[str, Any]):
+    """Writes the stored output tail of a cache hit to the task's log."""
+    if log_path is None:
+        return
+    with open_log(log_path) as log:
+        log.write(b"relm: inputs unchanged, replaying the cached output tail\n")
+        if hit["stdout"]:
+            log.write(hit["stdout"].encode("utf-8", "replace") + b"\n")
+
+def _cacheable(res_data: Dict[str, Any]) -> bool:
+    """Only successful runs are stored: a failure may be flaky or caused by the environment."""
+    return res_data.get("returncode") == 0 and not (res_data.get("timed_out") or res_data.get("cancelled"))
+
+def _cache_store(task_cache: Optional[TaskCache], key: Optional[str], res_data: Dict[str, Any], duration: float) -> Dict[str, Any]:
+    """Stores a fresh successful result under key and marks it uncached."""
+    if key is not None and _cacheable(res_data):
+        task_cache.put(key, dict(res_data, duration=duration))
+    res_data["cached"] = False
+    return res_data
+
+def run_with_cache(
+    task_cache: Optional[TaskCache],
+    project: Project,
+    command,
+    cwd: Path,
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None,
+    log_path: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Runs a project command through the task cache: a hit replays the stored
+    output tail and exit code instead of executing. The returned dict has the
+    same keys as run_project_command_tail plus "cached". Only successful
+    runs are stored; failed, timed out and cancelled ones run again next time.
+    """
+    key, hit = _cache_lookup(task_cache, project, command, cwd)
+    if hit is not None:
+        _log_replay(log_path, hit)
+        return hit
+
+    task_start = time.time()
+    res_data = run_project_command_tail(
+        cwd, command, tail_lines=50, timeout=timeout, env=env, cancel_token=cancel_token, log_path=log_path
+    )
+    return _cache_store(task_cache, key, res_data, time.time() - task_start)
+
+async def run_project_command_tail_async(
+    project_path: Path,
+    command,
+    tail_lines: int = 50,
+    env: Optional[Dict[str, str]] = None,
+    chunk_size: int = 1 << 16,
+    timeout: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None,
+    grace: float = KILL_GRACE_SECONDS,
+    log_path: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Asyncio counterpart of run_project_command_tail: output is read in
+    chunk_size blocks instead of line by line and only the last tail_lines
+    lines are kept. Timeouts, cancellation and log_path behave the same way.
+    """
+    run_env = os.environ.copy()
+    if env:
+        run_env.update(env)
+
+    tail = TailBuffer(tail_lines)
+    termination = _Termination(grace)
+    transport = None
+    log = None
+    try:
+        log = open_log(log_path) if log_path is not None else None
+        if hasattr(os, "wait4"):
+            # asyncio's child watcher reaps with waitpid, which discards the
+            # child's resource usage: spawn with Popen, read the pipe from the
+            # loop and reap with wait4 in a worker thread instead.
+            process = subprocess.Popen(
+                command, cwd=project_path, shell=isinstance(command, str),
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=run_env, **process_group_kwargs()
+            )
+            stdout = asyncio.StreamReader()
+            transport, _ = await asyncio.get_running_loop().connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(stdout), process.stdout
+            )
+            wait = lambda: asyncio.to_thread(wait_with_usage, process)
+        else:
+            spawn_kwargs = dict(
+                cwd=project_path, stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT, env=run_env, **process_group_kwargs()
+            )
+            if isinstance(command, str):
+                process = await asyncio.create_subprocess_shell(command, **spawn_kwargs)
+            else:
+                process = await asyncio.create_subprocess_exec(*command, **spawn_kwargs)
+            stdout = process.stdout
+
+            async def wait():
+                return await process.wait(), dict.fromkeys(USAGE_KEYS)
+        termination.pid = process.pid
+
+        async def consume():
+            while True:
+                chunk = await stdout.read(chunk_size)
+                if not chunk:
+                    break
+                tail.feed(chunk)
+                if log is not None:
+                    log.write(chunk)
+
+        handle = cancel_token.register(lambda: termination.kill("cancelled")) if cancel_token else None
+        try:
+            await asyncio.wait_for(consume(), timeout)
+        except asyncio.TimeoutError:
+            termination.kill("timeout")
+        except BaseException:
+            termination.kill("cancelled")
+            await wait()
+            raise
+        finally:
+            if handle is not None:
+                cancel_token.unregister(handle)
+
+        returncode, usage = await wait()
+        return termination.annotate({
+            "returncode": returncode,
+            "stdout": tail.text(),
+            "stderr": "",
+            **usage
+        }, timeout)
+
+    except Exception as e:
+        return {
+            "returncode": 1,
+            "stdout": f"Error: {str(e)}",
+            "stderr": ""
+        }
+    finally:
+        if transport is not None:
+            transport.close()
+        if log is not None:
+            log.close()
+
+async def run_with_cache_async(
+    task_cache: Optional[TaskCache],
+    project: Project,
+    command,
+    cwd: Path,
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None,
+    log_path: Optional[Path] = None
+) -> Dict[str, Any]:
+    """run_with_cache for the asyncio backend; cache I/O runs in a worker thread."""
+    key, hit = (None, None) if task_cache is None else await asyncio.to_thread(_cache_lookup, task_cache, project, command, cwd)
+    if hit is not None:
+        _log_replay(log_path, hit)
+        return hit
+
+    task_start = time.time()
+    res_data = await run_project_command_tail_async(
+        cwd, command, tail_lines=50, env=env, timeout=timeout, cancel_token=cancel_token, log_path=log_path
+    )
+    if key is not None and _cacheable(res_data):
+        await asyncio.to_thread(task_cache.put, key, dict(res_data, duration=time.time() - task_start))
+    res_data["cached"] = False
+    return res_data
+
 def execute_in_parallel(
     projects: List[Project],
     command_provider: Callable[[Project], List[str]],
     max_workers: Optional[int] = None,
     fail_fast: bool = False,
-    cwd: Optional[Path] = None
+    cwd: Optional[Path] = None,
+    task_cache: Optional[TaskCache] = None,
+    backend: str = "thread",
+    timeout: Optional[float] = None,
+    tracer: Optional[Tracer] = None,
+    history: Optional[DurationHistory] = None,
+    skip_failed_dependencies: bool = False,
+    run_logs: Optional[RunLogs] = None
 ) -> List[Dict[str, Any]]:
     """
     Parallel executor with live status table and crash protection.
+    If task_cache is given, tasks whose inputs are unchanged replay their
+    stored result instead of running.
+
+    Dependents are submitted as soon as their last dependency finishes:
+    worker completion callbacks feed an event queue that the scheduler
+    blocks on, so there is no polling interval between tasks.
+
+    backend="thread" runs each task on a pool thread that reads its output
+    line by line; backend="asyncio" drives all subprocesses from one event
+    loop and reads their output in large chunks; backend="select" runs every
+    subprocess from the scheduler thread itself through an OutputMultiplexer
+    (POSIX only, Windows falls back to "thread").
+
+    timeout limits each task's wall-clock in seconds. A task that exceeds it
+    has its whole process group terminated and is reported as timed out; with
+    fail_fast, the first failure also terminates every task still running,
+    which are then reported as cancelled.
+
+    With a tracer, each task is recorded as a span on the lane of the worker
+    slot that ran it, and the time it spent ready but waiting for a free slot
+    as a "queued" span.
+
+    With a duration history, ready projects are started longest critical
+    path first, successful non-cached durations are recorded (the caller
+    saves them), and the estimated makespan is reported next to the actual
+    one. Each result then carries "estimated_makespan".
+
+    With skip_failed_dependencies, a task whose dependency failed (or was
+    itself skipped) is not run but reported as failed with "skipped" set.
+
+    With run_logs, each task's full output is written to its own log file
+    while only the tail is kept in memory; results then carry "log_path".
     """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of: {', '.join(BACKENDS)}")
+
+    if backend == "select" and os.name == "nt":
+        backend = "thread"
+    if max_workers is None:
+        max_workers = os.cpu_count() or 4
+
     project_map = {p.name: p for p in projects}
-    deps = {p.name: [d for d in p.dependencies if d in project_map] for p in projects}
+    known: Dict[str, float] = history.estimates(project_map) if history is not None else {}
+    durations = fill_unknown(known, project_map) if known else None
+    estimated_makespan = simulate_makespan(projects, durations, max_workers) if durations else None
+    scheduler = DependencyScheduler(projects, durations)
     
     submitted: Set[str] = set()
     completed: Set[str] = set()
     failed: Set[str] = set()
+    cached: Set[str] = set()
+    timed_out: Set[str] = set()
+    cancelled: Set[str] = set()
+    skipped: Set[str] = set()
+    cancel_token = CancelToken()
     results: List[Dict[str, Any]] = []
     results_lock = threading.Lock()
     start_time_overall = time.time()
-    
-    if max_workers is None:
-        max_workers = os.cpu_count() or 4
 
     def get_status_table():
         table = Table(title="Parallel Execution Status", box=None, expand=True)
@@ -104,8 +870,16 @@ def execute_in_parallel(
                 if p.name in durations and durations[p.name] is not None:
                     duration_str = f"{durations[p.name]:.2f}s"
                 
-                if p.name in failed:
+                if p.name in timed_out:
+                    status = "[bold red]TIMEOUT[/bold red]"
+                elif p.name in cancelled:
+                    status = "[bold magenta]CANCELLED[/bold magenta]"
+                elif p.name in skipped:
+                    status = "[yellow]SKIPPED[/yellow]"
+                elif p.name in failed:
                     status = "[bold red]FAILED[/bold red]"
+                elif p.name in cached:
+                    status = "[bold cyan]CACHED[/bold cyan]"
                 elif p.name in completed:
                     status = "[bold green]FINISHED[/bold green]"
                 elif p.name in submitted:
@@ -115,18 +889,12 @@ def execute_in_parallel(
                 table.add_row(p.name, status, duration_str)
         return table
 
-    def run_task(project: Project):
-        task_start = time.time()
-        provider_res = command_provider(project)
-        if isinstance(provider_res, tuple):
-            cmd, task_env = provider_res
-        else:
-            cmd, task_env = provider_res, None
+    class StatusView:
+        # Rebuilt by Live on every auto-refresh, so the scheduler never has to wake up for display.
+        def __rich__(self):
+            return get_status_table()
 
-        task_cwd = cwd or project.path
-        res_data = run_project_command_tail(task_cwd, cmd, tail_lines=50, env=task_env)
-        task_duration = time.time() - task_start
-        
+    def record_result(project: Project, res_data: Dict[str, Any], task_duration: float):
         with results_lock:
             success = (res_data["returncode"] == 0)
             results.append({
@@ -136,12 +904,133 @@ def execute_in_parallel(
                 "stdout": res_data["stdout"],
                 "stderr": res_data["stderr"],
                 "returncode": res_data["returncode"],
-                "duration": task_duration
+                "duration": task_duration,
+                "cached": res_data.get("cached", False),
+                "timed_out": res_data.get("timed_out", False),
+                "cancelled": res_data.get("cancelled", False),
+                "skipped": res_data.get("skipped", False),
+                **{k: res_data.get(k) for k in USAGE_KEYS}
             })
+            log_path = log_path_for(project)
+            if log_path is not None and log_path.exists():
+                results[-1]["log_path"] = log_path
+            if res_data.get("skipped"):
+                skipped.add(project.name)
+            if res_data.get("cached"):
+                cached.add(project.name)
+            if res_data.get("timed_out"):
+                timed_out.add(project.name)
+            if res_data.get("cancelled"):
+                cancelled.add(project.name)
             if success:
                 completed.add(project.name)
             else:
                 failed.add(project.name)
+        if not success and fail_fast and not res_data.get("skipped"):
+            cancel_token.cancel()
+        if history is not None and success and not res_data.get("cached"):
+            history.record(project.name, task_duration)
+
+    # Dependencies inside the run of every project, for skip_failed_dependencies.
+    upstream: Dict[str, List[str]] = {name: [] for name in project_map}
+    for dep, dependents in scheduler.dependents.items():
+        for dependent in dependents:
+            upstream[dependent].append(dep)
+
+    def skip_result(project: Project) -> Optional[Dict[str, Any]]:
+        """The result of a task that must not run because a dependency failed, else None."""
+        if not skip_failed_dependencies:
+            return None
+        with results_lock:
+            blocked = [dep for dep in upstream[project.name] if dep in failed]
+        if not blocked:
+            return None
+        return {"returncode": 1, "stdout": f"Skipped: dependency failed: {', '.join(blocked)}", "stderr": "", "skipped": True}
+
+    def log_path_for(project: Project) -> Optional[Path]:
+        return run_logs.path_for(project.name) if run_logs is not None else None
+
+    def resolve_command(project: Project):
+        provider_res = command_provider(project)
+        if isinstance(provider_res, tuple):
+            return provider_res
+        return provider_res, None
+
+    # Tracing state, only touched when a tracer is given: when each project
+    # became ready, and which worker slot (trace lane) each running task holds.
+    ready_at: Dict[str, float] = {}
+    free_slots: List[int] = list(range(1, max_workers + 1))
+    slot_of: Dict[str, int] = {}
+    if tracer is not None:
+        ready_at = {name: tracer.now() for name, count in scheduler.indegree.items() if count == 0}
+
+    def trace_task(project: Project, start: float, res_data: Dict[str, Any]):
+        if tracer is None:
+            return
+        args = {"returncode": res_data["returncode"], "cached": res_data.get("cached", False)}
+        args["status"] = failure_label(res_data, "failed") if res_data["returncode"] else "ok"
+        args.update((k, res_data[k]) for k in USAGE_KEYS if res_data.get(k) is not None)
+        tracer.complete(project.name, start, tracer.now(), tid=slot_of[project.name], cat="task", args=args)
+
+    def run_task(project: Project):
+        task_start = time.time()
+        trace_start = tracer.now() if tracer is not None else 0.0
+        try:
+            res_data = skip_result(project)
+            if res_data is None:
+                cmd, task_env = resolve_command(project)
+                res_data = run_with_cache(
+                    task_cache, project, cmd, cwd or project.path,
+                    env=task_env, timeout=timeout, cancel_token=cancel_token, log_path=log_path_for(project)
+                )
+        except Exception as e:
+            res_data = {"returncode": 1, "stdout": f"Error: {str(e)}", "stderr": ""}
+        trace_task(project, trace_start, res_data)
+        record_result(project, res_data, time.time() - task_start)
+
+    async def run_task_async(project: Project):
+        task_start = time.time()
+        trace_start = tracer.now() if tracer is not None else 0.0
+        try:
+            res_data = skip_result(project)
+            if res_data is None:
+                cmd, task_env = resolve_command(project)
+                res_data = await run_with_cache_async(
+                    task_cache, project, cmd, cwd or project.path,
+                    env=task_env, timeout=timeout, cancel_token=cancel_token, log_path=log_path_for(project)
+                )
+        except Exception as e:
+            res_data = {"returncode": 1, "stdout": f"Error: {str(e)}", "stderr": ""}
+        trace_task(project, trace_start, res_data)
+        record_result(project, res_data, time.time() - task_start)
+
+    def next_ready(running: int) -> Optional[str]:
+        """Returns the next project to start, or None if no slot or project is available."""
+        if running >= max_workers or (fail_fast and failed):
+            return None
+        name = scheduler.pop_ready()
+        if name is None and running == 0:
+            name = scheduler.break_cycle()
+        if name is not None:
+            submitted.add(name)
+            if tracer is not None:
+                now = tracer.now()
+                slot = heapq.heappop(free_slots)
+                slot_of[name] = slot
+                tracer.async_span(f"{name} (queued)", name, ready_at.get(name, now), now, cat="queue",
+                                  args={"dependencies": list(project_map[name].dependencies)})
+                tracer.counter("tasks", {"running": running + 1})
+        return name
+
+    def finish(name: str, running: int):
+        """Releases dependents of a finished task; running is the count after it ended."""
+        released = scheduler.complete(name)
+        progress.advance(overall_task)
+        if tracer is not None:
+            now = tracer.now()
+            ready_at.update((dependent, now) for dependent in released)
+            heapq.heappush(free_slots, slot_of[name])
+            tracer.counter("tasks", {"running": running})
 
     progress = Progress(
         SpinnerColumn(),
@@ -153,47 +1042,161 @@ def execute_in_parallel(
     )
     overall_task = progress.add_task("[bold blue]Progress", total=len(projects))
 
-    # Live display shows the progress bar and the summary table
-    with Live(get_status_table(), console=console, refresh_per_second=4) as live:
+    def run_threads():
+        finished_events: "queue.Queue[str]" = queue.Queue()
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            running_futures = {}
-            
-            while len(completed | failed) < len(projects):
-                if fail_fast and failed:
+            running = 0
+
+            try:
+                while True:
+                    while (name := next_ready(running)) is not None:
+                        running += 1
+                        future = executor.submit(run_task, project_map[name])
+                        future.add_done_callback(lambda _f, n=name: finished_events.put(n))
+
+                    if running == 0:
+                        break
+
+                    name = finished_events.get()
+                    running -= 1
+                    finish(name, running)
+            except KeyboardInterrupt:
+                # Workers would otherwise keep the executor open until their children exit.
+                cancel_token.cancel()
+                raise
+
+    async def run_event_loop():
+        running: Set[asyncio.Task] = set()
+        while True:
+            while (name := next_ready(len(running))) is not None:
+                running.add(asyncio.create_task(run_task_async(project_map[name]), name=name))
+
+            if not running:
+                break
+
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                finish(task.get_name(), len(running))
+
+    def run_selector():
+        multiplexer = OutputMultiplexer(cancel_token=cancel_token)
+        # Tasks that finished without a subprocess (cache hits, skips, spawn errors)
+        immediate: List[Tuple[str, Dict[str, Any]]] = []
+        started: Dict[str, Tuple[float, float, Optional[str]]] = {}
+        # Cache keys hash files and run git, so they are computed (and results
+        # stored) off the loop thread; finished lookups come back through this
+        # queue and wake().
+        lookups: "queue.Queue[Tuple[Project, Any, Optional[Dict[str, str]], Any]]" = queue.Queue()
+        lookup_pool = ThreadPoolExecutor(max_workers=min(4, max_workers or 4)) if task_cache is not None else None
+
+        def lookup(project: Project, cmd, task_env: Optional[Dict[str, str]]):
+            try:
+                outcome = _cache_lookup(task_cache, project, cmd, cwd or project.path)
+                if outcome[1] is not None:
+                    _log_replay(log_path_for(project), outcome[1])
+            except Exception as e:
+                outcome = e
+            lookups.put((project, cmd, task_env, outcome))
+            multiplexer.wake()
+
+        def spawn(project: Project, cmd, task_env: Optional[Dict[str, str]]):
+            try:
+                multiplexer.start(
+                    project.name, cmd, cwd or project.path,
+                    env=task_env, timeout=timeout, log_path=log_path_for(project)
+                )
+            except Exception as e:
+                immediate.append((project.name, {"returncode": 1, "stdout": f"Error: {str(e)}", "stderr": ""}))
+
+        def start(project: Project):
+            trace_start = tracer.now() if tracer is not None else 0.0
+            started[project.name] = (time.time(), trace_start, None)
+            try:
+                res_data = skip_result(project)
+                if res_data is None:
+                    cmd, task_env = resolve_command(project)
+                    if lookup_pool is not None:
+                        lookup_pool.submit(lookup, project, cmd, task_env)
+                    else:
+                        spawn(project, cmd, task_env)
+            except Exception as e:
+                res_data = {"returncode": 1, "stdout": f"Error: {str(e)}", "stderr": ""}
+            if res_data is not None:
+                immediate.append((project.name, res_data))
+
+        def resolve_lookup(item):
+            project, cmd, task_env, outcome = item
+            if isinstance(outcome, Exception):
+                immediate.append((project.name, {"returncode": 1, "stdout": f"Error: {str(outcome)}", "stderr": ""}))
+                return
+            key, hit = outcome
+            if hit is not None:
+                immediate.append((project.name, hit))  # replayed, nothing to store
+                return
+            task_start, trace_start, _ = started[project.name]
+            started[project.name] = (task_start, trace_start, key)
+            spawn(project, cmd, task_env)
+
+        try:
+            running = 0
+            while True:
+                while (name := next_ready(running)) is not None:
+                    running += 1
+                    start(project_map[name])
+
+                if running == 0:
                     break
-                
-                with results_lock:
-                    ready = [
-                        p for p in projects 
-                        if p.name not in submitted 
-                        and all(d in (completed | failed) for d in deps[p.name])
-                    ]
-                    
-                    if not ready and not running_futures and len(submitted) < len(projects):
-                        blocked = [p for p in projects if p.name not in submitted]
-                        if blocked: ready = [blocked[0]]
-                    
-                    slots_available = max_workers - len(running_futures)
-                    for p in ready[:slots_available]:
-                        submitted.add(p.name)
-                        future = executor.submit(run_task, p)
-                        running_futures[future] = p
-
-                # Update live display
-                live.update(get_status_table())
-
-                if running_futures:
-                    done, _ = wait(running_futures.keys(), timeout=0.2, return_when=FIRST_COMPLETED)
-                    for f in done:
-                        running_futures.pop(f)
-                        progress.advance(overall_task)
+
+                while not lookups.empty():
+                    resolve_lookup(lookups.get_nowait())
+
+                if immediate:
+                    done, immediate[:] = list(immediate), []
+                elif len(multiplexer):
+                    done = multiplexer.poll()
                 else:
-                    time.sleep(0.1)
-                    
-        live.update(get_status_table())
+                    # Only cache lookups are in flight
+                    resolve_lookup(lookups.get())
+                    continue
+                for name, res_data in done:
+                    task_start, trace_start, key = started.pop(name)
+                    if key is not None:
+                        if _cacheable(res_data):
+                            lookup_pool.submit(task_cache.put, key, dict(res_data, duration=time.time() - task_start))
+                        res_data["cached"] = False
+                    trace_task(project_map[name], trace_start, res_data)
+                    record_result(project_map[name], res_data, time.time() - task_start)
+                    running -= 1
+                    finish(name, running)
+        except BaseException:
+            if lookup_pool is not None:
+                lookup_pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            if lookup_pool is not None:
+                # Lets pending cache stores finish
+                lookup_pool.shutdown(wait=True)
+            multiplexer.close()
+
+    # Live display shows the summary table
+    with Live(StatusView(), console=console, refresh_per_second=4), \
+            maybe_span(tracer, "execute", backend=backend, max_workers=max_workers):
+        if backend == "asyncio":
+            asyncio.run(run_event_loop())
+        elif backend == "select":
+            run_selector()
+        else:
+            run_threads()
 
     total_duration = time.time() - start_time_overall
     for res in results:
         res["total_duration"] = total_duration
+        res["estimated_makespan"] = estimated_makespan
+
+    if estimated_makespan is not None:
+        console.print(
+            f"[dim]Makespan: estimated {estimated_makespan:.2f}s from history "
+            f"({len(known)}/{len(projects)} projects known), actual {total_duration:.2f}s[/dim]"
+        )
 
     return results
@@ -0,0 +1,51 @@
+# src/relm/selection.py
+
+import argparse
+from argparse import Namespace
+from typing import List
+from rich.console import Console
+from .core import Project, find_affected_projects
+from .changes import find_changed_projects
+
+def add_selector_arguments(parser: argparse.ArgumentParser):
+    """Adds the project selector flags shared by list, run, pytest, install, release and pipeline."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only target projects with changes between the given git ref and HEAD"
+    )
+    group.add_argument(
+        "--affected",
+        metavar="REF",
+        help="Only target projects changed since REF plus everything that depends on them"
+    )
+
+def select_affected(all_projects: List[Project], target_projects: List[Project], ref: str) -> List[Project]:
+    """
+    Returns the targeted projects that changed since ref or transitively
+    depend on one that did, in topological order. Dependents are resolved
+    over the whole workspace, so a change outside the targeted folder still
+    marks the targeted projects that consume it.
+    """
+    changed = find_changed_projects(all_projects, ref)
+    targeted = {p.name for p in target_projects}
+    return [p for p in find_affected_projects(all_projects, changed) if p.name in targeted]
+
+def apply_selectors(args: Namespace, target_projects: List[Project], all_projects: List[Project], console: Console) -> List[Project]:
+    """
+    Narrows an already targeted (and ordered) project list using the selector
+    flags. --since preserves the order of target_projects; --affected returns
+    topological order.
+    """
+    since = getattr(args, "since", None)
+    if since:
+        target_projects = find_changed_projects(target_projects, since)
+        console.print(f"[bold]{len(target_projects)} projects changed since [cyan]{since}[/cyan][/bold]")
+
+    affected = getattr(args, "affected", None)
+    if affected:
+        target_projects = select_affected(all_projects, target_projects, affected)
+        console.print(f"[bold]{len(target_projects)} projects affected by changes since [cyan]{affected}[/cyan][/bold]")
+
+    return target_projects
@@ -0,0 +1,175 @@
+# src/relm/sharding.py
+
+import argparse
+import heapq
+import subprocess
+from argparse import Namespace
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from rich.console import Console
+from .core import Project
+from .git_ops import group_by_repo, run_git_command
+from .hashing import walk_files
+from .history import DurationHistory, fill_unknown
+from .trie import PathTrie
+
+class ShardSpec(NamedTuple):
+    index: int  # 1-based
+    count: int
+
+def parse_shard(value: str) -> ShardSpec:
+    """argparse type for INDEX/COUNT, e.g. 3/8."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected INDEX/COUNT such as 1/4")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', INDEX must be between 1 and COUNT")
+    return ShardSpec(index, count)
+
+def add_shard_arguments(parser: argparse.ArgumentParser):
+    """Adds the --shard flags shared by run, pytest and install."""
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="INDEX/COUNT",
+        help="Only target the INDEX-th of COUNT duration-balanced slices of the projects (e.g. 1/8)"
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=["files", "history"],
+        default="files",
+        help="Shard weights: tracked file counts, identical on every machine, or recorded durations (default: files)"
+    )
+    parser.add_argument(
+        "--shard-history",
+        metavar="FILE",
+        help="history.db shared by all runners to balance shards by duration (implies --shard-by history)"
+    )
+    parser.add_argument(
+        "--shard-closure",
+        action="store_true",
+        help="Keep every targeted project in the same shard as its targeted dependencies"
+    )
+
+def dependency_groups(projects: List[Project]) -> List[List[Project]]:
+    """
+    Splits projects into groups connected by dependencies among them
+    (ignoring direction). Groups and their members keep the input order.
+    """
+    names_by_key = {p.name.lower(): p.name for p in projects}
+    parent = {p.name: p.name for p in projects}
+
+    def find(name: str) -> str:
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for p in projects:
+        for dep in p.dependencies:
+            other = names_by_key.get(dep.lower())
+            if other is not None:
+                parent[find(p.name)] = find(other)
+
+    groups: Dict[str, List[Project]] = {}
+    for p in projects:
+        groups.setdefault(find(p.name), []).append(p)
+    return list(groups.values())
+
+def _walk_count(path: Path) -> int:
+    return sum(1 for _ in walk_files(path))
+
+def file_weights(projects: List[Project]) -> Dict[str, float]:
+    """
+    Number of files in each project (at least 1), the default weight. Inside
+    git only tracked files count, from one `git ls-files` per repository, so
+    build artifacts and virtualenvs do not change the partition. Projects
+    outside git, or in a repository where git fails, are walked instead.
+    """
+    counts: Dict[str, int] = {}
+    repos, outside = group_by_repo(projects, lambda p: p.path)
+    for repo_root, members in repos.items():
+        pathspecs = ["/".join(parts) or "." for _, parts in members]
+        try:
+            files = run_git_command(["ls-files", "-z", "--"] + pathspecs, cwd=repo_root).split("\0")
+        except (subprocess.CalledProcessError, OSError):
+            outside.extend(project for project, _ in members)
+            continue
+        trie: PathTrie[str] = PathTrie()
+        for project, parts in members:
+            trie.insert(parts, project.name)
+            counts[project.name] = 0
+        for name in files:
+            if name:
+                for project_name in trie.prefixes(name.split("/")):
+                    counts[project_name] += 1
+    for project in outside:
+        counts[project.name] = _walk_count(project.path)
+    return {p.name: float(max(1, counts.get(p.name, 0))) for p in projects}
+
+def partition(weights: List[float], count: int) -> List[List[int]]:
+    """
+    Longest-processing-time-first packing of items into count bins: the
+    heaviest remaining item goes to the lightest bin. Ties break on item and
+    bin index, so equal inputs give the same bins on every machine.
+    Returns item indices per bin.
+    """
+    bins: List[List[int]] = [[] for _ in range(count)]
+    loads = [(0.0, i) for i in range(count)]
+    for item in sorted(range(len(weights)), key=lambda i: (-weights[i], i)):
+        load, b = heapq.heappop(loads)
+        bins[b].append(item)
+        heapq.heappush(loads, (load + weights[item], b))
+    return bins
+
+def select_shard(projects: List[Project], spec: ShardSpec, weights: Dict[str, float], closure: bool = False) -> List[Project]:
+    """
+    Returns the projects of shard spec.index, in their input order. With
+    closure, dependency-connected projects are packed as one unit.
+    """
+    units = dependency_groups(projects) if closure else [[p] for p in projects]
+    bins = partition([sum(weights[p.name] for p in unit) for unit in units], spec.count)
+    chosen = {p.name for i in bins[spec.index - 1] for p in units[i]}
+    return [p for p in projects if p.name in chosen]
+
+def shard_weights(projects: List[Project], history: Optional[DurationHistory], mode: str = "files") -> Tuple[Dict[str, float], str]:
+    """
+    Per-project weights and their source: file counts ("files"), or with
+    mode "history" recorded durations ("history", unknown projects count as
+    the mean) when the history knows any of the projects.
+    """
+    if mode == "history" and history is not None:
+        known = history.estimates(p.name for p in projects)
+        if known:
+            return fill_unknown(known, [p.name for p in projects]), "history"
+    return file_weights(projects), "files"
+
+def apply_shard(args: Namespace, target_projects: List[Project], history: Optional[DurationHistory], console: Console) -> List[Project]:
+    """
+    Narrows target_projects to the shard selected with --shard, if any.
+    Durations are only used when asked for, since each runner's local
+    history differs and would give every machine a different partition.
+    """
+    spec = getattr(args, "shard", None)
+    if spec is None:
+        return target_projects
+
+    mode = getattr(args, "shard_by", "files")
+    shared = getattr(args, "shard_history", None)
+    if shared:
+        mode = "history"
+        if history is not None:
+            history = DurationHistory(history.root_path, history.command, file_path=Path(shared))
+    weights, source = shard_weights(target_projects, history, mode)
+    if mode == "history" and source != "history":
+        console.print("[yellow]No recorded durations for these projects; sharding by file count.[/yellow]")
+
+    selected = select_shard(target_projects, spec, weights, closure=getattr(args, "shard_closure", False))
+    total = sum(weights.values())
+    share = sum(weights[p.name] for p in selected)
+    console.print(
+        f"[bold]Shard {spec.index}/{spec.count}: {len(selected)} of {len(target_projects)} projects "
+        f"({share / total if total else 0:.0%} of the work by {'recorded duration' if source == 'history' else 'file count'})[/bold]"
+    )
+    return selected
@@ -0,0 +1,17 @@
+# src/relm/state.py
+
+from pathlib import Path
+
+STATE_DIR_NAME = ".relm"
+
+def state_dir(root_path: Path, create: bool = False) -> Path:
+    """
+    Returns the directory where relm keeps its workspace-local state
+    (project index, caches, logs). When create is True the directory is
+    created with a .gitignore so it never shows up as untracked content.
+    """
+    path = root_path / STATE_DIR_NAME
+    if create and not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+        (path / ".gitignore").write_text("# Created by relm\n*\n")
+    return path
@@ -0,0 +1,127 @@
+# src/relm/trace.py
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Lane (trace "thread") of the main relm process: discovery, sorting and scheduling.
+MAIN_LANE = 0
+# Lane used for tasks run one after another (no --parallel).
+SEQUENTIAL_LANE = 1
+
+class Tracer:
+    """
+    Collects Chrome trace-event format records (timestamps in microseconds
+    since the tracer was created) and writes them as a JSON file that
+    Perfetto and chrome://tracing can open.
+
+    Lanes are trace thread ids: MAIN_LANE for relm itself and 1..N for
+    worker slots, which are named "worker N" the first time they are used.
+    Recording is thread-safe.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._lanes: Dict[int, str] = {}
+        self.lane(MAIN_LANE, "relm")
+
+    def now(self) -> float:
+        """Microseconds since the tracer was created."""
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    def _emit(self, event: Dict[str, Any]):
+        event.setdefault("pid", self.pid)
+        with self._lock:
+            self.events.append(event)
+
+    def lane(self, tid: int, name: str):
+        """Names a lane; the sort index keeps lanes in numeric order."""
+        with self._lock:
+            if self._lanes.get(tid) == name:
+                return
+            self._lanes[tid] = name
+        self._emit({"name": "thread_name", "ph": "M", "tid": tid, "args": {"name": name}})
+        self._emit({"name": "thread_sort_index", "ph": "M", "tid": tid, "args": {"sort_index": tid}})
+
+    def complete(self, name: str, start: float, end: float, tid: int = MAIN_LANE,
+                 cat: str = "relm", args: Optional[Dict[str, Any]] = None):
+        """Records a finished span ("X" event) on a lane."""
+        if tid not in self._lanes:
+            self.lane(tid, f"worker {tid}")
+        event = {"name": name, "cat": cat, "ph": "X", "ts": start, "dur": max(end - start, 0.0), "tid": tid}
+        if args:
+            event["args"] = args
+        self._emit(event)
+
+    def async_span(self, name: str, span_id: str, start: float, end: float,
+                   cat: str = "relm", args: Optional[Dict[str, Any]] = None):
+        """
+        Records a span that may overlap others on its own track (async "b"/"e"
+        pair), e.g. many projects waiting in the ready queue at once.
+        """
+        begin = {"name": name, "cat": cat, "ph": "b", "id": span_id, "ts": start, "tid": MAIN_LANE}
+        if args:
+            begin["args"] = args
+        self._emit(begin)
+        self._emit({"name": name, "cat": cat, "ph": "e", "id": span_id, "ts": max(end, start), "tid": MAIN_LANE})
+
+    def counter(self, name: str, values: Dict[str, float]):
+        """Records a counter sample ("C" event), shown as a graph above the lanes."""
+        self._emit({"name": name, "ph": "C", "ts": self.now(), "tid": MAIN_LANE, "args": values})
+
+    @contextmanager
+    def span(self, name: str, tid: int = MAIN_LANE, cat: str = "relm", **args) -> Iterator[Dict[str, Any]]:
+        """
+        Times the block as a span. Yields the args dict so the block can
+        attach results (e.g. a project count) before the span is recorded.
+        """
+        start = self.now()
+        try:
+            yield args
+        finally:
+            self.complete(name, start, self.now(), tid=tid, cat=cat, args=args)
+
+    def to_json(self) -> Dict[str, Any]:
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e.get("ts", -1.0))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path):
+        """Writes the trace atomically so a half-written file is never left behind."""
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f)
+        os.replace(tmp_path, path)
+
+@contextmanager
+def maybe_span(tracer: Optional[Tracer], name: str, tid: int = MAIN_LANE, cat: str = "relm", **args) -> Iterator[Dict[str, Any]]:
+    """Tracer.span, or a no-op when tracing is off."""
+    if tracer is None:
+        yield args
+        return
+    with tracer.span(name, tid=tid, cat=cat, **args) as span_args:
+        yield span_args
+
+def tracer_for(args) -> Optional[Tracer]:
+    """A Tracer when --trace was given, else None."""
+    return Tracer() if getattr(args, "trace", None) else None
+
+def finish_trace(tracer: Optional[Tracer], args, console):
+    """Writes the trace requested with --trace and tells the user where it is."""
+    if tracer is None:
+        return
+    path = Path(args.trace)
+    try:
+        tracer.write(path)
+    except OSError as e:
+        console.print(f"[red]Could not write trace to {path}: {e}[/red]")
+        return
+    console.print(f"[dim]Trace written to {path} (open in https://ui.perfetto.dev or chrome://tracing)[/dim]")
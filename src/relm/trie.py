@@ -0,0 +1,51 @@
+# src/relm/trie.py
+
+from typing import Dict, Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+class PathTrie(Generic[T]):
+    """
+    Trie over path components. Maps a changed file to every value stored at
+    one of its ancestor directories in a single walk down the file's path,
+    and a directory to every value stored at or below it.
+    """
+
+    def __init__(self):
+        self._root: Dict = {}
+
+    def insert(self, parts: Sequence[str], value: T):
+        node = self._root
+        for part in parts:
+            node = node.setdefault(part, {})
+        node.setdefault(None, []).append(value)
+
+    def prefixes(self, parts: Sequence[str]) -> List[T]:
+        """Returns all values stored at a prefix of parts (including parts itself)."""
+        found: List[T] = []
+        node = self._root
+        found.extend(node.get(None, []))
+        for part in parts:
+            node = node.get(part)
+            if node is None:
+                break
+            found.extend(node.get(None, []))
+        return found
+
+    def below(self, parts: Sequence[str]) -> List[T]:
+        """Returns all values stored at parts or at a path it is a prefix of."""
+        node = self._root
+        for part in parts:
+            node = node.get(part)
+            if node is None:
+                return []
+        found: List[T] = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is None:
+                    found.extend(child)
+                else:
+                    stack.append(child)
+        return found
@@ -0,0 +1,66 @@
+# src/relm/workspace.py
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .core import Project, normalize_name  # normalize_name re-exported
+from .trie import PathTrie
+
+class Workspace(list):
+    """
+    The discovered projects (a plain list of Project, as returned by
+    find_projects) plus indexes for targeting: by PEP 503 normalized name,
+    by resolved path, and a trie of path components for "every project under
+    this folder" queries. Each project path is resolved once, when the
+    indexes are first needed, instead of once per project per query.
+
+    Treat it as read-only: the indexes are not updated if the list changes.
+    """
+
+    def __init__(self, projects: Iterable[Project] = ()):
+        super().__init__(projects)
+        self._indexed = False
+        self._by_name: Dict[str, List[Project]] = {}
+        self._by_path: Dict[Path, Project] = {}
+        # (position in the workspace, project) at each project's path parts
+        self._trie: PathTrie[Tuple[int, Project]] = PathTrie()
+
+    @classmethod
+    def of(cls, projects: Iterable[Project]) -> "Workspace":
+        """projects itself if it already is a Workspace, otherwise a Workspace over it."""
+        return projects if isinstance(projects, cls) else cls(projects)
+
+    def _build(self):
+        if self._indexed:
+            return
+        for position, project in enumerate(self):
+            self._by_name.setdefault(normalize_name(project.name), []).append(project)
+            path = project.path.resolve()
+            self._by_path.setdefault(path, project)
+            self._trie.insert(path.parts, (position, project))
+        self._indexed = True
+
+    def by_name(self, name: str) -> Optional[Project]:
+        """
+        The project called name, compared PEP 503 normalized ("my_lib" finds
+        "my-lib"). If several projects normalize alike, an exact match wins.
+        """
+        self._build()
+        candidates = self._by_name.get(normalize_name(name), [])
+        return next((p for p in candidates if p.name == name), candidates[0] if candidates else None)
+
+    def by_path(self, path: Path) -> Optional[Project]:
+        """The project located exactly at path, if any."""
+        self._build()
+        return self._by_path.get(path.resolve())
+
+    def under(self, directory: Path) -> List[Project]:
+        """Projects located at or below directory, in workspace order."""
+        self._build()
+        found = self._trie.below(directory.resolve().parts)
+        return [project for _, project in sorted(found, key=lambda item: item[0])]
+
+    def without(self, projects: List[Project], path: Path) -> List[Project]:
+        """projects minus the one located at path (e.g. the workspace root for --from-root)."""
+        excluded = self.by_path(path)
+        return [p for p in projects if p is not excluded]
@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from relm.core import Project
+
+@pytest.fixture
+def python_command():
+    """Builds the argv that runs code in a fresh interpreter."""
+    def build(code):
+        return [sys.executable, "-c", code]
+    return build
+
+@pytest.fixture
+def make_project():
+    """Builds a Project at /<name> (or path) without a pyproject.toml on disk."""
+    def build(name, deps=(), path=None):
+        return Project(name=name, version="1.0", path=path or Path(f"/{name}"), dependencies=list(deps))
+    return build
@@ -0,0 +1,92 @@
+import sys
+
+import pytest
+
+from relm.core import Project
+from relm.runner import USAGE_KEYS, TailBuffer, execute_in_parallel, run_project_command_tail, run_project_command_tail_async
+
+def test_tail_buffer_handles_chunk_boundaries():
+    tail = TailBuffer(3)
+    for chunk in [b"one\ntw", b"o\nthr", b"ee\n", b"four\nfi", b"ve"]:
+        tail.feed(chunk)
+    assert tail.text() == "three\nfour\nfive"
+
+def test_tail_buffer_keeps_only_last_lines_of_large_chunk():
+    tail = TailBuffer(2)
+    tail.feed(b"".join(b"line %d\n" % i for i in range(10000)))
+    assert tail.text() == "line 9998\nline 9999"
+    assert len(tail.lines) == 2
+
+def test_tail_buffer_exactly_max_lines_and_strips():
+    tail = TailBuffer(2)
+    tail.feed(b"  a \r\nb\n")
+    assert tail.text() == "a\nb"
+
+def test_tail_buffer_bounds_unterminated_line():
+    tail = TailBuffer(5, max_partial_bytes=10)
+    tail.feed(b"x" * 100)
+    assert tail.text() == "x" * 10
+
+async def test_async_tail_matches_thread_tail(tmp_path, python_command):
+    cmd = python_command("import sys\nfor i in range(200): print('row', i)\nsys.stdout.write('last')\nsys.exit(3)")
+    expected = run_project_command_tail(tmp_path, cmd, tail_lines=5)
+    result = await run_project_command_tail_async(tmp_path, cmd, tail_lines=5, chunk_size=7)
+    assert set(result) == set(expected)
+    for key in USAGE_KEYS:
+        del result[key], expected[key]
+    assert result == expected
+    assert result["returncode"] == 3
+    assert result["stdout"].splitlines() == ["row 196", "row 197", "row 198", "row 199", "last"]
+
+async def test_async_tail_runs_shell_strings_and_reports_spawn_errors(tmp_path):
+    result = await run_project_command_tail_async(tmp_path, "echo hi && exit 2")
+    assert {k: result[k] for k in ("returncode", "stdout", "timed_out", "cancelled")} == {
+        "returncode": 2, "stdout": "hi", "timed_out": False, "cancelled": False
+    }
+
+    missing = await run_project_command_tail_async(tmp_path / "missing", ["true"])
+    assert missing["returncode"] == 1
+    assert missing["stdout"].startswith("Error:")
+
+def test_execute_in_parallel_asyncio_backend_respects_dependencies(tmp_path, python_command):
+    log = tmp_path / "order.log"
+    lib = Project(name="lib", version="1.0", path=tmp_path, dependencies=[])
+    app = Project(name="app", version="1.0", path=tmp_path, dependencies=["lib"])
+    bad = Project(name="bad", version="1.0", path=tmp_path, dependencies=[])
+
+    def provider(p):
+        if p.name == "bad":
+            return python_command("import sys; print('broken'); sys.exit(1)")
+        return python_command(f"open({str(log)!r}, 'a').write({p.name!r} + '\\n')")
+
+    results = execute_in_parallel([app, lib, bad], provider, max_workers=4, backend="asyncio")
+
+    by_name = {r["name"]: r for r in results}
+    assert by_name["lib"]["success"] and by_name["app"]["success"]
+    assert not by_name["bad"]["success"]
+    assert by_name["bad"]["stdout"] == "broken"
+    assert log.read_text().splitlines() == ["lib", "app"]
+
+def test_execute_in_parallel_asyncio_fail_fast_stops_new_tasks(tmp_path):
+    first = Project(name="first", version="1.0", path=tmp_path, dependencies=[])
+    second = Project(name="second", version="1.0", path=tmp_path, dependencies=["first"])
+
+    results = execute_in_parallel(
+        [first, second], lambda p: "exit 1", max_workers=1, fail_fast=True, backend="asyncio"
+    )
+
+    assert [r["name"] for r in results] == ["first"]
+
+def test_execute_in_parallel_asyncio_provider_error(tmp_path):
+    project = Project(name="p", version="1.0", path=tmp_path, dependencies=[])
+
+    def provider(p):
+        raise RuntimeError("no command")
+
+    results = execute_in_parallel([project], provider, backend="asyncio")
+    assert results[0]["success"] is False
+    assert "no command" in results[0]["stdout"]
+
+def test_execute_in_parallel_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        execute_in_parallel([], lambda p: "true", backend="fibers")
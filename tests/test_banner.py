@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 from relm import banner
 
 
+
 def test_lerp():
     """
     Tests the linear interpolation function.
@@ -69,3 +70,43 @@ def test_print_logo_procedural_palette(mock_system_random, mock_console):
 
     banner.print_logo()
     mock_console.return_value.print.assert_called()
+
+
+def test_should_print_logo_only_on_interactive_terminals():
+    """
+    Tests that the banner is skipped for --quiet, RELM_NO_BANNER and non-TTY output.
+    """
+    tty = MagicMock()
+    tty.isatty.return_value = True
+    pipe = MagicMock()
+    pipe.isatty.return_value = False
+
+    with patch.dict(os.environ, {}, clear=False):
+        os.environ.pop("RELM_NO_BANNER", None)
+        assert banner.should_print_logo(stream=tty)
+        assert not banner.should_print_logo(stream=pipe)
+        assert not banner.should_print_logo(quiet=True, stream=tty)
+
+    with patch.dict(os.environ, {"RELM_NO_BANNER": "1"}):
+        assert not banner.should_print_logo(stream=tty)
+
+
+def test_gradient_runs_merge_neighbouring_styles():
+    """
+    Tests that the gradient merges runs of the same color and leaves whitespace unstyled.
+    """
+    runs = banner.gradient_runs(tuple(banner.FIXED_PALETTES[1]))
+
+    assert ["".join(text for text, _ in line) for line in runs] == list(banner.LOGO_LINES)
+    for line in runs:
+        for text, style in line:
+            if style is None:
+                assert text.isspace()
+        assert all(a[1] != b[1] for a, b in zip(line, line[1:]))
+    assert sum(len(line) for line in runs) < sum(len(line) for line in banner.LOGO_LINES)
+
+
+def test_palette_index_only_accepts_known_fixed_palettes():
+    for value, expected in (("0", 0), ("5", 5), ("6", None), ("-1", None), ("x", None)):
+        with patch.dict(os.environ, {"CREATE_DUMP_PALETTE": value}):
+            assert banner.palette_index() == expected
@@ -0,0 +1,146 @@
+import os
+import time
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from relm.cache import TaskCache, cache_enabled
+from relm.core import Project
+from relm.hashing import FileTreeHasher
+from relm.runner import execute_in_parallel, run_with_cache
+from relm.commands import cache_command
+
+def _make_project(root, name, deps=()):
+    path = root / name
+    path.mkdir()
+    (path / "module.py").write_text("x = 1\n")
+    return Project(name=name, version="1.0", path=path, dependencies=list(deps))
+
+def test_input_hash_tracks_content_and_ignores_build_dirs(tmp_path):
+    project = _make_project(tmp_path, "lib")
+    hasher = FileTreeHasher()
+    before = hasher.hash_tree(project.path).digest
+
+    (project.path / "build").mkdir()
+    (project.path / "build" / "artifact.bin").write_text("ignored")
+    assert hasher.hash_tree(project.path).digest == before
+
+    (project.path / "module.py").write_text("x = 2\n")
+    assert hasher.hash_tree(project.path).digest != before
+
+def test_key_changes_when_dependency_inputs_change(tmp_path):
+    lib = _make_project(tmp_path, "lib")
+    app = _make_project(tmp_path, "app", deps=["lib"])
+
+    key_before = TaskCache(tmp_path, [lib, app]).key_for(app, "pytest", app.path)
+    (lib.path / "module.py").write_text("x = 3\n")
+    key_after = TaskCache(tmp_path, [lib, app]).key_for(app, "pytest", app.path)
+
+    assert key_before != key_after
+    assert TaskCache(tmp_path, [lib, app]).key_for(app, "ruff .", app.path) != key_after
+
+def test_put_get_roundtrip_and_stats(tmp_path):
+    cache = TaskCache(tmp_path)
+    assert cache.get("abc") is None
+
+    cache.put("abc", {"returncode": 1, "stdout": "tail", "stderr": ""})
+
+    entry = cache.get("abc")
+    assert entry["returncode"] == 1
+    assert entry["stdout"] == "tail"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.stats()["entries"] == 1
+    assert (tmp_path / ".relm" / ".gitignore").exists()
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    cache = TaskCache(tmp_path)
+    for i, key in enumerate(["old", "new"]):
+        cache.put(key, {"returncode": 0, "stdout": "x" * 100, "stderr": ""})
+        stamp = time.time() - 100 + i * 50
+        os.utime(cache.directory / f"{key}.json", (stamp, stamp))
+    entry_size = (cache.directory / "new.json").stat().st_size
+
+    removed = cache.prune(max_bytes=entry_size)
+
+    assert removed == 1
+    assert not (cache.directory / "old.json").exists()
+    assert (cache.directory / "new.json").exists()
+
+def test_run_with_cache_replays_hits(tmp_path):
+    project = _make_project(tmp_path, "lib")
+    cache = TaskCache(tmp_path, [project])
+
+    with patch("relm.runner.run_project_command_tail") as mock_run:
+        mock_run.return_value = {"returncode": 0, "stdout": "ran", "stderr": ""}
+        first = run_with_cache(cache, project, "echo", project.path)
+        second = run_with_cache(cache, project, "echo", project.path)
+
+    assert mock_run.call_count == 1
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["stdout"] == "ran"
+
+def test_failed_runs_are_not_cached(tmp_path):
+    project = _make_project(tmp_path, "lib")
+    cache = TaskCache(tmp_path, [project])
+    marker = tmp_path / "marker"
+    command = f"echo ran >> {marker}; exit 1"
+
+    first = run_with_cache(cache, project, command, project.path)
+    second = run_with_cache(cache, project, command, project.path)
+
+    assert first["returncode"] == second["returncode"] == 1
+    assert second["cached"] is False
+    assert marker.read_text().splitlines() == ["ran", "ran"]
+    assert cache.stats()["entries"] == 0
+
+def test_execute_in_parallel_marks_cached_results(tmp_path):
+    project = _make_project(tmp_path, "lib")
+    cache = TaskCache(tmp_path, [project])
+    cache.put(cache.key_for(project, "echo", project.path), {"returncode": 0, "stdout": "stored", "stderr": ""})
+
+    with patch("relm.runner.run_project_command_tail") as mock_run:
+        results = execute_in_parallel([project], lambda p: "echo", task_cache=cache)
+
+    mock_run.assert_not_called()
+    assert results[0]["cached"] is True
+    assert results[0]["stdout"] == "stored"
+
+def test_cache_enabled_from_flag_or_config():
+    assert cache_enabled(Namespace(cache=True), {})
+    assert cache_enabled(Namespace(), {"cache": {"enabled": True}})
+    assert not cache_enabled(Namespace(), {})
+
+def test_cache_command_stats_and_prune_all(tmp_path):
+    cache = TaskCache(tmp_path)
+    cache.put("abc", {"returncode": 0, "stdout": "", "stderr": ""})
+    console = MagicMock()
+
+    with patch("relm.cache.FileTreeHasher") as mock_hasher:
+        cache_command.execute(Namespace(path=str(tmp_path), action="stats"), console)
+    # Only the cache directory is read, not the file hash memo
+    mock_hasher.assert_not_called()
+    console.print.assert_any_call("Entries: [cyan]1[/cyan]")
+
+    cache_command.execute(Namespace(path=str(tmp_path), action="prune", all=True), console)
+    console.print.assert_any_call("[green]Removed 1 cached results.[/green]")
+    assert cache.stats()["entries"] == 0
+
+def test_keys_computed_concurrently_match_and_memo_saves(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    projects = [_make_project(tmp_path, f"p{i}") for i in range(8)]
+    for project in projects:
+        for j in range(20):
+            (project.path / f"m{j}.py").write_text(f"x = {j}\n")
+            old = time.time() - 60
+            os.utime(project.path / f"m{j}.py", (old, old))
+    expected = {p.name: TaskCache(tmp_path, projects).key_for(p, "make", p.path) for p in projects}
+
+    cache = TaskCache(tmp_path, projects)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cache.key_for, p, "make", p.path) for p in projects * 4]
+        cache.flush()
+        keys = [f.result() for f in futures]
+    cache.flush()
+
+    assert keys == [expected[p.name] for p in projects * 4]
+    assert len(FileTreeHasher(tmp_path).memo) == 8 * 20
@@ -1,6 +1,5 @@
-
 import unittest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import MagicMock, patch
 from argparse import Namespace
 from pathlib import Path
 from relm.commands import list_command
@@ -22,25 +21,20 @@ class TestChangedSince(unittest.TestCase):
         self.project2.description = "Project 2"
 
     @patch("relm.commands.list_command.find_projects")
-    @patch("relm.commands.list_command.git_has_changes_since", create=True)
-    def test_list_since_filters_projects(self, mock_has_changes, mock_find_projects):
+    @patch("relm.git_ops.find_repo_root", return_value=Path("/repo"))
+    @patch("relm.changes.git_changed_files")
+    def test_list_since_filters_projects(self, mock_changed_files, mock_repo_root, mock_find_projects):
         # Setup
         mock_find_projects.return_value = [self.project1, self.project2]
 
         # proj1 has changes, proj2 does not
-        def side_effect(path, ref):
-            return path == self.project1.path
-        mock_has_changes.side_effect = side_effect
+        mock_changed_files.return_value = ["proj1/src/module.py", "README.md"]
 
         # Execute
         list_command.execute(self.args, self.console)
 
-        # Verify
-        # This assertion is expected to fail first
-        mock_has_changes.assert_has_calls([
-            call(self.project1.path, "HEAD~1"),
-            call(self.project2.path, "HEAD~1")
-        ], any_order=True)
+        # Verify a single diff was run for the shared repository
+        mock_changed_files.assert_called_once_with(Path("/repo"), "HEAD~1")
 
         self.assertTrue(self.console.print.called)
         args, _ = self.console.print.call_args
@@ -0,0 +1,98 @@
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+from relm.changes import find_changed_projects
+from relm.core import Project
+
+def _project(name, path):
+    return Project(name=name, version="1.0.0", path=Path(path))
+
+def test_find_changed_projects_runs_one_diff_per_repo():
+    root = _project("root", "/repo")
+    lib = _project("lib", "/repo/packages/lib")
+    app = _project("app", "/repo/apps/app")
+    other = _project("other", "/other/pkg")
+
+    def repo_root(path):
+        return Path("/repo") if str(path).startswith("/repo") else Path("/other")
+
+    def changed_files(repo, ref):
+        return ["packages/lib/src/lib.py"] if repo == Path("/repo") else []
+
+    with patch("relm.git_ops.find_repo_root", side_effect=repo_root), \
+         patch("relm.changes.git_changed_files", side_effect=changed_files) as mock_diff:
+        changed = find_changed_projects([root, app, lib, other], "main")
+
+    assert [p.name for p in changed] == ["root", "lib"]
+    assert mock_diff.call_count == 2
+
+def test_find_changed_projects_treats_failures_and_non_git_as_changed():
+    lib = _project("lib", "/repo/lib")
+    loose = _project("loose", "/tmp/loose")
+
+    def repo_root(path):
+        return Path("/repo") if str(path).startswith("/repo") else None
+
+    with patch("relm.git_ops.find_repo_root", side_effect=repo_root), \
+         patch("relm.changes.git_changed_files", side_effect=subprocess.CalledProcessError(128, "git")):
+        changed = find_changed_projects([lib, loose], "no-such-ref")
+
+    assert [p.name for p in changed] == ["lib", "loose"]
+
+def test_run_command_since_filter(tmp_path):
+    from argparse import Namespace
+    from unittest.mock import MagicMock
+    from relm.commands import run_command
+
+    a = _project("a", tmp_path / "a")
+    b = _project("b", tmp_path / "b")
+    args = Namespace(path=str(tmp_path), project_name="all", command_string="true",
+                     fail_fast=False, parallel=False, from_root=False, since="main")
+
+    with patch("relm.commands.run_command.find_projects", return_value=[a, b]), \
+         patch("relm.selection.find_changed_projects", return_value=[b]) as mock_changed, \
+         patch("relm.commands.run_command.run_with_cache",
+               return_value={"returncode": 0, "stdout": "", "stderr": "", "cached": False}) as mock_run:
+        run_command.execute(args, MagicMock())
+
+    mock_changed.assert_called_once()
+    assert mock_run.call_count == 1
+    assert mock_run.call_args[0][3] == b.path
+
+def test_select_affected_limits_to_targets_but_resolves_over_workspace():
+    from relm.selection import select_affected
+    lib = Project(name="lib", version="1.0", path=Path("/repo/libs/lib"))
+    app = Project(name="app", version="1.0", path=Path("/repo/apps/app"), dependencies=["lib"])
+    tool = Project(name="tool", version="1.0", path=Path("/repo/apps/tool"))
+
+    with patch("relm.selection.find_changed_projects", return_value=[lib]):
+        selected = select_affected([lib, app, tool], [app, tool], "main")
+
+    assert [p.name for p in selected] == ["app"]
+
+def test_list_affected_outputs_topological_order():
+    from argparse import Namespace
+    from unittest.mock import MagicMock
+    from relm.commands import list_command
+    lib = Project(name="zlib", version="1.0", path=Path("/repo/zlib"))
+    app = Project(name="app", version="1.0", path=Path("/repo/app"), dependencies=["zlib"])
+    console = MagicMock()
+
+    with patch("relm.commands.list_command.find_projects", return_value=[app, lib]), \
+         patch("relm.selection.find_changed_projects", return_value=[lib]):
+        list_command.execute(Namespace(path="/repo", since=None, affected="main"), console)
+
+    table = console.print.call_args[0][0]
+    assert list(table.columns[0].cells) == ["zlib", "app"]
+
+def test_list_rejects_since_together_with_affected(capsys):
+    import argparse
+    import pytest
+    from relm.commands import list_command
+    parser = argparse.ArgumentParser()
+    list_command.register(parser.add_subparsers(), argparse.ArgumentParser(add_help=False))
+
+    assert parser.parse_args(["list", "--affected", "main"]).affected == "main"
+    with pytest.raises(SystemExit):
+        parser.parse_args(["list", "--since", "main", "--affected", "main"])
+    assert "not allowed with argument" in capsys.readouterr().err
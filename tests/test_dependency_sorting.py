@@ -106,3 +106,38 @@ def test_sort_with_external_dependencies():
     sorted_projects = sort_projects_by_dependency([p_a, p_b])
     names = [p.name for p in sorted_projects]
     assert names == ["B", "A"]
+
+def test_build_reverse_dependency_index():
+    from relm.core import build_reverse_dependency_index
+    p_a = Project(name="A", version="1.0", path=Path("/a"), dependencies=["b", "requests"])
+    p_b = Project(name="B", version="1.0", path=Path("/b"), dependencies=["c"])
+    p_c = Project(name="C", version="1.0", path=Path("/c"), dependencies=[])
+
+    reverse = build_reverse_dependency_index([p_a, p_b, p_c])
+
+    assert reverse == {"a": [], "b": ["a"], "c": ["b"]}
+
+def test_find_affected_projects_includes_transitive_dependents_in_order():
+    """
+    C is changed; B depends on C and A depends on B. D is independent.
+    """
+    from relm.core import find_affected_projects
+    p_a = Project(name="A", version="1.0", path=Path("/a"), dependencies=["B"])
+    p_b = Project(name="B", version="1.0", path=Path("/b"), dependencies=["C"])
+    p_c = Project(name="C", version="1.0", path=Path("/c"), dependencies=[])
+    p_d = Project(name="D", version="1.0", path=Path("/d"), dependencies=[])
+
+    affected = find_affected_projects([p_a, p_b, p_c, p_d], [p_c])
+
+    assert [p.name for p in affected] == ["C", "B", "A"]
+
+def test_find_affected_projects_matches_pep503_normalized_names():
+    from relm.core import find_affected_projects
+    my_lib = Project(name="my_lib", version="1.0", path=Path("/my_lib"), dependencies=[])
+    app = Project(name="app", version="1.0", path=Path("/app"), dependencies=["my-lib"])
+    cli = Project(name="Cli.Tool", version="1.0", path=Path("/cli"), dependencies=["MY.LIB", "app"])
+    other = Project(name="other", version="1.0", path=Path("/other"), dependencies=["mylib"])
+
+    affected = find_affected_projects([cli, other, app, my_lib], [my_lib])
+
+    assert [p.name for p in affected] == ["my_lib", "app", "Cli.Tool"]
@@ -0,0 +1,180 @@
+import os
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from relm.core import find_projects, load_projects
+from relm.index import ProjectIndex
+from relm.discovery import discover_project_dirs, git_project_dirs, member_project_dirs, walk_project_dirs
+
+def _pyproject(directory: Path, name: str = None):
+    directory.mkdir(parents=True, exist_ok=True)
+    name = name or directory.name
+    (directory / "pyproject.toml").write_text(f'[project]\nname = "{name}"\nversion = "1.0"\n')
+
+def _relative(found, root: Path):
+    return sorted((str(Path(d).relative_to(root)), depth) for d, depth in found)
+
+def _walk(root: Path, max_depth: int):
+    return _relative(walk_project_dirs(str(root), max_depth), root)
+
+def test_walk_counts_depth_and_stops_at_max_depth(tmp_path):
+    for rel in ("", "a", "a/b", "a/b/c"):
+        _pyproject(tmp_path / rel, name=rel.replace("/", "-") or "root")
+
+    assert _walk(tmp_path, 1) == [(".", 0), ("a", 1)]
+    assert _walk(tmp_path, 3) == [(".", 0), ("a", 1), ("a/b", 2), ("a/b/c", 3)]
+    assert _walk(tmp_path, 0) == [(".", 0)]
+
+def test_walk_prunes_ignored_and_hidden_directories(tmp_path):
+    for rel in ("node_modules/pkg", ".hidden/pkg", "build", "src/pkg"):
+        _pyproject(tmp_path / rel)
+    (tmp_path / "dir-named" / "pyproject.toml").mkdir(parents=True)
+
+    assert _walk(tmp_path, 5) == [("src/pkg", 2)]
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+def test_walk_does_not_follow_directory_symlinks(tmp_path):
+    _pyproject(tmp_path / "outside" / "pkg")
+    (tmp_path / "ws").mkdir()
+    (tmp_path / "ws" / "link").symlink_to(tmp_path / "outside", target_is_directory=True)
+    _pyproject(tmp_path / "ws" / "real")
+
+    assert _walk(tmp_path / "ws", 3) == [("real", 1)]
+
+def _legacy_find(root_path, recursive, max_depth, include_root):
+    """The os.walk + resolve() loop find_projects used before the scandir walker."""
+    found = []
+    for root, dirs, files in os.walk(root_path):
+        current = Path(root).resolve()
+        depth = len(current.relative_to(root_path).parts)
+        dirs[:] = [d for d in dirs if d not in {"node_modules", "build", "__pycache__"} and not d.startswith(".")]
+        if not recursive and depth >= 1:
+            dirs[:] = []
+            if depth > 1:
+                continue
+        if recursive and depth >= max_depth:
+            dirs[:] = []
+        if "pyproject.toml" in files and not (current == root_path and not include_root):
+            found.append(current)
+    return sorted(found)
+
+@pytest.mark.parametrize("recursive, max_depth, include_root", [(False, 1, True), (True, 2, False), (True, 4, True)])
+def test_find_projects_matches_previous_walker(tmp_path, recursive, max_depth, include_root):
+    rng = random.Random(7)
+    dirs = [tmp_path]
+    for i in range(120):
+        parent = rng.choice(dirs)
+        child = parent / rng.choice([f"d{i}", f"d{i}", ".hidden", "node_modules", "build"])
+        child.mkdir(exist_ok=True)
+        dirs.append(child)
+        if rng.random() < 0.4:
+            _pyproject(child, name=f"p{i}")
+    _pyproject(tmp_path, name="root")
+
+    projects = find_projects(tmp_path, recursive=recursive, max_depth=max_depth, include_root=include_root)
+
+    assert sorted(p.path for p in projects) == _legacy_find(tmp_path.resolve(), recursive, max_depth, include_root)
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+def test_git_discovery_respects_gitignore_and_nested_repositories(tmp_path):
+    _git(tmp_path, "init", "-q")
+    for rel in ("tracked", "untracked", "ignored", "node_modules/pkg", "a/b/too-deep", "nested/inner"):
+        _pyproject(tmp_path / rel, name=rel.replace("/", "-"))
+    (tmp_path / "foo-pyproject.toml").write_text("")
+    (tmp_path / ".gitignore").write_text("ignored/\n")
+    _git(tmp_path / "nested", "init", "-q")
+    _git(tmp_path, "add", "tracked", "node_modules")
+
+    expected = [("nested/inner", 2), ("tracked", 1), ("untracked", 1)]
+    assert _relative(git_project_dirs(str(tmp_path), 2), tmp_path) == expected
+    assert _relative(discover_project_dirs(str(tmp_path), 2, "auto"), tmp_path) == expected
+    assert ("ignored", 1) in _relative(discover_project_dirs(str(tmp_path), 2, "walk"), tmp_path)
+
+    names = {p.name for p in find_projects(tmp_path, recursive=True, max_depth=2, discovery="git")}
+    assert names == {"tracked", "untracked", "nested-inner"}
+
+def test_git_discovery_falls_back_to_walk_outside_a_repository(tmp_path, monkeypatch):
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    _pyproject(tmp_path / "pkg")
+    assert git_project_dirs(str(tmp_path), 1) is None
+    assert _relative(discover_project_dirs(str(tmp_path), 1, "git"), tmp_path) == [("pkg", 1)]
+    with pytest.raises(ValueError, match="Unknown discovery mode"):
+        discover_project_dirs(str(tmp_path), 1, "fast")
+
+def test_member_globs_expand_without_scanning(tmp_path):
+    for rel in ("packages/a", "packages/b", "packages/legacy", "apps/web", "apps/deep/tool", "tools/skipped"):
+        _pyproject(tmp_path / rel)
+    (tmp_path / "packages" / "no-project").mkdir()
+
+    found = member_project_dirs(str(tmp_path), ["packages/*", "apps/**"], ["packages/legacy"])
+
+    assert _relative(found, tmp_path) == [("apps/deep/tool", 3), ("apps/web", 2), ("packages/a", 2), ("packages/b", 2)]
+
+def test_find_projects_uses_declared_workspace_members(tmp_path, capsys):
+    for rel in ("packages/a", "packages/b", "other"):
+        _pyproject(tmp_path / rel)
+    _pyproject(tmp_path, name="root")
+    (tmp_path / ".relm.toml").write_text('[workspace]\nmembers = ["packages/*", "."]\nexclude = ["packages/b"]\n')
+
+    assert [p.name for p in find_projects(tmp_path, recursive=True, use_cache=True)] == ["a", "root"]
+    # An explicit discovery mode ignores the declared members
+    assert {p.name for p in find_projects(tmp_path, recursive=True, max_depth=2, include_root=True, discovery="walk")} == {"a", "b", "other", "root"}
+
+    (tmp_path / ".relm.toml").write_text('[workspace]\nmembers = "packages/*"\nexclude = [1]\n')
+    with pytest.raises(SystemExit) as exc_info:
+        find_projects(tmp_path)
+    assert exc_info.value.code == 1
+    err = capsys.readouterr().err
+    assert ".relm.toml" in err
+    assert "[workspace] exclude must be a list of glob patterns" in err
+
+@pytest.mark.parametrize("parse_threshold", [0, 1000])
+def test_load_projects_keeps_order_and_reports_parse_errors(tmp_path, parse_threshold):
+    paths = []
+    for i in range(12):
+        _pyproject(tmp_path / f"p{i}")
+        paths.append(tmp_path / f"p{i}")
+    (tmp_path / "p3" / "pyproject.toml").write_text("[project\nname = 1\n")
+    (tmp_path / "p5" / "pyproject.toml").write_text("[tool.only]\nx = 1\n")
+    (tmp_path / "empty").mkdir()
+    paths.append(tmp_path / "empty")
+    index = ProjectIndex(tmp_path)
+
+    projects, errors = load_projects(paths[::-1], index=index, parse_threshold=parse_threshold, jobs=2)
+
+    assert [p.name for p in projects] == [f"p{i}" for i in range(11, -1, -1) if i not in (3, 5)]
+    assert [e.path for e in errors] == [tmp_path / "p3" / "pyproject.toml"]
+    assert "line 1" in errors[0].message
+    # Broken files stay out of the index so they are reported again
+    assert str(tmp_path / "p3" / "pyproject.toml") not in index.entries
+    assert index.entries[str(tmp_path / "p5" / "pyproject.toml")]["project"] is None
+
+def test_load_projects_falls_back_when_a_parse_worker_dies(tmp_path, mocker):
+    from concurrent.futures.process import BrokenProcessPool
+    paths = []
+    for i in range(3):
+        _pyproject(tmp_path / f"p{i}")
+        paths.append(tmp_path / f"p{i}")
+    pool = mocker.patch("relm.core.ProcessPoolExecutor")
+    pool.return_value.__enter__.return_value.map.side_effect = BrokenProcessPool("worker killed")
+
+    projects, errors = load_projects(paths, parse_threshold=0, jobs=2)
+
+    pool.assert_called_once()
+    assert [p.name for p in projects] == ["p0", "p1", "p2"]
+    assert errors == []
+
+def test_find_projects_warns_about_unparsable_files(tmp_path, capsys):
+    _pyproject(tmp_path / "good")
+    (tmp_path / "bad").mkdir()
+    (tmp_path / "bad" / "pyproject.toml").write_text("name = \n")
+
+    assert [p.name for p in find_projects(tmp_path)] == ["good"]
+    assert "bad" in capsys.readouterr().err
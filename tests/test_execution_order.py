@@ -6,7 +6,7 @@ from relm.commands import run_command
 
 class TestExecutionOrder(unittest.TestCase):
     @patch("relm.commands.run_command.find_projects")
-    @patch("relm.commands.run_command.run_project_command")
+    @patch("relm.commands.run_command.run_with_cache")
     @patch("relm.commands.run_command.Console")
     def test_run_respects_dependencies(self, mock_console_cls, mock_run_cmd, mock_find_projects):
         # Setup: Project A depends on B
@@ -16,7 +16,7 @@ class TestExecutionOrder(unittest.TestCase):
         # find_projects might return them in any order (e.g., alphabetical A, B)
         mock_find_projects.return_value = [p_a, p_b]
 
-        mock_run_cmd.return_value = True
+        mock_run_cmd.return_value = {"returncode": 0, "stdout": "", "stderr": "", "cached": False}
 
         # Args
         args = MagicMock()
@@ -26,18 +26,26 @@ class TestExecutionOrder(unittest.TestCase):
         args.fail_fast = False
         args.parallel = False
         args.from_root = False
+        args.since = None
+        args.affected = None
+        args.cache = False
+        args.timeout = None
+        args.resources = False
+        args.trace = None
+        args.shard = None
+        args.discovery = "auto"
         
         console = MagicMock()
 
         run_command.execute(args, console)
 
-        # Check that run_project_command was called in order: B then A
+        # Check that run_with_cache was called in order: B then A
 
         calls = mock_run_cmd.call_args_list
         self.assertEqual(len(calls), 2)
 
-        first_call_path = calls[0][0][0]
-        second_call_path = calls[1][0][0]
+        first_call_path = calls[0][0][3]
+        second_call_path = calls[1][0][3]
 
         self.assertEqual(first_call_path, Path("/b"))
         self.assertEqual(second_call_path, Path("/a"))
@@ -60,6 +60,7 @@ def test_gc_project_failure(mock_project):
 def test_gc_command_all_success(mock_console):
     args = MagicMock()
     args.path = "."
+    args.parallel = False
     args.project_name = "all"
 
     projects = [
@@ -80,6 +81,7 @@ def test_gc_command_all_success(mock_console):
 def test_gc_command_single_success(mock_console):
     args = MagicMock()
     args.path = "."
+    args.parallel = False
     args.project_name = "p1"
 
     projects = [
@@ -98,6 +100,7 @@ def test_gc_command_single_success(mock_console):
 def test_gc_command_single_not_found(mock_console):
     args = MagicMock()
     args.path = "."
+    args.parallel = False
     args.project_name = "unknown"
 
     projects = [
@@ -113,6 +116,7 @@ def test_gc_command_single_not_found(mock_console):
 def test_gc_command_mixed_results(mock_console):
     args = MagicMock()
     args.path = "."
+    args.parallel = False
     args.project_name = "all"
 
     projects = [
@@ -131,6 +135,7 @@ def test_gc_command_mixed_results(mock_console):
 def test_gc_command_single_failure(mock_console):
     args = MagicMock()
     args.path = "."
+    args.parallel = False
     args.project_name = "p1"
 
     projects = [
@@ -143,3 +148,26 @@ def test_gc_command_single_failure(mock_console):
         with pytest.raises(SystemExit) as exc:
             gc_command.execute(args, mock_console)
         assert exc.value.code == 1
+
+def test_gc_command_parallel_reports_in_project_order(mock_console):
+    args = MagicMock()
+    args.path = "."
+    args.project_name = "all"
+    args.parallel = True
+    args.jobs = 4
+
+    projects = [Project(name=f"p{i}", version="1.0", path=Path(f"/p{i}")) for i in range(4)]
+
+    with patch("relm.commands.gc_command.find_projects", return_value=projects), \
+         patch("relm.commands.gc_command.gc_project", side_effect=lambda p: p.name != "p2") as mock_gc:
+
+        gc_command.execute(args, mock_console)
+
+        assert mock_gc.call_count == 4
+        results = [c.args[0] for c in mock_console.print.call_args_list if str(c.args[0]).startswith(("[green]", "[red]"))]
+        assert results == [
+            "[green]Successfully ran git gc for p0[/green]",
+            "[green]Successfully ran git gc for p1[/green]",
+            "[red]Failed to run git gc for p2[/red]",
+            "[green]Successfully ran git gc for p3[/green]",
+        ]
@@ -16,7 +16,12 @@ from relm.git_ops import (
     git_has_changes,
     get_current_branch,
     get_commit_log,
-    git_has_changes_since
+    git_has_changes_since,
+    git_changed_files,
+    find_repo_root,
+    git_repo_status,
+    batch_git_status,
+    PathStatus
 )
 
 class TestGitOps(unittest.TestCase):
@@ -170,6 +175,66 @@ class TestGitOps(unittest.TestCase):
     def test_git_has_changes_since_true(self, mock_run):
         mock_run.side_effect = subprocess.CalledProcessError(1, "cmd")
         self.assertTrue(git_has_changes_since(self.path, "main"))
+    @patch("relm.git_ops.run_git_command")
+    def test_git_changed_files(self, mock_run_git):
+        mock_run_git.return_value = "a/x.py\0b c/y.py\0"
+        self.assertEqual(git_changed_files(self.path, "main"), ["a/x.py", "b c/y.py"])
+        mock_run_git.assert_called_with(["diff", "--name-only", "-z", "main", "HEAD"], cwd=self.path)
+
+    def test_find_repo_root(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve()
+            (root / ".git").mkdir()
+            (root / "pkg" / "src").mkdir(parents=True)
+            self.assertEqual(find_repo_root(root / "pkg" / "src"), root)
+
+    @patch("relm.git_ops.run_git_command")
+    def test_git_repo_status_parses_porcelain_v2(self, mock_run_git):
+        mock_run_git.return_value = "\0".join([
+            "# branch.oid 0123",
+            "# branch.head main",
+            "1 .M N... 100644 100644 100644 aaa bbb pkg a/mod.py",
+            "2 R. N... 100644 100644 100644 aaa bbb R100 pkg b/new.py",
+            "pkg c/old.py",
+            "u UU N... 100644 100644 100644 100644 aaa bbb ccc conflict.txt",
+        ])
+        status = git_repo_status(self.path)
+        self.assertEqual(status.branch, "main")
+        self.assertEqual(status.changed, ["pkg a/mod.py", "pkg b/new.py", "pkg c/old.py", "conflict.txt"])
+        mock_run_git.assert_called_with(
+            ["status", "--porcelain=v2", "--branch", "-z", "--untracked-files=no"], cwd=self.path
+        )
+
+    @patch("relm.git_ops.run_git_command")
+    def test_git_repo_status_detached_head(self, mock_run_git):
+        mock_run_git.return_value = "# branch.oid 0123\0# branch.head (detached)"
+        self.assertEqual(git_repo_status(self.path), ("HEAD", []))
+
+    @patch("relm.git_ops.run_git_command")
+    def test_batch_git_status_runs_once_per_repo(self, mock_run_git):
+        import tempfile
+        mock_run_git.return_value = "# branch.head dev\0" "1 .M N... 100644 100644 100644 a b libs/one/src/x.py"
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve()
+            (root / ".git").mkdir()
+            one, two, outside = root / "libs" / "one", root / "libs" / "two", root.parent / "no-repo-here"
+            statuses = batch_git_status([one, two, root, outside])
+
+        self.assertEqual(mock_run_git.call_count, 1)
+        self.assertEqual(statuses[one], PathStatus("dev", False))
+        self.assertEqual(statuses[two], PathStatus("dev", True))
+        self.assertEqual(statuses[root], PathStatus("dev", False))
+        self.assertEqual(statuses[outside], PathStatus("unknown", False))
+
+    @patch("relm.git_ops.run_git_command")
+    def test_batch_git_status_failure_marks_unknown(self, mock_run_git):
+        import tempfile
+        mock_run_git.side_effect = subprocess.CalledProcessError(128, "git")
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve()
+            (root / ".git").mkdir()
+            self.assertEqual(batch_git_status([root]), {root: PathStatus("unknown", False)})
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from relm import git_session
+from relm.git_ops import get_current_branch, git_tag, git_tag_exists
+from relm.git_session import GitSession, close_sessions, session_for
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "t")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "t@example.com")
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=tmp_path, check=True)
+    (tmp_path / "README").write_text("hi\n")
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "tag", "v1.0.0"], cwd=tmp_path, check=True)
+    yield tmp_path.resolve()
+    close_sessions()
+
+def test_refs_are_loaded_once(repo):
+    session = GitSession(repo)
+    real_run = subprocess.run
+    with patch("relm.git_session.subprocess.run", side_effect=real_run) as mock_run:
+        assert session.tag_exists("v1.0.0")
+        assert not session.tag_exists("v2.0.0")
+        assert session.current_branch() == "main"
+    assert mock_run.call_count == 1
+    assert set(session.refs()) == {"refs/heads/main", "refs/tags/v1.0.0"}
+
+def test_resolve_uses_persistent_batch_process(repo):
+    session = GitSession(repo)
+    head = session.resolve("HEAD")
+    assert head is not None and len(head) == 40
+    batch = session._batch
+    assert session.resolve("v1.0.0^{commit}") == head
+    assert session.resolve("does-not-exist") is None
+    assert session._batch is batch
+    session.close()
+    assert session._batch is None
+
+def test_detached_and_unborn_heads(repo, tmp_path_factory):
+    subprocess.run(["git", "checkout", "-q", "--detach"], cwd=repo, check=True)
+    assert GitSession(repo).current_branch() == "HEAD"
+
+    empty = tmp_path_factory.mktemp("empty")
+    subprocess.run(["git", "init", "-q"], cwd=empty, check=True)
+    session = GitSession(empty)
+    assert session.current_branch() == "unknown"
+    session.close()
+
+def test_git_ops_use_shared_session_and_invalidate_on_tag(repo):
+    assert session_for(repo / "README") is session_for(repo)
+    assert git_tag_exists(repo, "v1.0.0")
+    assert not git_tag_exists(repo, "v1.1.0")
+    assert get_current_branch(repo) == "main"
+
+    git_tag(repo, "v1.1.0", "Release v1.1.0")
+    assert git_tag_exists(repo, "v1.1.0")
+
+def test_session_for_outside_git(tmp_path):
+    with patch.object(git_session, "find_repo_root", return_value=None):
+        assert session_for(tmp_path) is None
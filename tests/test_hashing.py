@@ -0,0 +1,150 @@
+import os
+import shutil
+import subprocess
+import time
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from relm.core import Project
+from relm.hashing import FileTreeHasher, git_blob_digest
+from relm.commands import hash_command
+
+def _age(path, seconds=60):
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+def _make_tree(root):
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("a = 1\n")
+    (root / "pkg" / "b.py").write_text("b = 2\n")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "a.pyc").write_bytes(b"\0")
+    for path in [root / "pkg" / "a.py", root / "pkg" / "b.py"]:
+        _age(path)
+
+def test_git_blob_digest_matches_git_object_id(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("hello\n")
+    # `printf 'hello\n' | git hash-object --stdin`
+    assert git_blob_digest(path) == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+def test_memo_skips_unchanged_files_and_persists(tmp_path):
+    _make_tree(tmp_path)
+
+    hasher = FileTreeHasher(tmp_path)
+    first = hasher.hash_tree(tmp_path)
+    assert (first.files, first.hashed, first.source) == (2, 2, "walk")
+    hasher.save()
+    assert hasher.memo_path.exists()
+
+    reloaded = FileTreeHasher(tmp_path)
+    second = reloaded.hash_tree(tmp_path)
+    assert second.digest == first.digest
+    assert second.hashed == 0
+
+    (tmp_path / "pkg" / "a.py").write_text("a = 10\n")
+    third = reloaded.hash_tree(tmp_path)
+    assert third.hashed == 1
+    assert third.digest != first.digest
+
+def test_save_prunes_memo_entries_the_walk_did_not_visit(tmp_path):
+    _make_tree(tmp_path)
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "c.py").write_text("c = 3\n")
+    _age(tmp_path / "other" / "c.py")
+    hasher = FileTreeHasher(tmp_path)
+    hasher.hash_tree(tmp_path)
+    hasher.save()
+    assert {"pkg/a.py", "other/c.py"} <= set(hasher.memo)
+
+    (tmp_path / "pkg" / "a.py").unlink()
+    reloaded = FileTreeHasher(tmp_path)
+    reloaded.hash_tree(tmp_path / "pkg")
+    reloaded.save()
+
+    memo = FileTreeHasher(tmp_path).memo
+    assert "pkg/a.py" not in memo
+    assert "pkg/b.py" in memo
+    # Outside the tree that was walked, so kept
+    assert "other/c.py" in memo
+
+def test_recently_modified_files_are_not_memoized(tmp_path):
+    (tmp_path / "fresh.py").write_text("x = 1\n")
+    hasher = FileTreeHasher(tmp_path)
+    hasher.hash_tree(tmp_path)
+    assert hasher.memo == {}
+
+def test_corrupt_memo_is_ignored(tmp_path):
+    _make_tree(tmp_path)
+    hasher = FileTreeHasher(tmp_path)
+    hasher.hash_tree(tmp_path)
+    hasher.save()
+    hasher.memo_path.write_text("{not json")
+
+    assert FileTreeHasher(tmp_path).memo == {}
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_clean_git_tree_uses_index_and_matches_worktree_digest(tmp_path):
+    _make_tree(tmp_path)
+    (tmp_path / ".gitignore").write_text("__pycache__/\n")
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run(git + ["init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(git + ["add", "."], cwd=tmp_path, check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+
+    hasher = FileTreeHasher()
+    clean = hasher.hash_tree(tmp_path / "pkg")
+    assert clean.source == "git-index"
+    assert (clean.files, clean.hashed) == (2, 0)
+
+    with patch.object(FileTreeHasher, "_hash_from_git_index", return_value=None):
+        worktree = hasher.hash_tree(tmp_path / "pkg")
+    assert worktree.source == "git-worktree"
+    assert worktree.digest == clean.digest
+
+    (tmp_path / "pkg" / "c.py").write_text("c = 3\n")
+    dirty = hasher.hash_tree(tmp_path / "pkg")
+    assert dirty.source == "git-worktree"
+    assert dirty.files == 3
+    assert dirty.digest != clean.digest
+
+def test_hash_command_prints_digest_for_project(tmp_path):
+    _make_tree(tmp_path)
+    project = Project(name="lib", version="1.0", path=tmp_path)
+    console = MagicMock()
+    args = Namespace(path=str(tmp_path), project_name="lib")
+
+    with patch("relm.commands.hash_command.find_projects", return_value=[project]):
+        hash_command.execute(args, console)
+
+    table = console.print.call_args[0][0]
+    assert table.row_count == 1
+    assert (tmp_path / ".relm" / "hashes").exists()
+    digest = FileTreeHasher(tmp_path).hash_tree(tmp_path).digest
+    assert list(table.columns[1].cells) == [digest[:12]]
+
+    with patch("relm.commands.hash_command.find_projects", return_value=[project]):
+        hash_command.execute(Namespace(path=str(tmp_path), project_name="lib", full=True), console)
+    assert list(console.print.call_args[0][0].columns[1].cells) == [digest]
+
+def test_hash_table_fits_an_80_column_terminal(tmp_path):
+    from rich.console import Console
+    _make_tree(tmp_path)
+    project = Project(name="my-library", version="1.0", path=tmp_path)
+    console = Console(record=True, width=80)
+
+    with patch("relm.commands.hash_command.find_projects", return_value=[project]):
+        hash_command.execute(Namespace(path=str(tmp_path), project_name="all"), console)
+
+    output = console.export_text()
+    for header in ("Files", "Hashed", "Source"):
+        assert header in output
+
+def test_hash_command_unknown_project_exits(tmp_path):
+    console = MagicMock()
+    args = Namespace(path=str(tmp_path), project_name="missing")
+    with patch("relm.commands.hash_command.find_projects", return_value=[]):
+        with pytest.raises(SystemExit):
+            hash_command.execute(args, console)
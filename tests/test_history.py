@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+
+from relm.history import DurationHistory, critical_paths, fill_unknown, history_for
+from relm.runner import DependencyScheduler, execute_in_parallel, simulate_makespan
+
+def test_history_round_trip_and_moving_average(tmp_path):
+    history = DurationHistory(tmp_path, "run:make test")
+    assert history.estimates(["a"]) == {}
+    assert not history.file_path.exists()
+
+    history.record("a", 10.0)
+    history.record("b", 4.0)
+    history.save()
+    history.record("a", 20.0)
+    history.save()
+
+    assert DurationHistory(tmp_path, "run:make test").estimates(["a", "b", "c"]) == {"a": 15.0, "b": 4.0}
+    assert DurationHistory(tmp_path, "run:other").estimates(["a"]) == {}
+
+def test_history_ignores_unusable_database(tmp_path):
+    history = DurationHistory(tmp_path, "run:x")
+    history.file_path.parent.mkdir()
+    history.file_path.write_text("not a database")
+    assert history.estimates(["a"]) == {}
+    history.record("a", 1.0)
+    history.save()
+
+def test_history_for_respects_config(tmp_path):
+    assert history_for(tmp_path, {}, "run:x").command == "run:x"
+    assert history_for(tmp_path, {"history": {"enabled": False}}, "run:x") is None
+
+def test_fill_unknown_uses_mean_of_known():
+    assert fill_unknown({"a": 2.0, "b": 4.0}, ["a", "c"]) == {"a": 2.0, "c": 3.0}
+    assert fill_unknown({}, ["a"]) == {"a": 1.0}
+
+def test_critical_paths_follow_longest_dependent_chain_and_ignore_cycles():
+    dependents = {"lib": ["app", "cli"], "app": ["e2e"], "cli": [], "e2e": []}
+    lengths = critical_paths(dependents, {"lib": 1, "app": 2, "cli": 10, "e2e": 3})
+    assert lengths == {"lib": 11, "app": 5, "cli": 10, "e2e": 3}
+
+    cyclic = critical_paths({"a": ["b"], "b": ["a"]}, {"a": 1, "b": 2})
+    assert cyclic["a"] == 3
+
+def test_scheduler_starts_longest_critical_path_first(make_project):
+    quick = make_project("quick")
+    head = make_project("head")
+    tail = make_project("tail", ["head"])
+    projects = [quick, head, tail]
+
+    assert DependencyScheduler(projects).pop_ready() == "quick"
+    assert DependencyScheduler(projects, {"quick": 5, "head": 1, "tail": 10}).pop_ready() == "head"
+
+def test_simulated_makespan_prefers_critical_path(make_project):
+    quick = make_project("quick")
+    head = make_project("head")
+    tail = make_project("tail", ["head"])
+    durations = {"quick": 5.0, "head": 1.0, "tail": 10.0}
+    # head (then tail) on one worker while quick runs on the other
+    assert simulate_makespan([quick, head, tail], durations, 2) == 11.0
+    assert simulate_makespan([quick, head, tail], durations, 1) == 16.0
+
+def test_execute_in_parallel_orders_by_history_and_records_durations(tmp_path, make_project):
+    quick = make_project("quick")
+    head = make_project("head")
+    tail = make_project("tail", ["head"])
+    seeded = DurationHistory(tmp_path, "run:t")
+    for name, seconds in {"quick": 5.0, "head": 1.0, "tail": 10.0}.items():
+        seeded.record(name, seconds)
+    seeded.save()
+
+    started = []
+    def fake_run(path, cmd, **kwargs):
+        started.append(path.name)
+        return {"returncode": 0, "stdout": "", "stderr": ""}
+
+    history = DurationHistory(tmp_path, "run:t")
+    with patch("relm.runner.run_project_command_tail", side_effect=fake_run):
+        results = execute_in_parallel([quick, head, tail], lambda p: "true", max_workers=1, history=history)
+
+    assert started == ["head", "tail", "quick"]
+    assert all(r["estimated_makespan"] == 16.0 for r in results)
+    assert sorted(name for name, _ in history._pending) == ["head", "quick", "tail"]
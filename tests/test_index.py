@@ -0,0 +1,94 @@
+import json
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
+from relm.core import find_projects
+from relm.index import ProjectIndex, MISS
+from relm.commands import index_command
+
+def _write_project(path, name, version="1.0.0"):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "pyproject.toml").write_text(f'[project]\nname = "{name}"\nversion = "{version}"\ndependencies = ["lib-a>=1.0"]\n')
+
+def test_find_projects_writes_index(tmp_path):
+    _write_project(tmp_path / "app", "app")
+
+    projects = find_projects(tmp_path, use_cache=True)
+
+    assert [p.name for p in projects] == ["app"]
+    index_file = tmp_path / ".relm" / "index"
+    assert index_file.exists()
+    assert (tmp_path / ".relm" / ".gitignore").exists()
+    entries = json.loads(index_file.read_text())["entries"]
+    assert entries[str(tmp_path / "app" / "pyproject.toml")]["project"]["dependencies"] == ["lib-a"]
+
+def test_find_projects_uses_index_for_unchanged_files(tmp_path):
+    _write_project(tmp_path / "app", "app")
+    find_projects(tmp_path, use_cache=True)
+
+    with patch("relm.core._parse_project_fields") as mock_parse:
+        projects = find_projects(tmp_path, use_cache=True)
+
+    mock_parse.assert_not_called()
+    assert projects[0].name == "app"
+    assert projects[0].dependencies == ["lib-a"]
+
+def test_find_projects_reparses_changed_files(tmp_path):
+    _write_project(tmp_path / "app", "app", version="1.0.0")
+    find_projects(tmp_path, use_cache=True)
+
+    _write_project(tmp_path / "app", "app", version="2.0.0-changed")
+    projects = find_projects(tmp_path, use_cache=True)
+
+    assert projects[0].version == "2.0.0-changed"
+
+def test_find_projects_drops_entries_for_removed_projects(tmp_path):
+    _write_project(tmp_path / "app", "app")
+    _write_project(tmp_path / "old", "old")
+    _write_project(tmp_path / "deep" / "a" / "b" / "c", "deep")
+    find_projects(tmp_path, recursive=True, max_depth=4, use_cache=True)
+
+    (tmp_path / "old" / "pyproject.toml").unlink()
+    find_projects(tmp_path, use_cache=True)
+
+    entries = json.loads((tmp_path / ".relm" / "index").read_text())["entries"]
+    assert str(tmp_path / "app" / "pyproject.toml") in entries
+    assert str(tmp_path / "old" / "pyproject.toml") not in entries
+    # Beyond the depth this discovery scanned, so not known to be stale
+    assert str(tmp_path / "deep" / "a" / "b" / "c" / "pyproject.toml") in entries
+
+def test_no_index_flag_disables_the_index(tmp_path):
+    from relm.main import main
+    _write_project(tmp_path / "app", "app")
+
+    with patch("sys.argv", ["relm", "list", "--path", str(tmp_path), "--no-index", "--quiet"]), \
+         patch("relm.commands.list_command.find_projects", wraps=find_projects) as mock_find:
+        main()
+
+    assert mock_find.call_args.kwargs["use_cache"] is False
+
+def test_find_projects_without_cache_does_not_write_index(tmp_path):
+    _write_project(tmp_path / "app", "app")
+    find_projects(tmp_path)
+    assert not (tmp_path / ".relm").exists()
+
+def test_index_load_ignores_corrupt_file(tmp_path):
+    (tmp_path / ".relm").mkdir()
+    (tmp_path / ".relm" / "index").write_text("not json")
+
+    index = ProjectIndex.load(tmp_path)
+
+    assert index.entries == {}
+    stat = (tmp_path / ".relm" / "index").stat()
+    assert index.lookup(tmp_path / "pyproject.toml", stat) is MISS
+
+def test_index_rebuild_command(tmp_path):
+    _write_project(tmp_path / "app", "app")
+    find_projects(tmp_path, use_cache=True)
+    console = MagicMock()
+    args = Namespace(path=str(tmp_path), action="rebuild")
+
+    with patch("relm.core._parse_project_fields", wraps=lambda f: None) as mock_parse:
+        index_command.execute(args, console)
+
+    mock_parse.assert_called_once()
+    console.print.assert_called()
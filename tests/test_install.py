@@ -1,36 +1,84 @@
+import os
 import sys
 import subprocess
+import time
+from types import SimpleNamespace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 import pytest
-from relm.install import install_project
+from relm.install import InstallResult, install_project
 from relm.core import Project
 
 @pytest.fixture
 def mock_project():
     return Project(name="test_project", path=Path("/tmp/test_project"), version="0.1.0")
 
+def _mock_popen(returncode=0, wait_side_effect=None):
+    process = MagicMock(pid=4321)
+    process.wait.side_effect = wait_side_effect or [returncode]
+    return patch("relm.install.subprocess.Popen", return_value=process)
+
 def test_install_project_success_editable(mock_project):
-    with patch("subprocess.run") as mock_run:
+    with _mock_popen() as mock_popen:
         result = install_project(mock_project, editable=True)
-        assert result is True
-        mock_run.assert_called_once_with(
-            [sys.executable, "-m", "pip", "install", "-e", "."],
-            cwd=mock_project.path,
-            check=True
-        )
+        assert result == InstallResult(True)
+        assert mock_popen.call_args.args[0] == [sys.executable, "-m", "pip", "install", "-e", "."]
+        assert mock_popen.call_args.kwargs["cwd"] == mock_project.path
+        # No timeout: pip stays attached to the terminal so it can prompt
+        assert mock_popen.call_args.kwargs == {"cwd": mock_project.path}
 
 def test_install_project_success_standard(mock_project):
-    with patch("subprocess.run") as mock_run:
-        result = install_project(mock_project, editable=False)
-        assert result is True
-        mock_run.assert_called_once_with(
-            [sys.executable, "-m", "pip", "install", "."],
-            cwd=mock_project.path,
-            check=True
-        )
+    with _mock_popen() as mock_popen:
+        assert install_project(mock_project, editable=False)
+        assert mock_popen.call_args.args[0] == [sys.executable, "-m", "pip", "install", "."]
 
 def test_install_project_failure(mock_project):
-    with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "pip")):
+    with _mock_popen(returncode=1):
         result = install_project(mock_project)
-        assert result is False
+        assert not result and not result.timed_out
+
+def test_install_project_timeout_terminates_process_group(mock_project):
+    with _mock_popen(wait_side_effect=[subprocess.TimeoutExpired("pip", 5), -15]) as mock_popen, \
+            patch("relm.install.terminate_process_group") as mock_terminate:
+        result = install_project(mock_project, timeout=5)
+    assert result == InstallResult(False, timed_out=True)
+    assert mock_popen.return_value.wait.call_args_list[0].kwargs == {"timeout": 5}
+    assert set(mock_popen.call_args.kwargs) > {"cwd"}
+    mock_terminate.assert_called_once_with(4321)
+
+@pytest.mark.skipif(os.name != "posix", reason="needs process groups")
+def test_install_timeout_kills_build_backend_children(tmp_path, monkeypatch):
+    # Stands in for pip: starts a long-lived child, as a build backend would
+    pid_file = tmp_path / "child.pid"
+    fake_python = tmp_path / "python"
+    fake_python.write_text(f"#!/bin/sh\nsleep 30 &\necho $! > {pid_file}\nwait\n")
+    fake_python.chmod(0o755)
+    monkeypatch.setattr("relm.install.sys", SimpleNamespace(executable=str(fake_python)))
+    project = Project(name="slow", path=tmp_path, version="1.0")
+
+    result = install_project(project, timeout=0.5)
+
+    assert result.timed_out
+    child = int(pid_file.read_text())
+    for _ in range(50):
+        try:
+            os.kill(child, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("build backend child survived the timeout")
+
+def test_install_command_reports_sequential_timeouts(tmp_path):
+    from argparse import Namespace
+    from rich.console import Console
+    from relm.commands import install_command
+
+    projects = [Project(name="slow", path=tmp_path, version="1.0")]
+    console = Console(record=True, width=120)
+    args = Namespace(path=str(tmp_path), project_name="all", no_editable=False, parallel=False, timeout=5, config={})
+    with patch("relm.commands.install_command.find_projects", return_value=projects), \
+            patch("relm.commands.install_command.install_project", return_value=InstallResult(False, timed_out=True)):
+        install_command.execute(args, console)
+
+    assert "TIMEOUT" in console.export_text()
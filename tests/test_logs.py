@@ -0,0 +1,117 @@
+import os
+import subprocess
+import sys
+import time
+from argparse import Namespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from relm.commands import logs_command
+from relm.core import Project
+from relm.logs import (
+    OWNER_FILE_NAME, RUN_GRACE_SECONDS, RunLogs, find_log, iter_lines, list_runs, log_file_name, logs_for, logs_root, tail_lines,
+)
+from relm.runner import execute_in_parallel
+
+def _old_run(root, run, owner=None):
+    directory = logs_root(root) / run
+    directory.mkdir(parents=True)
+    if owner is not None:
+        (directory / OWNER_FILE_NAME).write_text(str(owner))
+    old = time.time() - 2 * RUN_GRACE_SECONDS
+    os.utime(directory, (old, old))
+    return directory
+
+def test_run_logs_are_created_lazily_and_prune_old_runs(tmp_path):
+    for run in ("20240101-000000-1", "20240102-000000-1", "20240103-000000-1"):
+        _old_run(tmp_path, run)
+
+    logs = RunLogs(tmp_path, run_id="20240104-000000-1", keep=2)
+    assert not logs.directory.exists()
+
+    path = logs.path_for("lib:build")
+    assert path == logs.directory / "lib_build.log"
+    assert list_runs(tmp_path) == ["20240103-000000-1", "20240104-000000-1"]
+
+def test_prune_skips_runs_still_in_use(tmp_path):
+    finished = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True, check=True)
+    _old_run(tmp_path, "20240101-000000-1", owner=int(finished.stdout))
+    _old_run(tmp_path, "20240102-000000-1", owner=os.getpid())
+    (logs_root(tmp_path) / "20240103-000000-1").mkdir()
+
+    logs = RunLogs(tmp_path, run_id="20240104-000000-1", keep=1)
+    logs.path_for("lib")
+
+    # The finished run goes; the live owner's run and the fresh one stay
+    assert list_runs(tmp_path) == ["20240102-000000-1", "20240103-000000-1", "20240104-000000-1"]
+    assert (logs.directory / OWNER_FILE_NAME).read_text() == str(os.getpid())
+
+def test_logs_for_respects_config(tmp_path):
+    assert logs_for(tmp_path, {"logs": {"keep": 3}}).keep == 3
+    assert logs_for(tmp_path, {"logs": {"enabled": False}}) is None
+
+def test_iter_and_tail_lines(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"one\ntwo\nthree")
+    assert list(iter_lines(path)) == [b"one", b"two", b"three"]
+    assert list(iter_lines(path, start=1)) == [b"two", b"three"]
+    assert tail_lines(path, 2) == [b"two", b"three"]
+    assert tail_lines(path, 10) == [b"one", b"two", b"three"]
+
+    path.write_bytes(b"one\ntwo\n")
+    assert tail_lines(path, 1) == [b"two"]
+    assert list(iter_lines(path)) == [b"one", b"two"]
+
+    path.write_bytes(b"")
+    assert list(iter_lines(path)) == [] and tail_lines(path, 5) == []
+
+def test_find_log_prefers_newest_run(tmp_path):
+    for run in ("20240101-000000-1", "20240102-000000-1"):
+        (logs_root(tmp_path) / run).mkdir(parents=True)
+        (logs_root(tmp_path) / run / log_file_name("lib")).write_text(run)
+    (logs_root(tmp_path) / "20240103-000000-1").mkdir()
+
+    assert find_log(tmp_path, "lib").read_text() == "20240102-000000-1"
+    assert find_log(tmp_path, "lib", "20240101-000000-1").read_text() == "20240101-000000-1"
+    assert find_log(tmp_path, "app") is None
+
+@pytest.mark.parametrize("backend", ["thread", "asyncio", "select"])
+def test_parallel_tasks_stream_full_output_to_log(tmp_path, backend, python_command):
+    project = Project(name="p", version="1.0", path=tmp_path, dependencies=[])
+    logs = RunLogs(tmp_path)
+    cmd = python_command("import sys\nfor i in range(500): print('line', i)\nsys.exit(1)")
+
+    [result] = execute_in_parallel([project], lambda p: cmd, backend=backend, run_logs=logs)
+
+    assert len(result["stdout"].splitlines()) == 50
+    assert result["log_path"] == logs.path_for("p")
+    lines = list(iter_lines(result["log_path"]))
+    assert len(lines) == 500 and lines[0] == b"line 0" and lines[-1] == b"line 499"
+
+def _args(tmp_path, **overrides):
+    values = dict(path=str(tmp_path), project_name=None, run=None, tail=None, start=1, lines=None, no_pager=True)
+    values.update(overrides)
+    return Namespace(**values)
+
+def test_logs_command_pages_through_a_log(tmp_path, capsysbinary):
+    path = RunLogs(tmp_path, run_id="20240101-000000-1").path_for("lib")
+    path.write_bytes(b"".join(b"line %d\n" % i for i in range(100)))
+
+    logs_command.execute(_args(tmp_path, project_name="lib", start=10, lines=2), MagicMock())
+    assert capsysbinary.readouterr().out == b"line 9\nline 10\n"
+
+    logs_command.execute(_args(tmp_path, project_name="lib", tail=1), MagicMock())
+    assert capsysbinary.readouterr().out == b"line 99\n"
+
+def test_logs_command_lists_runs_and_reports_missing_logs(tmp_path):
+    console = MagicMock()
+    logs_command.execute(_args(tmp_path), console)
+    assert "No logs recorded yet" in console.print.call_args[0][0]
+
+    RunLogs(tmp_path, run_id="20240101-000000-1").path_for("lib").write_text("x")
+    logs_command.execute(_args(tmp_path, run="20240101-000000-1"), console)
+    assert console.print.call_args[0][0].startswith("lib ")
+
+    with pytest.raises(SystemExit):
+        logs_command.execute(_args(tmp_path, project_name="app"), console)
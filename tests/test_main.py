@@ -6,8 +6,16 @@ from pathlib import Path
 import sys
 from relm.main import main, list_projects
 from relm.core import Project
+from relm.install import InstallResult
+from relm.git_ops import PathStatus
 from relm.commands import list_command
 
+def _console_mock():
+    """Stands in for relm.main._console; calling it returns the same mock."""
+    console = MagicMock()
+    console.return_value = console
+    return console
+
 class TestMain(unittest.TestCase):
     def _create_mock_args(self, **kwargs):
         args = MagicMock()
@@ -18,12 +26,20 @@ class TestMain(unittest.TestCase):
         args.parallel = False
         args.jobs = None
         args.from_root = False
+        args.since = None
+        args.affected = None
+        args.cache = False
+        args.timeout = None
+        args.resources = False
+        args.trace = None
+        args.shard = None
+        args.discovery = "auto"
         for k, v in kwargs.items():
             setattr(args, k, v)
         return (args, [])
 
     @patch("relm.commands.list_command.find_projects")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_list_projects(self, mock_console, mock_find_projects):
         mock_find_projects.return_value = [
             Project("proj1", "6.0.0", Path("path/to/proj1"), "desc1"),
@@ -37,7 +53,7 @@ class TestMain(unittest.TestCase):
         self.assertTrue(hasattr(args[0], "rows")) # It's a Table object
 
     @patch("relm.commands.list_command.find_projects")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_list_projects_empty(self, mock_console, mock_find_projects):
         mock_find_projects.return_value = []
         list_projects(Path("."))
@@ -53,7 +69,7 @@ class TestMain(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.release_command.find_projects")
     @patch("relm.commands.release_command.perform_release")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_release_single_success(self, mock_console, mock_perform_release, mock_find_projects, mock_parse_known_args):
         from relm.commands.release_command import execute as release_execute
 
@@ -81,7 +97,7 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.release_command.find_projects")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_release_project_not_found(self, mock_console, mock_find_projects, mock_parse_known_args):
         from relm.commands.release_command import execute as release_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -101,7 +117,7 @@ class TestMain(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.release_command.find_projects")
     @patch("relm.commands.release_command.perform_release")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_release_all(self, mock_console, mock_perform_release, mock_find_projects, mock_parse_known_args):
         from relm.commands.release_command import execute as release_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -124,7 +140,7 @@ class TestMain(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.release_command.find_projects")
     @patch("relm.commands.release_command.perform_release")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_release_all_exception(self, mock_console, mock_perform_release, mock_find_projects, mock_parse_known_args):
         from relm.commands.release_command import execute as release_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -145,8 +161,8 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.run_command.find_projects")
-    @patch("relm.commands.run_command.run_project_command")
-    @patch("relm.main.console")
+    @patch("relm.commands.run_command.run_with_cache")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_run_all(self, mock_console, mock_run_cmd, mock_find_projects, mock_parse_known_args):
         from relm.commands.run_command import execute as run_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -159,7 +175,7 @@ class TestMain(unittest.TestCase):
         p1 = Project("proj1", "6.0.0", Path("."), "desc")
         p2 = Project("proj2", "6.0.0", Path("."), "desc")
         mock_find_projects.return_value = [p1, p2]
-        mock_run_cmd.return_value = True
+        mock_run_cmd.return_value = {"returncode": 0, "stdout": "", "stderr": "", "cached": False}
 
         main()
 
@@ -167,8 +183,8 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.run_command.find_projects")
-    @patch("relm.commands.run_command.run_project_command")
-    @patch("relm.main.console")
+    @patch("relm.commands.run_command.run_with_cache")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_run_fail_fast(self, mock_console, mock_run_cmd, mock_find_projects, mock_parse_known_args):
         from relm.commands.run_command import execute as run_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -181,7 +197,7 @@ class TestMain(unittest.TestCase):
         p1 = Project("proj1", "6.0.0", Path("."), "desc")
         p2 = Project("proj2", "6.0.0", Path("."), "desc")
         mock_find_projects.return_value = [p1, p2]
-        mock_run_cmd.return_value = False
+        mock_run_cmd.return_value = {"returncode": 1, "stdout": "", "stderr": "", "cached": False}
 
         with self.assertRaises(SystemExit):
             main()
@@ -190,8 +206,8 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.run_command.find_projects")
-    @patch("relm.commands.run_command.run_project_command")
-    @patch("relm.main.console")
+    @patch("relm.commands.run_command.run_with_cache")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_run_single_success(self, mock_console, mock_run_cmd, mock_find_projects, mock_parse_known_args):
         from relm.commands.run_command import execute as run_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -203,7 +219,7 @@ class TestMain(unittest.TestCase):
         )
         p1 = Project("proj1", "6.0.0", Path("."), "desc")
         mock_find_projects.return_value = [p1]
-        mock_run_cmd.return_value = True
+        mock_run_cmd.return_value = {"returncode": 0, "stdout": "", "stderr": "", "cached": False}
 
         main()
 
@@ -211,7 +227,7 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.run_command.find_projects")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_run_project_not_found(self, mock_console, mock_find_projects, mock_parse_known_args):
         from relm.commands.run_command import execute as run_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -232,7 +248,7 @@ class TestMain(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.install_command.find_projects")
     @patch("relm.commands.install_command.install_project")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_install_all(self, mock_console, mock_install, mock_find_projects, mock_parse_known_args):
         from relm.commands.install_command import execute as install_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -244,7 +260,7 @@ class TestMain(unittest.TestCase):
         p1 = Project("proj1", "6.0.0", Path("."), "desc")
         p2 = Project("proj2", "6.0.0", Path("."), "desc")
         mock_find_projects.return_value = [p1, p2]
-        mock_install.return_value = True
+        mock_install.return_value = InstallResult(True)
 
         main()
 
@@ -253,7 +269,7 @@ class TestMain(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.install_command.find_projects")
     @patch("relm.commands.install_command.install_project")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_install_single_success(self, mock_console, mock_install, mock_find_projects, mock_parse_known_args):
         from relm.commands.install_command import execute as install_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -264,7 +280,7 @@ class TestMain(unittest.TestCase):
         )
         p1 = Project("proj1", "6.0.0", Path("."), "desc")
         mock_find_projects.return_value = [p1]
-        mock_install.return_value = True
+        mock_install.return_value = InstallResult(True)
 
         main()
 
@@ -272,7 +288,7 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.install_command.find_projects")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_install_project_not_found(self, mock_console, mock_find_projects, mock_parse_known_args):
         from relm.commands.install_command import execute as install_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -291,10 +307,9 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.status_command.find_projects")
-    @patch("relm.commands.status_command.get_current_branch")
-    @patch("relm.commands.status_command.is_git_clean")
-    @patch("relm.main.console")
-    def test_main_status_all(self, mock_console, mock_is_clean, mock_get_branch, mock_find_projects, mock_parse_known_args):
+    @patch("relm.commands.status_command.batch_git_status")
+    @patch("relm.main._console", new_callable=_console_mock)
+    def test_main_status_all(self, mock_console, mock_status, mock_find_projects, mock_parse_known_args):
         from relm.commands.status_command import execute as status_execute
         mock_parse_known_args.return_value = self._create_mock_args(
             command="status",
@@ -303,8 +318,7 @@ class TestMain(unittest.TestCase):
         )
         p1 = Project("proj1", "6.0.0", Path("."), "desc")
         mock_find_projects.return_value = [p1]
-        mock_get_branch.return_value = "main"
-        mock_is_clean.return_value = True
+        mock_status.return_value = {p1.path: PathStatus("main", True)}
 
         main()
 
@@ -312,10 +326,9 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.status_command.find_projects")
-    @patch("relm.commands.status_command.get_current_branch")
-    @patch("relm.commands.status_command.is_git_clean")
-    @patch("relm.main.console")
-    def test_main_status_single(self, mock_console, mock_is_clean, mock_get_branch, mock_find_projects, mock_parse_known_args):
+    @patch("relm.commands.status_command.batch_git_status")
+    @patch("relm.main._console", new_callable=_console_mock)
+    def test_main_status_single(self, mock_console, mock_status, mock_find_projects, mock_parse_known_args):
         from relm.commands.status_command import execute as status_execute
         mock_parse_known_args.return_value = self._create_mock_args(
             command="status",
@@ -324,8 +337,7 @@ class TestMain(unittest.TestCase):
         )
         p1 = Project("proj1", "6.0.0", Path("."), "desc")
         mock_find_projects.return_value = [p1]
-        mock_get_branch.return_value = "main"
-        mock_is_clean.return_value = True
+        mock_status.return_value = {p1.path: PathStatus("main", True)}
 
         main()
 
@@ -333,7 +345,7 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.status_command.find_projects")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_status_project_not_found(self, mock_console, mock_find_projects, mock_parse_known_args):
         from relm.commands.status_command import execute as status_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -350,15 +362,14 @@ class TestMain(unittest.TestCase):
         mock_console.print.assert_any_call(f"[red]Project or folder 'nonexistent' not found in {root_path}[/red]")
 
     @patch("argparse.ArgumentParser.parse_known_args")
-    @patch("relm.main.Console.input")
-    @patch("relm.main.console")
-    def test_main_safety_check(self, mock_console, mock_input, mock_parse_known_args):
+    @patch("relm.main._console", new_callable=_console_mock)
+    def test_main_safety_check(self, mock_console, mock_parse_known_args):
         mock_parse_known_args.return_value = self._create_mock_args(
             command="list",
             path="/",
             yes=False
         )
-        mock_input.return_value = "n"
+        mock_console.input.return_value = "n"
 
         with self.assertRaises(SystemExit):
             main()
@@ -368,7 +379,7 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.list_command.execute")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_safety_check_yes(self, mock_console, mock_list_execute, mock_parse_known_args):
         mock_parse_known_args.return_value = self._create_mock_args(
             command="list",
@@ -384,7 +395,7 @@ class TestMain(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.verify_command.find_projects")
     @patch("relm.commands.verify_command.verify_project_release")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_verify_all(self, mock_console, mock_verify, mock_find_projects, mock_parse_known_args):
         from relm.commands.verify_command import execute as verify_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -404,7 +415,7 @@ class TestMain(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.clean_command.find_projects")
     @patch("relm.commands.clean_command.clean_project")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_clean_all(self, mock_console, mock_clean_project, mock_find_projects, mock_parse_known_args):
         from relm.commands.clean_command import execute as clean_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -424,7 +435,7 @@ class TestMain(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.clean_command.find_projects")
     @patch("relm.commands.clean_command.clean_project")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_clean_single(self, mock_console, mock_clean_project, mock_find_projects, mock_parse_known_args):
         from relm.commands.clean_command import execute as clean_execute
         mock_parse_known_args.return_value = self._create_mock_args(
@@ -442,7 +453,7 @@ class TestMain(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_known_args")
     @patch("relm.commands.clean_command.find_projects")
-    @patch("relm.main.console")
+    @patch("relm.main._console", new_callable=_console_mock)
     def test_main_clean_project_not_found(self, mock_console, mock_find_projects, mock_parse_known_args):
         from relm.commands.clean_command import execute as clean_execute
         mock_parse_known_args.return_value = self._create_mock_args(
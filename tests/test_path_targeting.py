@@ -4,6 +4,8 @@ from argparse import Namespace
 from rich.console import Console
 from relm.commands import pytest_command, run_command, install_command, status_command
 from relm.core import Project
+from relm.install import InstallResult
+from relm.git_ops import PathStatus
 
 @pytest.fixture
 def mock_projects(tmp_path):
@@ -64,7 +66,8 @@ def test_path_targeting_pytest(mock_projects, tmp_path, mocker):
 
 def test_path_targeting_run(mock_projects, tmp_path, mocker):
     mocker.patch("relm.commands.run_command.find_projects", return_value=mock_projects)
-    mock_run = mocker.patch("relm.commands.run_command.run_project_command", return_value=True)
+    mock_run = mocker.patch("relm.commands.run_command.run_with_cache",
+                            return_value={"returncode": 0, "stdout": "", "stderr": "", "cached": False})
     console = Console()
     
     # Test targeting specific project path
@@ -81,13 +84,13 @@ def test_path_targeting_run(mock_projects, tmp_path, mocker):
     
     run_command.execute(args, console)
     
-    # Should have called run_project_command once for bot1
+    # Should have called run_with_cache once for bot1
     assert mock_run.call_count == 1
-    assert "bot1" in str(mock_run.call_args[0][0])
+    assert "bot1" in str(mock_run.call_args[0][3])
 
 def test_path_targeting_install(mock_projects, tmp_path, mocker):
     mocker.patch("relm.commands.install_command.find_projects", return_value=mock_projects)
-    mock_run = mocker.patch("relm.commands.install_command.install_project", return_value=True)
+    mock_run = mocker.patch("relm.commands.install_command.install_project", return_value=InstallResult(True))
     console = Console()
     
     args = Namespace(
@@ -107,8 +110,10 @@ def test_path_targeting_install(mock_projects, tmp_path, mocker):
 
 def test_path_targeting_status(mock_projects, tmp_path, mocker):
     mocker.patch("relm.commands.status_command.find_projects", return_value=mock_projects)
-    mocker.patch("relm.commands.status_command.get_current_branch", return_value="main")
-    mocker.patch("relm.commands.status_command.is_git_clean", return_value=True)
+    mocker.patch(
+        "relm.commands.status_command.batch_git_status",
+        side_effect=lambda paths, max_workers=1: {p: PathStatus("main", True) for p in paths}
+    )
     
     spy_table = mocker.spy(Console, "print")
     console = Console()
@@ -0,0 +1,135 @@
+import sys
+from argparse import Namespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from relm.commands import pipeline_command
+from relm.pipeline import TaskSpec, expand_pipeline, load_tasks
+from relm.runner import execute_in_parallel, failure_label
+
+TASKS = {
+    "tasks": {
+        "build": {"command": "make build"},
+        "lint": {"command": ["ruff", "check", "."]},
+        "test": {"command": "pytest", "depends": ["^build", "lint"]},
+    }
+}
+
+def test_load_tasks():
+    tasks = load_tasks(TASKS)
+    assert tasks["test"] == TaskSpec("test", "pytest", ["^build", "lint"])
+    assert tasks["lint"].command == ["ruff", "check", "."]
+    assert load_tasks({}) == {}
+
+@pytest.mark.parametrize("tasks, message", [
+    ({"a": {}}, "needs a command"),
+    ({"a": {"command": "x", "depends": "b"}}, "must be a list"),
+    ({"a": {"command": "x", "depends": ["^missing"]}}, "depends on unknown task"),
+    ({"build": {"command": "x"}, "a": {"command": "x", "depends": ["^^build"]}}, "depends on unknown task '\\^\\^build'"),
+    ({"a:b": {"command": "x"}}, "Invalid task name"),
+    ({"a": {"command": "x", "depends": ["b"]}, "b": {"command": "y", "depends": ["a"]}}, "cycle"),
+])
+def test_load_tasks_rejects_invalid_tables(tasks, message):
+    with pytest.raises(ValueError, match=message):
+        load_tasks({"tasks": tasks})
+
+def test_upstream_dependencies_may_repeat_the_task():
+    # ^build on build is how a build waits for its dependencies' builds.
+    assert load_tasks({"tasks": {"build": {"command": "x", "depends": ["^build"]}}})["build"].depends == ["^build"]
+
+def test_expand_pipeline_builds_project_task_dag(make_project):
+    lib = make_project("lib")
+    app = make_project("app", deps=["LIB", "requests"])
+    nodes, owners = expand_pipeline("test", [app], [lib, app], load_tasks(TASKS))
+
+    deps = {node.name: node.dependencies for node in nodes}
+    assert deps == {
+        "app:test": ["lib:build", "app:lint"],
+        "lib:build": [],
+        "app:lint": [],
+    }
+    assert [node.name for node in nodes][0] == "app:test"
+    assert owners["lib:build"] == (lib, load_tasks(TASKS)["build"])
+    assert all(node.path == owners[node.name][0].path for node in nodes)
+
+def test_expand_pipeline_rejects_unknown_task():
+    with pytest.raises(ValueError, match="Unknown task 'deploy'"):
+        expand_pipeline("deploy", [], [], load_tasks(TASKS))
+
+@pytest.mark.parametrize("backend", ["thread", "asyncio", "select"])
+def test_nodes_start_once_their_own_dependencies_finish(tmp_path, backend, make_project):
+    # lib -> app chain and an independent slow project: app's tests must only
+    # wait for lib's build and app's lint, not for slow:lint.
+    log = tmp_path / "log"
+    tasks = load_tasks({"tasks": {
+        "build": {"command": "x", "depends": ["^build"]},
+        "lint": {"command": "x"},
+        "test": {"command": "x", "depends": ["^build", "lint"]},
+    }})
+    lib, app, slow = make_project("lib", path=tmp_path), make_project("app", ["lib"], tmp_path), make_project("slow", path=tmp_path)
+    nodes, _ = expand_pipeline("test", [lib, app, slow], [lib, app, slow], tasks)
+
+    def provider(node):
+        delay = 2 if node.name == "slow:lint" else 0
+        return [sys.executable, "-c", f"import time; time.sleep({delay}); open({str(log)!r}, 'a').write({node.name!r} + '\\n')"]
+
+    results = execute_in_parallel(nodes, provider, max_workers=3, backend=backend)
+
+    assert all(r["success"] for r in results)
+    order = log.read_text().split()
+    assert order.index("lib:lint") < order.index("lib:test")
+    assert order.index("app:lint") < order.index("app:test")
+    assert order.index("app:test") < order.index("slow:lint")
+
+@pytest.mark.parametrize("backend", ["thread", "asyncio", "select"])
+def test_failed_dependency_skips_dependents_transitively(tmp_path, backend, make_project):
+    a = make_project("a", path=tmp_path)
+    b = make_project("b", ["a"], tmp_path)
+    c = make_project("c", ["b"], tmp_path)
+    other = make_project("other", path=tmp_path)
+
+    def provider(p):
+        return [sys.executable, "-c", f"raise SystemExit({p.name == 'a'})"]
+
+    results = execute_in_parallel([a, b, c, other], provider, max_workers=2, backend=backend, skip_failed_dependencies=True)
+
+    by_name = {r["name"]: r for r in results}
+    assert not by_name["a"]["success"] and not by_name["a"]["skipped"]
+    assert by_name["b"]["skipped"] and "dependency failed: a" in by_name["b"]["stdout"]
+    assert by_name["c"]["skipped"] and failure_label(by_name["c"], "FAILED") == "SKIPPED"
+    assert by_name["other"]["success"]
+
+def _workspace(tmp_path):
+    for name, deps in (("lib", []), ("app", ["lib"])):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "pyproject.toml").write_text(
+            f'[project]\nname="{name}"\nversion="1.0.0"\ndependencies={deps!r}\n'.replace("'", '"')
+        )
+
+def _args(tmp_path, task, **overrides):
+    config = {"tasks": {
+        "build": {"command": f"{sys.executable} -c \"open('built', 'w')\""},
+        "test": {"command": f"{sys.executable} -c \"import os; assert os.path.exists('built')\"", "depends": ["build", "^build"]},
+    }}
+    values = dict(path=str(tmp_path), task=task, project_name="all", fail_fast=False, parallel=False, jobs=None,
+                  config=config, no_index=True, since=None, affected=None, shard=None, trace=None, timeout=None)
+    values.update(overrides)
+    return Namespace(**values)
+
+def test_pipeline_command_runs_the_expanded_dag(tmp_path):
+    _workspace(tmp_path)
+    console = MagicMock()
+    pipeline_command.execute(_args(tmp_path, "test", project_name="app"), console)
+
+    assert (tmp_path / "app" / "built").exists() and (tmp_path / "lib" / "built").exists()
+    printed = " ".join(str(c.args[0]) for c in console.print.call_args_list if c.args)
+    assert "3 tasks across 2 projects" in printed
+    assert "3 succeeded" in printed
+
+def test_pipeline_command_rejects_unknown_task(tmp_path):
+    _workspace(tmp_path)
+    console = MagicMock()
+    with pytest.raises(SystemExit):
+        pipeline_command.execute(_args(tmp_path, "deploy"), console)
+    assert "Defined tasks: build, test" in console.print.call_args[0][0]
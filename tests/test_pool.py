@@ -0,0 +1,48 @@
+import threading
+import time
+from argparse import Namespace
+
+import pytest
+
+from relm.pool import map_bounded, workers_for
+
+def test_map_bounded_keeps_input_order():
+    def work(i):
+        time.sleep(0.01 * (5 - i))
+        return i * 10
+
+    assert map_bounded(work, range(5), max_workers=5) == [0, 10, 20, 30, 40]
+
+def test_map_bounded_single_worker_runs_inline():
+    threads = map_bounded(lambda _: threading.current_thread(), range(3), max_workers=1)
+    assert set(threads) == {threading.current_thread()}
+
+def test_map_bounded_limits_concurrency():
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def work(_):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+
+    map_bounded(work, range(12), max_workers=3)
+    assert peak[0] <= 3
+
+def test_map_bounded_propagates_errors():
+    def work(i):
+        if i == 2:
+            raise ValueError("boom")
+        return i
+
+    with pytest.raises(ValueError):
+        map_bounded(work, range(4), max_workers=2)
+
+def test_workers_for():
+    assert workers_for(Namespace()) == 1
+    assert workers_for(Namespace(parallel=False, jobs=8)) == 1
+    assert workers_for(Namespace(parallel=True, jobs=8)) == 8
+    assert workers_for(Namespace(parallel=True, jobs=None)) > 1
@@ -0,0 +1,72 @@
+import sys
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from relm.core import Project
+from relm.runner import (
+    USAGE_KEYS, child_usage, execute_in_parallel, run_project_command_tail,
+    run_project_command_tail_async, usage_cells,
+)
+
+posix_only = pytest.mark.skipif(not hasattr(__import__("os"), "wait4"), reason="needs os.wait4")
+
+# Burns ~0.2s of CPU and touches ~64 MB so both show up clearly in rusage.
+HUNGRY = "import time\nb = bytearray(64 << 20)\nb[::4096] = b'x' * len(b[::4096])\nt = time.process_time()\nwhile time.process_time() - t < 0.2: pass"
+
+@posix_only
+def test_thread_tail_reports_cpu_and_peak_rss(tmp_path, python_command):
+    result = run_project_command_tail(tmp_path, python_command(HUNGRY))
+    assert result["returncode"] == 0
+    assert result["cpu_user"] + result["cpu_sys"] >= 0.15
+    assert result["max_rss"] >= 64 << 20
+
+@posix_only
+async def test_async_tail_reports_cpu_and_peak_rss(tmp_path, python_command):
+    result = await run_project_command_tail_async(tmp_path, python_command(HUNGRY))
+    assert result["returncode"] == 0
+    assert result["cpu_user"] + result["cpu_sys"] >= 0.15
+    assert result["max_rss"] >= 64 << 20
+
+@posix_only
+def test_usage_covers_grandchildren_waited_for_by_the_shell(tmp_path):
+    script = tmp_path / "hungry.py"
+    script.write_text(HUNGRY)
+    result = run_project_command_tail(tmp_path, f"{sys.executable} {script}; true")
+    assert result["cpu_user"] + result["cpu_sys"] >= 0.15
+
+@posix_only
+@pytest.mark.parametrize("backend", ["thread", "asyncio", "select"])
+def test_execute_in_parallel_carries_usage(tmp_path, backend, python_command):
+    project = Project(name="p", version="1.0", path=tmp_path, dependencies=[])
+    [result] = execute_in_parallel([project], lambda p: python_command("pass"), backend=backend)
+    assert all(result[key] is not None for key in USAGE_KEYS)
+
+def test_usage_cells_formats_and_marks_unknown_values():
+    assert usage_cells({"cpu_user": 1.234, "cpu_sys": 0.5, "max_rss": 3 << 20}) == ["1.23s", "0.50s", "3.0 MB"]
+    assert usage_cells({"cached": True}) == ["-", "-", "-"]
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs the resource module")
+def test_child_usage_measures_sequential_subprocess_run(python_command):
+    import subprocess
+    with child_usage() as usage:
+        subprocess.run(python_command(HUNGRY), check=True)
+    assert usage["cpu_user"] + usage["cpu_sys"] >= 0.15
+
+def test_run_summary_shows_usage_columns_with_resources(tmp_path):
+    from relm.commands import run_command
+    project = Project(name="p", version="1.0", path=tmp_path)
+    args = Namespace(path=str(tmp_path), project_name="all", command_string="true", fail_fast=False,
+                     parallel=False, from_root=False, resources=True)
+    console = MagicMock()
+    result = {"returncode": 0, "stdout": "", "stderr": "", "cached": False,
+              "cpu_user": 0.25, "cpu_sys": 0.05, "max_rss": 10 << 20}
+
+    with patch("relm.commands.run_command.find_projects", return_value=[project]), \
+         patch("relm.commands.run_command.run_with_cache", return_value=result):
+        run_command.execute(args, console)
+
+    table = next(c.args[0] for c in console.print.call_args_list if c.args and hasattr(c.args[0], "columns"))
+    assert [c.header for c in table.columns][-3:] == ["CPU user", "CPU sys", "Max RSS"]
+    assert [list(c.cells)[0] for c in table.columns][-3:] == ["0.25s", "0.05s", "10.0 MB"]
@@ -8,7 +8,8 @@ from relm.core import Project
 def test_run_project_command_success():
     with patch("subprocess.Popen") as mock_popen:
         mock_process = MagicMock()
-        mock_process.poll.return_value = 0
+        mock_process.returncode = 0
+        mock_process.wait.return_value = 0
         mock_process.stdout.readline.return_value = ""
         mock_popen.return_value = mock_process
         
@@ -18,7 +19,8 @@ def test_run_project_command_success():
 def test_run_project_command_failure_exit_code():
     with patch("subprocess.Popen") as mock_popen:
         mock_process = MagicMock()
-        mock_process.poll.return_value = 1
+        mock_process.returncode = 1
+        mock_process.wait.return_value = 1
         mock_process.stdout.readline.return_value = ""
         mock_popen.return_value = mock_process
         
@@ -88,10 +90,66 @@ def test_run_project_command_tail_success():
         mock_process = MagicMock()
         # readline returns one line then empty string to end loop
         mock_process.stdout.readline.side_effect = ["line1\n", ""]
-        # poll returns 0 (finished)
-        mock_process.poll.return_value = 0
+        # the process has already exited with 0
+        mock_process.returncode = 0
+        mock_process.wait.return_value = 0
         mock_popen.return_value = mock_process
         
         res = run_project_command_tail(Path("/tmp"), "echo ok")
         assert res["returncode"] == 0
         assert "line1" in res["stdout"]
+
+def test_dependency_scheduler_releases_dependents_after_last_dependency():
+    from relm.runner import DependencyScheduler
+    p1 = Project(name="p1", version="1.0", path=Path("/p1"), dependencies=[])
+    p2 = Project(name="p2", version="1.0", path=Path("/p2"), dependencies=[])
+    p3 = Project(name="p3", version="1.0", path=Path("/p3"), dependencies=["p1", "p2", "requests"])
+    scheduler = DependencyScheduler([p1, p2, p3])
+
+    assert scheduler.pop_ready() == "p1"
+    assert scheduler.pop_ready() == "p2"
+    assert scheduler.pop_ready() is None
+
+    scheduler.complete("p1")
+    assert scheduler.pop_ready() is None
+    scheduler.complete("p2")
+    assert scheduler.pop_ready() == "p3"
+    assert not scheduler.has_unreleased()
+
+def test_dependency_scheduler_breaks_cycles_in_list_order():
+    from relm.runner import DependencyScheduler
+    p1 = Project(name="p1", version="1.0", path=Path("/p1"), dependencies=["p2"])
+    p2 = Project(name="p2", version="1.0", path=Path("/p2"), dependencies=["p1"])
+    scheduler = DependencyScheduler([p1, p2])
+
+    assert scheduler.pop_ready() is None
+    assert scheduler.break_cycle() == "p1"
+    scheduler.complete("p1")
+    assert scheduler.pop_ready() == "p2"
+
+def test_execute_in_parallel_runs_dependencies_first():
+    p1 = Project(name="p1", version="1.0", path=Path("/p1"), dependencies=[])
+    p2 = Project(name="p2", version="1.0", path=Path("/p2"), dependencies=["p1"])
+    p3 = Project(name="p3", version="1.0", path=Path("/p3"), dependencies=["p2"])
+    started = []
+
+    def fake_run(path, cmd, **kwargs):
+        started.append(path)
+        return {"returncode": 0, "stdout": "", "stderr": ""}
+
+    with patch("relm.runner.run_project_command_tail", side_effect=fake_run):
+        results = execute_in_parallel([p3, p2, p1], lambda p: ["echo"], max_workers=4)
+
+    assert started == [Path("/p1"), Path("/p2"), Path("/p3")]
+    assert all(r["success"] for r in results)
+
+def test_execute_in_parallel_provider_error_is_reported_as_failure():
+    p1 = Project(name="p1", version="1.0", path=Path("/p1"), dependencies=[])
+
+    def provider(p):
+        raise RuntimeError("no command")
+
+    results = execute_in_parallel([p1], provider)
+
+    assert results[0]["success"] is False
+    assert "no command" in results[0]["stdout"]
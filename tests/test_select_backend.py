@@ -0,0 +1,125 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from relm.cache import TaskCache
+from relm.core import Project
+from relm.runner import USAGE_KEYS, OutputMultiplexer, execute_in_parallel, run_project_command_tail
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="pipes cannot be selected on Windows")
+
+def _drain(multiplexer):
+    results = {}
+    while len(multiplexer):
+        results.update(multiplexer.poll())
+    return results
+
+def test_multiplexed_tail_matches_thread_tail(tmp_path, python_command):
+    cmd = python_command("import sys\nfor i in range(200): print('row', i)\nsys.stdout.write('last')\nsys.exit(3)")
+    expected = run_project_command_tail(tmp_path, cmd, tail_lines=5)
+
+    multiplexer = OutputMultiplexer(tail_lines=5, chunk_size=7)
+    try:
+        multiplexer.start("p", cmd, tmp_path)
+        result = _drain(multiplexer)["p"]
+    finally:
+        multiplexer.close()
+
+    assert set(result) == set(expected)
+    assert result["cpu_user"] is not None
+    for key in USAGE_KEYS:
+        del result[key], expected[key]
+    assert result == expected
+
+def test_multiplexer_interleaves_tasks_and_applies_timeouts(tmp_path, python_command):
+    multiplexer = OutputMultiplexer(grace=0.5)
+    try:
+        multiplexer.start("slow", "sleep 30", tmp_path, timeout=0.3)
+        multiplexer.start("shell", "echo hi && exit 2", tmp_path)
+        multiplexer.start("big", python_command("import sys\nsys.stdout.write('x' * 5_000_000 + '\\nend\\n')"), tmp_path)
+        start = time.monotonic()
+        results = _drain(multiplexer)
+    finally:
+        multiplexer.close()
+
+    assert time.monotonic() - start < 5
+    assert (results["shell"]["returncode"], results["shell"]["stdout"]) == (2, "hi")
+    assert results["big"]["stdout"].endswith("\nend")
+    assert results["slow"]["timed_out"] and "timed out after 0.3s" in results["slow"]["stdout"]
+
+def test_multiplexer_reaps_children_that_outlive_their_output(tmp_path, python_command):
+    multiplexer = OutputMultiplexer()
+    try:
+        multiplexer.start("p", python_command("import os, time\nprint('bye', flush=True)\nos.close(1)\ntime.sleep(0.2)"), tmp_path)
+        results = _drain(multiplexer)
+    finally:
+        multiplexer.close()
+    assert results["p"]["returncode"] == 0 and results["p"]["stdout"] == "bye"
+
+def test_execute_in_parallel_select_backend(tmp_path, python_command):
+    log = tmp_path / "order.log"
+    lib = Project(name="lib", version="1.0", path=tmp_path, dependencies=[])
+    app = Project(name="app", version="1.0", path=tmp_path, dependencies=["lib"])
+    bad = Project(name="bad", version="1.0", path=tmp_path, dependencies=[])
+    missing = Project(name="missing", version="1.0", path=tmp_path / "missing", dependencies=[])
+
+    def provider(p):
+        if p.name == "bad":
+            return python_command("import sys; print('broken'); sys.exit(1)")
+        return python_command(f"open({str(log)!r}, 'a').write({p.name!r} + '\\n')")
+
+    results = execute_in_parallel([app, lib, bad, missing], provider, max_workers=4, backend="select")
+
+    by_name = {r["name"]: r for r in results}
+    assert by_name["lib"]["success"] and by_name["app"]["success"]
+    assert by_name["bad"]["stdout"] == "broken"
+    assert by_name["missing"]["stdout"].startswith("Error:")
+    assert log.read_text().splitlines() == ["lib", "app"]
+
+def test_select_backend_stores_and_replays_cache(tmp_path, python_command):
+    project = Project(name="p", version="1.0", path=tmp_path, dependencies=[])
+    (tmp_path / "input.txt").write_text("data")
+    cache = TaskCache(tmp_path, [project])
+    cmd = python_command("print('computed')")
+
+    [first] = execute_in_parallel([project], lambda p: cmd, backend="select", task_cache=cache)
+    [second] = execute_in_parallel([project], lambda p: cmd, backend="select", task_cache=cache)
+
+    assert not first["cached"] and second["cached"]
+    assert second["stdout"] == "computed"
+
+def test_multiplexer_wake_interrupts_poll(tmp_path):
+    multiplexer = OutputMultiplexer()
+    try:
+        multiplexer.start("slow", "sleep 30", tmp_path)
+        threading.Timer(0.1, multiplexer.wake).start()
+        start = time.monotonic()
+        assert multiplexer.poll() == []
+        assert time.monotonic() - start < 5
+    finally:
+        multiplexer.close()
+
+def test_select_backend_looks_up_cache_keys_off_the_loop_thread(tmp_path, monkeypatch, python_command):
+    from relm import runner
+
+    projects = [Project(name=name, version="1.0", path=tmp_path, dependencies=[]) for name in ("big", "slow")]
+    cache = TaskCache(tmp_path, projects)
+    lookup_threads = []
+    real_lookup = runner._cache_lookup
+
+    def slow_lookup(task_cache, project, command, cwd):
+        lookup_threads.append(threading.current_thread())
+        if project.name == "slow":
+            time.sleep(0.5)
+        return real_lookup(task_cache, project, command, cwd)
+
+    monkeypatch.setattr(runner, "_cache_lookup", slow_lookup)
+    # "big" fills its pipe many times over while "slow" is still being looked up
+    cmd = python_command("import sys\nsys.stdout.write('x' * 2_000_000 + '\\ndone\\n')")
+
+    results = execute_in_parallel(projects, lambda p: cmd, max_workers=2, backend="select", task_cache=cache)
+
+    assert threading.main_thread() not in lookup_threads
+    assert all(r["success"] and r["stdout"].endswith("done") for r in results)
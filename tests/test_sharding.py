@@ -0,0 +1,121 @@
+import argparse
+import shutil
+import subprocess
+from argparse import Namespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from relm.history import DurationHistory
+from relm.sharding import (
+    ShardSpec, add_shard_arguments, apply_shard, dependency_groups, file_weights, parse_shard,
+    partition, select_shard, shard_weights,
+)
+
+def test_parse_shard():
+    assert parse_shard("3/8") == ShardSpec(3, 8)
+    for bad in ("0/4", "5/4", "1/0", "x/2", "1", "1/2/3"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(bad)
+
+def test_shard_arguments_parse():
+    parser = argparse.ArgumentParser()
+    add_shard_arguments(parser)
+    args = parser.parse_args(["--shard", "2/4", "--shard-closure"])
+    assert (args.shard, args.shard_by, args.shard_closure) == (ShardSpec(2, 4), "files", True)
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--shard", "9/4"])
+
+def test_partition_is_lpt_balanced_and_deterministic():
+    weights = [7.0, 5.0, 4.0, 3.0, 3.0, 2.0]
+    bins = partition(weights, 2)
+    assert sorted(sum(weights[i] for i in b) for b in bins) == [12.0, 12.0]
+    assert bins == partition(list(weights), 2)
+    assert sorted(i for b in bins for i in b) == list(range(len(weights)))
+    assert partition([1.0], 3) == [[0], [], []]
+
+def test_shards_cover_all_projects_once_in_input_order(make_project):
+    projects = [make_project(f"p{i}") for i in range(10)]
+    weights = {p.name: float(i + 1) for i, p in enumerate(projects)}
+    shards = [select_shard(projects, ShardSpec(i, 3), weights) for i in (1, 2, 3)]
+
+    names = [p.name for shard in shards for p in shard]
+    assert sorted(names) == sorted(p.name for p in projects)
+    for shard in shards:
+        assert shard == [p for p in projects if p in shard]
+    loads = [sum(weights[p.name] for p in shard) for shard in shards]
+    assert max(loads) - min(loads) <= 1.0
+
+def test_closure_keeps_dependency_groups_together(make_project):
+    lib = make_project("lib")
+    app = make_project("app", deps=["lib"])
+    cli = make_project("cli", deps=["LIB"])
+    solo = make_project("solo")
+    projects = [lib, app, cli, solo]
+    assert [[p.name for p in g] for g in dependency_groups(projects)] == [["lib", "app", "cli"], ["solo"]]
+
+    weights = {"lib": 1.0, "app": 1.0, "cli": 1.0, "solo": 1.0}
+    assert [p.name for p in select_shard(projects, ShardSpec(1, 2), weights)] == ["lib", "cli"]
+    assert [p.name for p in select_shard(projects, ShardSpec(1, 2), weights, closure=True)] == ["lib", "app", "cli"]
+    assert [p.name for p in select_shard(projects, ShardSpec(2, 2), weights, closure=True)] == ["solo"]
+
+def test_weights_use_file_counts_unless_history_is_requested(tmp_path, make_project):
+    for name, files in (("a", 3), ("b", 1)):
+        (tmp_path / name).mkdir()
+        for i in range(files):
+            (tmp_path / name / f"f{i}.py").write_text("")
+    projects = [make_project("a", path=tmp_path / "a"), make_project("b", path=tmp_path / "b"), make_project("c", path=tmp_path / "c")]
+    history = DurationHistory(tmp_path, "pytest:")
+
+    assert shard_weights(projects, history, "history") == ({"a": 3.0, "b": 1.0, "c": 1.0}, "files")
+
+    history.record("a", 10.0)
+    history.record("b", 20.0)
+    history.save()
+    # Local history differs between machines, so it is never used by default
+    assert shard_weights(projects, history) == ({"a": 3.0, "b": 1.0, "c": 1.0}, "files")
+    assert shard_weights(projects, history, "history") == ({"a": 10.0, "b": 20.0, "c": 15.0}, "history")
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+def test_file_weights_count_tracked_files_only(tmp_path, make_project):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    for name in ("a/one.py", "a/two.py", "b/one.py"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("")
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    (tmp_path / "b" / "venv").mkdir()
+    for i in range(10):
+        (tmp_path / "b" / "venv" / f"artifact{i}.so").write_text("")
+
+    projects = [make_project("a", path=tmp_path / "a"), make_project("b", path=tmp_path / "b"), make_project("nested", path=tmp_path / "a")]
+
+    assert file_weights(projects) == {"a": 2.0, "b": 1.0, "nested": 2.0}
+
+def test_apply_shard_reads_a_shared_history_file(tmp_path, make_project):
+    shared = DurationHistory(tmp_path, "run:x", file_path=tmp_path / "shared.db")
+    shared.record("a", 1.0)
+    shared.record("b", 9.0)
+    shared.record("c", 1.0)
+    shared.save()
+    projects = [make_project("a"), make_project("b"), make_project("c")]
+    args = Namespace(shard=ShardSpec(1, 2), shard_by="files", shard_history=str(tmp_path / "shared.db"), shard_closure=False)
+
+    selected = apply_shard(args, projects, DurationHistory(tmp_path, "run:x"), MagicMock())
+
+    assert [p.name for p in selected] == ["b"]
+    assert not (tmp_path / ".relm").exists()
+
+def test_apply_shard_without_flag_is_a_no_op(make_project):
+    projects = [make_project("a")]
+    assert apply_shard(Namespace(), projects, None, MagicMock()) is projects
+
+def test_apply_shard_warns_when_history_requested_but_missing(tmp_path, make_project):
+    projects = [make_project("a", path=tmp_path), make_project("b", path=tmp_path)]
+    console = MagicMock()
+    args = Namespace(shard=ShardSpec(2, 2), shard_by="history", shard_closure=False)
+    selected = apply_shard(args, projects, DurationHistory(tmp_path, "run:x"), console)
+
+    assert [p.name for p in selected] == ["b"]
+    printed = " ".join(str(c.args[0]) for c in console.print.call_args_list)
+    assert "sharding by file count" in printed
+    assert "Shard 2/2: 1 of 2 projects" in printed
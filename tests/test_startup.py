@@ -0,0 +1,84 @@
+import argparse
+import subprocess
+import sys
+
+import pytest
+
+from relm.commands import COMMANDS, load_command
+
+# Modules whose import dominates startup; `import relm.main` must defer them.
+DEFERRED_MODULES = ("rich", "tomllib", "relm.config", "relm.core", "relm.commands.")
+
+def _run(code):
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+def _imported_modules(importtime_stderr):
+    modules = {}
+    for line in importtime_stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+@pytest.mark.parametrize("argv", [["--version"], ["--path", "x", "--jobs=4", "-v"]])
+def test_version_fast_path_does_not_import_rich_or_commands(argv):
+    result = _run(
+        f"import sys; from relm.main import main; sys.argv = ['relm'] + {argv!r}\n"
+        "try:\n    main()\nexcept SystemExit:\n    pass"
+    )
+    assert result.stdout.strip().startswith("relm ")
+    modules = _imported_modules(result.stderr)
+    assert "relm.main" in modules
+    assert not any(m == "rich" or m.startswith("rich.") for m in modules)
+    assert not any(m.startswith("relm.commands.") for m in modules)
+
+def test_main_module_import_defers_heavy_modules():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, relm.main\nprint('\\n'.join(sorted(sys.modules)))"],
+        capture_output=True, text=True, check=True
+    )
+    modules = result.stdout.split()
+    assert "relm.main" in modules
+    for deferred in DEFERRED_MODULES:
+        prefix = deferred if deferred.endswith(".") else deferred + "."
+        assert not [m for m in modules if m == deferred or m.startswith(prefix)], deferred
+
+def test_only_selected_command_is_imported():
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import sys; from relm import main as m\n"
+         "base = m._build_base_parser(); m._build_parser(base, 'gc')\n"
+         "print(sorted(n for n in sys.modules if n.startswith('relm.commands.')))"],
+        capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "['relm.commands.gc_command']"
+
+def test_registry_help_matches_command_modules():
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+    base_parser = argparse.ArgumentParser(add_help=False)
+    for name in COMMANDS:
+        load_command(name).register(subparsers, base_parser)
+
+    registered = {action.dest: action.help for action in subparsers._choices_actions}
+    assert registered == {name: spec.help for name, spec in COMMANDS.items()}
+
+def test_wants_version_scans_options_before_the_subcommand():
+    from relm.main import _build_base_parser, _wants_version
+    base = _build_base_parser()
+    assert _wants_version(["--version"], base)
+    assert _wants_version(["--path", "x", "--parallel", "-v"], base)
+    assert _wants_version(["--pat", "x", "--vers"], base)
+    # "--version" here is the value of --path, then the subcommand starts
+    assert not _wants_version(["--path", "--version", "list"], base)
+    assert not _wants_version(["list", "--version"], base)
+    assert not _wants_version(["--", "--version"], base)
+    assert not _wants_version([], base)
+
+def test_wants_quiet_stops_at_separator():
+    from relm.main import _wants_quiet
+    assert _wants_quiet(["list", "--quiet"])
+    assert not _wants_quiet(["pytest", "--", "--quiet"])
+    assert not _wants_quiet(["list"])
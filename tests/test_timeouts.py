@@ -0,0 +1,128 @@
+import sys
+import time
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from relm.core import Project
+from relm.runner import (
+    CancelToken, execute_in_parallel, failure_label, resolve_timeout,
+    run_project_command_tail, run_project_command_tail_async,
+)
+
+posix_only = pytest.mark.skipif(not Path("/proc").exists(), reason="needs POSIX process groups and /proc")
+
+def _alive(pid):
+    # Orphans may linger as zombies until init reaps them; those count as dead.
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except FileNotFoundError:
+        return False
+    return stat.rsplit(")", 1)[1].split()[0] != "Z"
+
+def _wait_dead(pid, limit=3.0):
+    deadline = time.monotonic() + limit
+    while _alive(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return not _alive(pid)
+
+def _spawn_grandchild(pidfile):
+    return f"sleep 30 & echo $! > {pidfile}; wait"
+
+@posix_only
+def test_timeout_kills_whole_process_group(tmp_path):
+    pidfile = tmp_path / "pid"
+    start = time.monotonic()
+    result = run_project_command_tail(tmp_path, _spawn_grandchild(pidfile), timeout=0.5)
+
+    assert time.monotonic() - start < 5
+    assert result["timed_out"] and not result["cancelled"]
+    assert result["returncode"] != 0
+    assert result["stdout"].endswith("relm: timed out after 0.5s, process group terminated")
+    assert _wait_dead(int(pidfile.read_text()))
+
+@posix_only
+async def test_async_timeout_kills_whole_process_group(tmp_path):
+    pidfile = tmp_path / "pid"
+    result = await run_project_command_tail_async(tmp_path, _spawn_grandchild(pidfile), timeout=0.5)
+
+    assert result["timed_out"]
+    assert result["returncode"] != 0
+    assert _wait_dead(int(pidfile.read_text()))
+
+@posix_only
+def test_sigkill_follows_ignored_sigterm(tmp_path):
+    start = time.monotonic()
+    result = run_project_command_tail(tmp_path, "trap '' TERM; sleep 30", timeout=0.3, grace=0.3)
+    assert result["timed_out"]
+    assert time.monotonic() - start < 5
+
+def test_commands_within_timeout_are_untouched(tmp_path):
+    result = run_project_command_tail(tmp_path, "echo ok", timeout=10)
+    assert (result["returncode"], result["stdout"]) == (0, "ok")
+    assert not result["timed_out"] and not result["cancelled"]
+
+def test_cancel_token_kills_late_registrations_immediately():
+    token = CancelToken()
+    calls = []
+    token.register(lambda: calls.append("early"))
+    token.cancel()
+    token.register(lambda: calls.append("late"))
+    token.cancel()
+    assert calls == ["early", "late"]
+
+@posix_only
+@pytest.mark.parametrize("backend", ["thread", "asyncio", "select"])
+def test_fail_fast_cancels_running_siblings(tmp_path, backend):
+    broken = Project(name="broken", version="1.0", path=tmp_path, dependencies=[])
+    slow = Project(name="slow", version="1.0", path=tmp_path, dependencies=[])
+
+    def provider(p):
+        return "sleep 0.3; exit 1" if p.name == "broken" else "sleep 30"
+
+    start = time.monotonic()
+    results = execute_in_parallel([broken, slow], provider, max_workers=2, fail_fast=True, backend=backend)
+
+    assert time.monotonic() - start < 5
+    by_name = {r["name"]: r for r in results}
+    assert not by_name["broken"]["cancelled"] and not by_name["broken"]["success"]
+    assert by_name["slow"]["cancelled"] and not by_name["slow"]["success"]
+    assert failure_label(by_name["slow"], "FAILED") == "CANCELLED"
+    assert failure_label(by_name["broken"], "FAILED") == "FAILED"
+
+@posix_only
+@pytest.mark.parametrize("backend", ["thread", "asyncio", "select"])
+def test_execute_in_parallel_reports_timeouts(tmp_path, backend):
+    quick = Project(name="quick", version="1.0", path=tmp_path, dependencies=[])
+    hung = Project(name="hung", version="1.0", path=tmp_path, dependencies=[])
+
+    def provider(p):
+        return [sys.executable, "-c", "print('done')"] if p.name == "quick" else "sleep 30"
+
+    results = execute_in_parallel([quick, hung], provider, max_workers=2, backend=backend, timeout=0.5)
+
+    by_name = {r["name"]: r for r in results}
+    assert by_name["quick"]["success"] and not by_name["quick"]["timed_out"]
+    assert by_name["hung"]["timed_out"]
+    assert failure_label(by_name["hung"], "FAILED") == "TIMEOUT"
+
+def test_resolve_timeout_precedence():
+    config = {"timeouts": {"default": 900, "pytest": 60}}
+    assert resolve_timeout(Namespace(timeout=5.0), config, "pytest") == 5.0
+    assert resolve_timeout(Namespace(timeout=None), config, "pytest") == 60.0
+    assert resolve_timeout(Namespace(timeout=None), config, "run") == 900.0
+    assert resolve_timeout(Namespace(), {}, "run") is None
+    assert resolve_timeout(Namespace(timeout=0), config, "run") is None
+
+@posix_only
+async def test_cancelling_async_task_kills_process_group(tmp_path):
+    import asyncio
+    pidfile = tmp_path / "pid"
+    task = asyncio.ensure_future(run_project_command_tail_async(tmp_path, _spawn_grandchild(pidfile)))
+    while not pidfile.exists() or not pidfile.read_text().strip():
+        await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert _wait_dead(int(pidfile.read_text()))
@@ -0,0 +1,84 @@
+import json
+import sys
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from relm.core import Project
+from relm.runner import execute_in_parallel
+from relm.trace import MAIN_LANE, Tracer, maybe_span
+
+def _spans(trace, cat):
+    return {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X" and e["cat"] == cat}
+
+def _lane_names(trace):
+    return {e["tid"]: e["args"]["name"] for e in trace["traceEvents"] if e["name"] == "thread_name"}
+
+def test_tracer_records_spans_and_writes_chrome_trace(tmp_path):
+    tracer = Tracer()
+    with tracer.span("discovery") as args:
+        args["projects"] = 3
+    tracer.complete("build", 10.0, 5.0, tid=2, cat="task")
+    tracer.counter("tasks", {"running": 1})
+
+    out = tmp_path / "trace.json"
+    tracer.write(out)
+    trace = json.loads(out.read_text())
+
+    assert trace["displayTimeUnit"] == "ms"
+    assert _spans(trace, "relm")["discovery"]["args"] == {"projects": 3}
+    assert _spans(trace, "task")["build"]["dur"] == 0.0
+    assert _lane_names(trace) == {MAIN_LANE: "relm", 2: "worker 2"}
+    timestamps = [e["ts"] for e in trace["traceEvents"] if "ts" in e]
+    assert timestamps == sorted(timestamps)
+
+def test_maybe_span_is_a_no_op_without_tracer():
+    with maybe_span(None, "discovery") as args:
+        args["projects"] = 1
+
+@pytest.mark.parametrize("backend", ["thread", "asyncio"])
+def test_execute_in_parallel_traces_worker_lanes_and_queue_waits(tmp_path, backend):
+    lib = Project(name="lib", version="1.0", path=tmp_path, dependencies=[])
+    app = Project(name="app", version="1.0", path=tmp_path, dependencies=["lib"])
+    tool = Project(name="tool", version="1.0", path=tmp_path, dependencies=[])
+    extra = Project(name="extra", version="1.0", path=tmp_path, dependencies=[])
+    tracer = Tracer()
+
+    execute_in_parallel([lib, app, tool, extra], lambda p: [sys.executable, "-c", "pass"],
+                        max_workers=2, backend=backend, tracer=tracer)
+
+    trace = tracer.to_json()
+    tasks = _spans(trace, "task")
+    assert set(tasks) == {"lib", "app", "tool", "extra"}
+    assert {e["tid"] for e in tasks.values()} <= {1, 2}
+    assert _spans(trace, "relm")["execute"]["args"] == {"backend": backend, "max_workers": 2}
+
+    # A worker lane never runs two tasks at once
+    for tid in (1, 2):
+        lane = sorted((e["ts"], e["ts"] + e["dur"]) for e in tasks.values() if e["tid"] == tid)
+        assert all(end <= next_start for (_, end), (next_start, _) in zip(lane, lane[1:]))
+
+    # app waits in the queue only from the moment lib finished
+    queued = {e["id"]: e for e in trace["traceEvents"] if e["ph"] == "b" and e["cat"] == "queue"}
+    assert set(queued) == {"lib", "app", "tool", "extra"}
+    assert queued["app"]["ts"] >= tasks["lib"]["ts"] + tasks["lib"]["dur"]
+    assert queued["app"]["args"] == {"dependencies": ["lib"]}
+    assert any(e["ph"] == "C" and e["name"] == "tasks" for e in trace["traceEvents"])
+
+def test_run_command_writes_trace_with_phases(tmp_path):
+    from relm.commands import run_command
+    project = Project(name="p", version="1.0", path=tmp_path)
+    out = tmp_path / "out.json"
+    args = Namespace(path=str(tmp_path), project_name="all", command_string="true", fail_fast=False,
+                     parallel=False, from_root=False, trace=str(out))
+    result = {"returncode": 0, "stdout": "", "stderr": "", "cached": False}
+
+    with patch("relm.commands.run_command.find_projects", return_value=[project]), \
+         patch("relm.commands.run_command.run_with_cache", return_value=result):
+        run_command.execute(args, MagicMock())
+
+    trace = json.loads(out.read_text())
+    assert {"discovery", "sort", "select"} <= set(_spans(trace, "relm"))
+    assert _spans(trace, "task")["p"]["tid"] == 1
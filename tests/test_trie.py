@@ -0,0 +1,23 @@
+from relm.trie import PathTrie
+
+def test_path_trie_returns_all_ancestor_values():
+    trie = PathTrie()
+    trie.insert((), "root")
+    trie.insert(("packages", "lib"), "lib")
+    trie.insert(("packages", "lib", "plugins", "extra"), "extra")
+
+    assert trie.prefixes(["packages", "lib", "plugins", "extra", "x.py"]) == ["root", "lib", "extra"]
+    assert trie.prefixes(["packages", "libfoo", "x.py"]) == ["root"]
+    assert trie.prefixes(["docs", "index.md"]) == ["root"]
+
+def test_path_trie_returns_values_at_or_below_a_directory():
+    trie = PathTrie()
+    trie.insert((), "root")
+    trie.insert(("packages", "lib"), "lib")
+    trie.insert(("packages", "lib", "plugins", "extra"), "extra")
+    trie.insert(("apps", "app"), "app")
+
+    assert sorted(trie.below(["packages"])) == ["extra", "lib"]
+    assert trie.below(["packages", "lib", "plugins"]) == ["extra"]
+    assert trie.below(["packages", "libfoo"]) == []
+    assert sorted(trie.below([])) == ["app", "extra", "lib", "root"]
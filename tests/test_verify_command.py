@@ -27,7 +27,7 @@ class TestVerifyCommand(unittest.TestCase):
         execute(self.args, self.console)
 
         # Check find_projects called with correct path
-        mock_find.assert_called_with(self.root_path, recursive=False, max_depth=2)
+        mock_find.assert_called_with(self.root_path, recursive=False, max_depth=2, discovery="auto", use_cache=True)
 
         # Check verify calls
         self.assertEqual(mock_verify.call_count, 2)
@@ -85,5 +85,26 @@ class TestVerifyCommand(unittest.TestCase):
          # Check that no red failure message appeared
          self.assertFalse(any("Failed:" in str(c) for c in calls))
 
+    @patch("relm.commands.verify_command.find_projects")
+    @patch("relm.commands.verify_command.verify_project_release")
+    def test_verify_parallel_keeps_project_order(self, mock_verify, mock_find):
+        import time
+        mock_find.return_value = [self.project1, self.project2]
+
+        def slow_first(project):
+            if project is self.project1:
+                time.sleep(0.05)
+            return True, f"{project.name} ok"
+
+        mock_verify.side_effect = slow_first
+        self.args.parallel = True
+        self.args.jobs = 2
+
+        execute(self.args, self.console)
+
+        table = next(c.args[0] for c in self.console.print.call_args_list if hasattr(c.args[0], "columns"))
+        self.assertEqual(list(table.columns[0].cells), ["proj1", "proj2"])
+        self.assertEqual(list(table.columns[3].cells), ["proj1 ok", "proj2 ok"])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+from relm.core import Project, find_projects
+from relm.workspace import Workspace, normalize_name
+
+def _workspace(tmp_path):
+    projects = [
+        Project("app", "1.0", tmp_path / "apps" / "app"),
+        Project("My_Lib.Core", "1.0", tmp_path / "packages" / "core"),
+        Project("my-lib-core", "1.0", tmp_path / "vendor" / "core"),
+        Project("nested", "1.0", tmp_path / "packages" / "core" / "plugins" / "nested"),
+        Project("root", "1.0", tmp_path),
+    ]
+    for p in projects:
+        p.path.mkdir(parents=True, exist_ok=True)
+    return Workspace(projects)
+
+def test_normalize_name():
+    assert normalize_name("My_Lib.Core") == "my-lib-core"
+    assert normalize_name("a--b__c") == "a-b-c"
+
+def test_by_name_normalizes_and_prefers_exact_match(tmp_path):
+    workspace = _workspace(tmp_path)
+
+    assert workspace.by_name("my-lib-core").path == tmp_path / "vendor" / "core"
+    assert workspace.by_name("My_Lib.Core").path == tmp_path / "packages" / "core"
+    assert workspace.by_name("APP").name == "app"
+    assert workspace.by_name("missing") is None
+
+def test_path_lookups(tmp_path):
+    workspace = _workspace(tmp_path)
+
+    assert workspace.by_path(tmp_path / "apps" / ".." / "apps" / "app").name == "app"
+    assert workspace.by_path(tmp_path / "apps") is None
+    assert [p.name for p in workspace.under(tmp_path / "packages")] == ["My_Lib.Core", "nested"]
+    assert [p.name for p in workspace.under(tmp_path / "packages" / "core" / "plugins")] == ["nested"]
+    assert workspace.under(tmp_path / "nowhere") == []
+    assert len(workspace.under(tmp_path)) == 5
+    assert "root" not in {p.name for p in workspace.without(workspace, tmp_path)}
+
+def test_find_projects_returns_a_workspace(tmp_path):
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "pyproject.toml").write_text('[project]\nname = "my_lib"\nversion = "1.0"\n')
+
+    projects = find_projects(tmp_path)
+
+    assert isinstance(projects, Workspace)
+    assert projects == [projects.by_name("my-lib")]
+    assert Workspace.of(projects) is projects
+    assert Workspace.of([]) == []
+
+def test_commands_target_by_normalized_name(tmp_path, mocker):
+    from argparse import Namespace
+    from relm.commands import status_command
+
+    workspace = _workspace(tmp_path)
+    mocker.patch("relm.commands.status_command.find_projects", return_value=list(workspace))
+    app_path = tmp_path / "apps" / "app"
+    mock_status = mocker.patch("relm.commands.status_command.batch_git_status", return_value={app_path: ("main", True)})
+    console = mocker.MagicMock()
+
+    status_command.execute(Namespace(path=str(tmp_path), project_name="APP"), console)
+
+    assert mock_status.call_args[0][0] == [app_path]